@@ -0,0 +1,13 @@
+"""
+pydbfi 벤치마크
+
+실서버 없이 MockDBFIServer(또는 소켓 없는 MockTransport)를 대상으로 요청/연속 조회/잔고 집계 경로를 측정한다.
+
+    python -m benchmarks                                  # 전체 실행, 결과를 JSON으로 출력
+    python -m benchmarks --quick --output result.json      # 짧게 실행하여 파일로 저장
+    python -m benchmarks --compare baseline.json --tolerance 0.2  # 기준 대비 20% 이상 느려지면 종료 코드 1
+
+개별 스크립트:
+    python benchmarks/auth_header.py   # 이전/현재 인증 헤더 생성 비용 비교
+    python benchmarks/import_time.py   # import 시간
+"""
@@ -0,0 +1,38 @@
+import argparse
+import json
+import sys
+
+from . import __doc__ as DOC
+from . import hot_paths  # noqa: F401  (벤치마크 등록)
+from .runner import BENCHMARKS, compare, dump, run
+
+
+def main():
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description=DOC, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("names", nargs="*", help=f"실행할 벤치마크 (기본: 전체). {', '.join(BENCHMARKS)}")
+    parser.add_argument("--quick", action="store_true", help="반복 횟수를 줄여 짧게 실행")
+    parser.add_argument("--output", "-o", default=None, help="결과 JSON 파일 (기본: 표준 출력)")
+    parser.add_argument("--compare", default=None, metavar="BASELINE", help="비교할 기준 결과 JSON 파일")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="회귀로 판단할 중앙값 증가 비율 (기본 0.2)")
+    args = parser.parse_args()
+
+    unknown = set(args.names) - set(BENCHMARKS)
+    if unknown:
+        parser.error(f"알 수 없는 벤치마크: {', '.join(sorted(unknown))}")
+
+    result = run(args.names, quick=args.quick)
+    exit_code = 0
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            report = compare(result, json.load(f), args.tolerance)
+        result["comparison"] = {"baseline": args.compare, "tolerance": args.tolerance, "results": report}
+        for name, item in report.items():
+            flag = "  회귀" if item["regression"] else ""
+            print(f"{name:<24} {item['baseline_us']:12.1f} -> {item['current_us']:12.1f} us  x{item['ratio']:.2f}{flag}", file=sys.stderr)
+        exit_code = 1 if any(item["regression"] for item in report.values()) else 0
+    dump(result, args.output)
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,66 @@
+"""
+OAuth.get_auth_header 호출당 비용 측정
+
+이전 구현(매 호출 UserAgent() 생성 및 전체 헤더 재구성)과 현재 구현을 비교한다.
+
+    python benchmarks/auth_header.py [반복 횟수]
+"""
+import random
+import sys
+import time
+import uuid
+from datetime import datetime, timedelta
+
+from pydbfi.oauth import OAuth, desktop_agents, mobile_agents
+
+
+def legacy_get_auth_header(auth: OAuth) -> dict:
+    try:
+        from fake_useragent import UserAgent
+        user_agent = UserAgent().random
+    except Exception:
+        user_agent = random.choice(desktop_agents + mobile_agents)
+
+    headers = {
+        **auth.headers,
+        'Authorization': f"{auth.token_type} {auth.get_token()}",
+        'User-Agent': user_agent,
+        'X-Session-ID': str(uuid.uuid4()),
+        'Accept': 'application/json',
+        'Accept-Language': 'ko-KR,ko;q=0.9,en;q=0.8',
+        'Accept-Encoding': 'gzip, deflate',
+        'Cache-Control': 'no-cache',
+        'Pragma': 'no-cache',
+        'Connection': 'keep-alive',
+    }
+    if random.random() < 0.2:
+        headers['X-Forwarded-For'] = f"10.0.{random.randint(1,254)}.{random.randint(1,254)}"
+    return headers
+
+
+def measure(fn, number: int) -> float:
+    """호출당 평균 시간 (마이크로초)"""
+    fn()  # 최초 호출 비용(데이터셋 로드 등) 제외
+    start = time.perf_counter()
+    for _ in range(number):
+        fn()
+    return (time.perf_counter() - start) / number * 1e6
+
+
+def main():
+    number = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    auth = OAuth(
+        appkey="bench",
+        appsecretkey="bench",
+        token="token",
+        token_type="Bearer",
+        expire_in=datetime.now() + timedelta(days=1),
+    )
+    legacy = measure(lambda: legacy_get_auth_header(auth), max(1, number // 20))
+    current = measure(auth.get_auth_header, number)
+    print(f"legacy : {legacy:10.2f} us/call")
+    print(f"current: {current:10.2f} us/call ({legacy / current:.0f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,200 @@
+"""
+요청/연속 조회/잔고 집계/차트 디코딩 경로 벤치마크
+
+유량 제한과 연속 조회 대기를 끈 상태에서 SDK 자체 비용만 측정한다.
+*_http 항목을 제외하면 소켓 없이 MockTransport로 MockDBFIServer의 응답을 받는다.
+"""
+import logging
+from typing import Any, Dict
+
+from pydbfi import DBFI, Hooks, get_balance_domestic, get_balance_overseas
+from pydbfi.mockserver import MockDBFIServer, MockTransport
+from pydbfi.pacing import ContinuationPacer
+from pydbfi.ratelimit import RateLimiter
+from pydbfi.service.common.base import BaseService
+from pydbfi.transport import HTTPTransport
+
+from .runner import benchmark, measure
+
+PRICE_ENDPOINT = "/api/v1/quote/kr-stock/inquiry/price"
+MINUTE_CHART_ENDPOINT = "/api/v1/quote/kr-chart/min"
+CHART_FIELDS = ("Oprc", "Hprc", "Lprc", "Prpr", "Cntg_Vol")
+
+# 클라이언트 종료 시 토큰 폐기 경고 등 SDK 로그 생략
+logging.getLogger("pydbfi").setLevel(logging.ERROR)
+
+
+def _client(server: MockDBFIServer, transport=None, **kwargs) -> DBFI:
+    return DBFI(
+        app_key="bench",
+        app_secret_key="bench",
+        log_level=logging.WARNING,
+        base_url=server.url,
+        transport=transport if transport is not None else MockTransport(server),
+        rate_limiter=RateLimiter({}),
+        pacer=ContinuationPacer(initial_interval=0, min_interval=0),
+        **kwargs,
+    )
+
+
+@benchmark("transport_floor")
+def transport_floor(quick: bool) -> Dict[str, Any]:
+    """MockTransport 단독 비용 (execute_service 오버헤드 산출 기준)"""
+    server = MockDBFIServer()
+    dbfi = _client(server)
+    transport, url = dbfi.transport, server.url + PRICE_ENDPOINT
+    headers = dbfi.auth.get_auth_header()
+    body = {"In": {"InputCondMrktDivCode": "J", "InputIscd1": "005930"}}
+    result = measure(lambda: transport.request("POST", url, headers=headers, json=body), 200 if quick else 2000)
+    dbfi.close()
+    return result
+
+
+@benchmark("execute_service")
+def execute_service(quick: bool) -> Dict[str, Any]:
+    """BaseAPI._execute_service -> BaseService._request 호출당 비용 (현재가 조회)"""
+    server = MockDBFIServer()
+    dbfi = _client(server)
+    result = measure(lambda: dbfi.get_stock_price(region="domestic", stock_code="005930"), 200 if quick else 2000)
+    floor = transport_floor(quick)["median_us"]
+    result["transport_floor_us"] = floor
+    result["overhead_us"] = round(result["median_us"] - floor, 3)
+    dbfi.close()
+    return result
+
+
+@benchmark("execute_service_hooks")
+def execute_service_hooks(quick: bool) -> Dict[str, Any]:
+    """빈 before/after 훅을 등록한 현재가 조회 (훅 미등록 execute_service와 비교)"""
+    server = MockDBFIServer()
+    noop = lambda *args: None
+    dbfi = _client(server, hooks=Hooks().register(before=noop, after=noop, error=noop))
+    result = measure(lambda: dbfi.get_stock_price(region="domestic", stock_code="005930"), 200 if quick else 2000)
+    dbfi.close()
+    return result
+
+
+@benchmark("execute_service_http")
+def execute_service_http(quick: bool) -> Dict[str, Any]:
+    """로컬 HTTP(keep-alive) 모의 서버 대상 현재가 조회"""
+    with MockDBFIServer() as server, HTTPTransport() as transport:
+        dbfi = _client(server, transport)
+        result = measure(lambda: dbfi.get_stock_price(region="domestic", stock_code="005930"), 50 if quick else 500)
+        dbfi.close()
+    return result
+
+
+@benchmark("auth_header")
+def auth_header(quick: bool) -> Dict[str, Any]:
+    """OAuth.get_auth_header 호출당 비용 (유효한 토큰 보유 상태)"""
+    server = MockDBFIServer()
+    dbfi = _client(server)
+    dbfi.auth.get_token()
+    result = measure(dbfi.auth.get_auth_header, 2000 if quick else 20000)
+    dbfi.close()
+    return result
+
+
+@benchmark("pagination")
+def pagination(quick: bool) -> Dict[str, Any]:
+    """N 페이지 연속 조회 (분봉, 페이지당 page_size행) 전체 소요 시간"""
+    pages, page_size = (10, 20) if quick else (50, 20)
+    server = MockDBFIServer(page_size=page_size, rows_per_endpoint={MINUTE_CHART_ENDPOINT: pages * page_size})
+    dbfi = _client(server)
+
+    def fetch():
+        rows = dbfi.iter_rows("domestic", "get_minute_chart", out_key="Out", stock_code="005930", start_date="20240105")
+        assert sum(1 for _ in rows) == pages * page_size
+
+    result = measure(fetch, 3 if quick else 10, repeat=3)
+    result.update(
+        pages=pages,
+        page_size=page_size,
+        pages_per_sec=round(pages / result["median_us"] * 1e6, 1),
+        rows_per_sec=round(pages * page_size / result["median_us"] * 1e6, 1),
+    )
+    dbfi.close()
+    return result
+
+
+def _balance(fn, positions: int, quick: bool, **kwargs) -> Dict[str, Any]:
+    server = MockDBFIServer(page_size=20, total_rows=positions)
+    dbfi = _client(server)
+    result = measure(lambda: fn(dbfi, **kwargs), 2 if quick else 10, repeat=3)
+    result.update(
+        positions=positions,
+        requests_per_call=round(sum(server.stats()["requests"].values()) / (result["number"] * result["repeat"] + 1), 1),
+    )
+    dbfi.close()
+    return result
+
+
+@benchmark("balance_domestic")
+def balance_domestic(quick: bool) -> Dict[str, Any]:
+    """services.get_balance_domestic 전체 (잔고 연속 조회 + 보유 종목 현재가 동시 조회 + 예수금)"""
+    return _balance(get_balance_domestic, 20 if quick else 100, quick)
+
+
+@benchmark("balance_overseas")
+def balance_overseas(quick: bool) -> Dict[str, Any]:
+    """services.get_balance_overseas 전체 (주문가능금액 + 체결 내역 + 잔고 연속 조회)"""
+    return _balance(get_balance_overseas, 20 if quick else 100, quick)
+
+
+@benchmark("chart_decode")
+def chart_decode(quick: bool) -> Dict[str, Any]:
+    """차트 응답 한 페이지(JSON 바이트)를 (일자, 시간, 시가, 고가, 저가, 종가, 거래량) 행으로 변환"""
+    rows = 500
+    server = MockDBFIServer(page_size=rows, total_rows=rows)
+    dbfi = _client(server)
+    response = dbfi.transport.request(
+        "POST",
+        server.url + MINUTE_CHART_ENDPOINT,
+        headers=dbfi.auth.get_auth_header(),
+        json={"In": {"InputIscd1": "005930", "InputDate1": "20240105", "InputDivXtick": "60"}},
+    )
+    content = response.content
+
+    def decode():
+        response._content = content
+        page = BaseService._parse_response(response)
+        return [
+            (row["Date"], row["Hour"], *(float(row[field]) for field in CHART_FIELDS))
+            for row in page["Out"]
+        ]
+
+    result = measure(decode, 20 if quick else 200)
+    result.update(rows=rows, bytes=len(content), rows_per_sec=round(rows / result["median_us"] * 1e6, 1))
+    dbfi.close()
+    return result
+
+
+@benchmark("chart_decode_numpy")
+def chart_decode_numpy(quick: bool) -> Dict[str, Any]:
+    """chart_decode와 같은 페이지를 ChartBars(열 단위 NumPy 배열)로 변환"""
+    from pydbfi.bars import ChartBars
+
+    rows = 500
+    server = MockDBFIServer(page_size=rows, total_rows=rows)
+    dbfi = _client(server)
+    response = dbfi.transport.request(
+        "POST",
+        server.url + MINUTE_CHART_ENDPOINT,
+        headers=dbfi.auth.get_auth_header(),
+        json={"In": {"InputIscd1": "005930", "InputDate1": "20240105", "InputDivXtick": "60"}},
+    )
+    content = response.content
+
+    def decode():
+        response._content = content
+        return ChartBars.from_pages(BaseService._parse_response(response))
+
+    result = measure(decode, 20 if quick else 200)
+    result.update(
+        rows=rows,
+        bytes=len(content),
+        array_bytes=decode().nbytes,
+        rows_per_sec=round(rows / result["median_us"] * 1e6, 1),
+    )
+    dbfi.close()
+    return result
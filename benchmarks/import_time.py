@@ -0,0 +1,85 @@
+"""
+패키지 import 시간 측정 (python -X importtime)
+
+새 인터프리터에서 각 import 문을 repeat회 실행하여 누적 시간의 중앙값과
+가장 오래 걸린 모듈을 출력한다. --budget-ms를 넘으면 종료 코드 1을 반환하므로
+CI에서 import 시간 회귀 검사에 사용할 수 있다.
+
+    python benchmarks/import_time.py [--repeat 5] [--top 10] [--budget-ms 300]
+"""
+import argparse
+import os
+import re
+import statistics
+import subprocess
+import sys
+
+STATEMENTS = (
+    "import pydbfi",
+    "from pydbfi import DBFI",
+    "from pydbfi.aio import AsyncDBFI",
+)
+
+_LINE = re.compile(r"import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)")
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def import_profile(statement: str):
+    """
+    새 인터프리터에서 statement를 한 번 실행
+
+    Returns:
+        (최상위 import 누적 시간 목록 [(모듈명, us)], {모듈명: 누적 시간(us)})
+    """
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [_ROOT, os.environ.get("PYTHONPATH")])))
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    )
+    top_level, profile = [], {}
+    for line in result.stderr.splitlines():
+        match = _LINE.match(line)
+        if match:
+            module, cumulative = match.group(4), int(match.group(2))
+            profile[module] = cumulative
+            if len(match.group(3)) == 1:
+                top_level.append((module, cumulative))
+    return top_level, profile
+
+
+def measure(statement: str, repeat: int, startup: set):
+    """(인터프리터 시작 시 불러오는 모듈을 제외한 누적 시간 중앙값(ms), 마지막 실행의 모듈별 누적 시간)"""
+    totals, profile = [], {}
+    for _ in range(repeat):
+        top_level, profile = import_profile(statement)
+        totals.append(sum(us for module, us in top_level if module not in startup) / 1000)
+    return statistics.median(totals), profile
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--top", type=int, default=10)
+    parser.add_argument("--budget-ms", type=float, default=None, help="`import pydbfi` 허용 시간 (ms)")
+    args = parser.parse_args()
+
+    startup = set(import_profile("pass")[1])
+    exit_code = 0
+    for statement in STATEMENTS:
+        median_ms, profile = measure(statement, args.repeat, startup)
+        profile = {module: us for module, us in profile.items() if module not in startup}
+        print(f"{statement:<40} {median_ms:8.1f} ms")
+        top = sorted(profile.items(), key=lambda item: item[1], reverse=True)[: args.top]
+        for module, cumulative in top:
+            print(f"    {module:<40} {cumulative / 1000:8.1f} ms")
+        if statement == "import pydbfi" and args.budget_ms is not None and median_ms > args.budget_ms:
+            print(f"    예산 초과: {median_ms:.1f} ms > {args.budget_ms:.1f} ms")
+            exit_code = 1
+    return exit_code
+
+
+if __name__ == "__main__":
+    sys.exit(main())
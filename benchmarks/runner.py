@@ -0,0 +1,137 @@
+"""
+벤치마크 실행/기록 도구
+
+각 벤치마크는 @benchmark로 등록한 함수이며, quick 여부를 받아 측정 결과 dict를 반환한다.
+결과는 실행 환경 정보와 함께 JSON으로 저장하여 릴리스 간 비교에 사용한다.
+"""
+import gc
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Optional
+
+SCHEMA_VERSION = 1
+
+# 등록된 벤치마크 {이름: 함수}
+BENCHMARKS: Dict[str, Callable[[bool], Dict[str, Any]]] = {}
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def benchmark(name: str):
+    def register(fn):
+        BENCHMARKS[name] = fn
+        return fn
+    return register
+
+
+def measure(fn: Callable[[], Any], number: int, repeat: int = 5, warmup: int = 1) -> Dict[str, Any]:
+    """
+    fn을 number회씩 repeat번 실행한 호출당 시간 통계 (마이크로초)
+
+    timeit과 같이 측정 중에는 GC를 끈다. 중앙값을 대표값으로 사용한다.
+    """
+    for _ in range(warmup):
+        fn()
+    samples = []
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            start = time.perf_counter()
+            for _ in range(number):
+                fn()
+            samples.append((time.perf_counter() - start) / number * 1e6)
+    finally:
+        if gc_enabled:
+            gc.enable()
+    median = statistics.median(samples)
+    return {
+        "number": number,
+        "repeat": repeat,
+        "min_us": round(min(samples), 3),
+        "median_us": round(median, 3),
+        "mean_us": round(statistics.mean(samples), 3),
+        "stdev_us": round(statistics.stdev(samples), 3) if len(samples) > 1 else 0.0,
+        "ops_per_sec": round(1e6 / median, 2) if median else None,
+    }
+
+
+def _package_version() -> str:
+    try:
+        from importlib.metadata import version
+        return version("pydbfi")
+    except Exception:
+        return "unknown"
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=_ROOT, capture_output=True, text=True, check=True,
+        )
+        return result.stdout.strip()
+    except Exception:
+        return None
+
+
+def environment() -> Dict[str, Any]:
+    return {
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "pydbfi_version": _package_version(),
+        "git_commit": _git_commit(),
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+    }
+
+
+def run(names=None, quick: bool = False, log=sys.stderr) -> Dict[str, Any]:
+    """선택한 벤치마크를 순서대로 실행하여 JSON 직렬화 가능한 결과를 반환"""
+    results = {}
+    for name, fn in BENCHMARKS.items():
+        if names and name not in names:
+            continue
+        started = time.perf_counter()
+        results[name] = fn(quick)
+        if log is not None:
+            print(f"{name:<24} {results[name]['median_us']:12.1f} us  ({time.perf_counter() - started:.1f}s)", file=log)
+    return {"schema": SCHEMA_VERSION, "environment": environment(), "quick": quick, "results": results}
+
+
+def compare(current: Dict[str, Any], baseline: Dict[str, Any], tolerance: float) -> Dict[str, Dict[str, Any]]:
+    """
+    중앙값 기준 비교
+
+    Returns:
+        {이름: {"baseline_us", "current_us", "ratio", "regression"}} (ratio > 1 + tolerance이면 회귀)
+    """
+    report = {}
+    for name, result in current["results"].items():
+        base = baseline.get("results", {}).get(name)
+        if not base or not base.get("median_us"):
+            continue
+        ratio = result["median_us"] / base["median_us"]
+        report[name] = {
+            "baseline_us": base["median_us"],
+            "current_us": result["median_us"],
+            "ratio": round(ratio, 3),
+            "regression": ratio > 1 + tolerance,
+        }
+    return report
+
+
+def dump(data: Dict[str, Any], path: Optional[str]):
+    text = json.dumps(data, ensure_ascii=False, indent=2)
+    if path:
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
@@ -1,2 +1,89 @@
-from .main import *
-from .services import *
\ No newline at end of file
+"""
+DB증권 API Python SDK
+
+공개 이름은 처음 접근할 때 해당 모듈을 불러온다 (PEP 562).
+`import pydbfi`만으로는 requests, tenacity 등 의존성을 불러오지 않는다.
+"""
+import importlib
+
+# 공개 이름 -> 정의된 모듈
+_LAZY_ATTRS = {
+    # 클라이언트
+    "DBFI": ".main",
+    "DomesticAPI": ".api",
+    "OverseasAPI": ".api",
+    "DomesticFuturesAPI": ".api",
+    "iter_rows": ".service.common.base",
+    # 인증
+    "OAuth": ".oauth",
+    "TokenRequestError": ".oauth",
+    "TokenStore": ".token_store",
+    "MemoryTokenStore": ".token_store",
+    "FileTokenStore": ".token_store",
+    "TokenRefresher": ".token_refresher",
+    # 전송 및 유량 제한
+    "HTTPTransport": ".transport",
+    "DEFAULT_RATE_LIMITS": ".ratelimit",
+    "RateLimiter": ".ratelimit",
+    "RateLimitBackend": ".ratelimit",
+    "MemoryRateLimitBackend": ".ratelimit",
+    "SQLiteRateLimitBackend": ".ratelimit",
+    "DEFAULT_CONTINUATION_INTERVAL": ".pacing",
+    "ContinuationPacer": ".pacing",
+    # 캐시
+    "QuoteCache": ".cache",
+    "TickerMaster": ".tickers",
+    # 차트 배열 (numpy 필요)
+    "ChartBars": ".bars",
+    "ChartStore": ".chartstore",
+    "BackfillScheduler": ".backfill",
+    "resample": ".resample",
+    # Arrow/Parquet 내보내기 (pyarrow 필요)
+    "export_chart": ".export",
+    "export_transaction_history": ".export",
+    "export_daily_trade_report": ".export",
+    "export_balance": ".export",
+    # 지표 및 추적
+    "MetricsRegistry": ".metrics",
+    "serve_prometheus": ".metrics",
+    "Hooks": ".hooks",
+    "RequestContext": ".hooks",
+    "RequestLog": ".log",
+    "RedactingFilter": ".log",
+    # 테스트/벤치마크
+    "MockDBFIServer": ".mockserver",
+    "MockTransport": ".mockserver",
+    # 잔고/보유 종목 도우미
+    "get_previous_rors_domestic": ".services",
+    "get_balance_domestic": ".services",
+    "get_balance_overseas": ".services",
+    "get_execute_amounts_overseas": ".services",
+    "get_stock_domestic": ".services",
+    "get_stock_overseas": ".services",
+}
+
+__all__ = sorted(_LAZY_ATTRS)
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is not None:
+        value = getattr(importlib.import_module(module_name, __name__), name)
+    else:
+        # 이전 버전의 `from .main import *`, `from .services import *`로 노출되던 이름 호환
+        for module_name in (".main", ".services"):
+            module = importlib.import_module(module_name, __name__)
+            if hasattr(module, name):
+                value = getattr(module, name)
+                break
+        else:
+            # 불러오는 과정에서 등록된 하위 모듈 (예: pydbfi.api)
+            if name in globals():
+                return globals()[name]
+            raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,651 @@
+import asyncio
+import inspect
+import logging
+import os
+import time
+from datetime import datetime
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterable, List, Optional, Union
+
+from tenacity import retry, stop_after_attempt, wait_exponential, wait_fixed
+
+from .api import DomesticAPI, DomesticFuturesAPI, OverseasAPI
+from .main import DBFI
+from .oauth import OAuth
+from .pacing import DEFAULT_CONTINUATION_INTERVAL, ContinuationPacer
+from .cache import QuoteCache
+from .hooks import Hooks, RequestContext, set_attempt
+from .log import redact
+from .metrics import MetricsRegistry
+from .ratelimit import RateLimiter
+from .service.chart import DomesticChartService, OverseasChartService
+from .service.common.base import _record_retry, iter_rows
+from .service.quote import DomesticQuoteService, OverseasQuoteService
+from .service.trading import (
+    DomesticFuturesTradingService,
+    DomesticTradingService,
+    OverseasTradingService,
+)
+from .token_refresher import TokenRefresher
+from .token_store import TokenStore
+from .transport import DEFAULT_TIMEOUT
+
+
+def _import_httpx():
+    try:
+        import httpx
+    except ImportError as e:
+        raise ImportError(
+            "비동기 클라이언트를 사용하려면 httpx가 필요합니다: pip install pydbfi[async]"
+        ) from e
+    return httpx
+
+
+class AsyncHTTPTransport:
+    """
+    비동기 keep-alive 커넥션 풀 (httpx.AsyncClient)
+
+    Args:
+        max_connections: 전체 최대 커넥션 수
+        max_keepalive_connections: 유지할 유휴 커넥션 수
+        keepalive_expiry: 유휴 커넥션 유지 시간 (초)
+        timeout: 요청 기본 타임아웃 (초, None이면 무제한)
+    """
+
+    def __init__(
+        self,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        keepalive_expiry: Optional[float] = 60.0,
+        timeout: Optional[float] = DEFAULT_TIMEOUT,
+    ):
+        httpx = _import_httpx()
+        self.client = httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+                keepalive_expiry=keepalive_expiry,
+            ),
+            timeout=timeout,
+        )
+
+    async def request(self, method: str, url: str, **kwargs):
+        return await self.client.request(method, url, **kwargs)
+
+    async def post(self, url: str, **kwargs):
+        return await self.request("POST", url, **kwargs)
+
+    async def close(self):
+        await self.client.aclose()
+
+    @property
+    def closed(self) -> bool:
+        return self.client.is_closed
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+
+class AsyncOAuth(OAuth):
+    """
+    비동기 토큰 발급/갱신
+
+    생성 시 토큰을 동기로 발급하지 않고 첫 요청 시점에 비동기로 발급한다.
+    동시에 만료를 감지한 코루틴들은 하나의 발급 요청을 공유한다.
+    """
+
+    STORE_LOCK_POLL_INTERVAL = 0.05
+
+    def __init__(self, *args, async_transport: AsyncHTTPTransport = None, **kwargs):
+        self.async_transport = async_transport if async_transport is not None else AsyncHTTPTransport()
+        self._async_lock = None
+        super().__init__(*args, **kwargs)
+
+    def init_auth(self):
+        # 이벤트 루프 밖에서 동기 발급하지 않음
+        pass
+
+    def _get_async_lock(self) -> asyncio.Lock:
+        if self._async_lock is None:
+            self._async_lock = asyncio.Lock()
+        return self._async_lock
+
+    async def aget_token(self, is_refresh: bool = False) -> str:
+        if is_refresh:
+            await self._arefresh_token(rejected=self.token)
+            return self.token
+
+        if not self.is_token_valid():
+            async with self._get_async_lock():
+                if not self.is_token_valid():
+                    await self._arefresh_token()
+        return self.token
+
+    async def _arefresh_token(self, rejected: str = None) -> None:
+        """
+        _refresh_token의 비동기 버전
+
+        저장소 잠금은 이벤트 루프를 막지 않도록 비차단 획득을 폴링한다.
+        실행기 스레드에서 획득하면 대기 중 취소되어도 스레드가 잠금을 잡은 채 남으므로 사용하지 않는다.
+        """
+        if self.token_store is None:
+            await self.arequest_token()
+            return
+        if self._load_stored_token(rejected):
+            return
+        while not self.token_store.acquire(blocking=False):
+            await asyncio.sleep(self.STORE_LOCK_POLL_INTERVAL)
+            # 잠금을 기다리는 동안 다른 프로세스가 발급했으면 잠금 없이 재사용
+            if self._load_stored_token(rejected):
+                return
+        try:
+            if not self._load_stored_token(rejected):
+                await self.arequest_token()
+        finally:
+            self.token_store.release()
+
+    async def ainvalidate_token(self, generation: int) -> None:
+        """invalidate_token의 비동기 버전 (같은 세대의 재발급을 코루틴 간 공유)"""
+        if self.token_generation != generation:
+            return
+        async with self._get_async_lock():
+            if self.token_generation != generation:
+                return
+            self.logger.warning("token 유효성 만료: 토큰 재발급 진행합니다.")
+            await self._arefresh_token(rejected=self.token)
+
+    @retry(
+        stop=stop_after_attempt(3),
+        wait=wait_fixed(70), # 70초 고정 대기 후 재시도
+        reraise=True
+    )
+    async def arequest_token(self) -> None:
+        httpx = _import_httpx()
+        headers = {"content-type": "application/x-www-form-urlencoded"}
+        try:
+            self.logger.info("Requesting new access token from DB Securities API")
+            response = await self.async_transport.post(
+                f"{self.BASE_URL}/oauth2/token", headers=headers, data=self._token_request_data()
+            )
+            response.raise_for_status()
+            self._set_token(response.json())
+        except httpx.HTTPError as e:
+            raise self._token_error(e, getattr(e, "response", None))
+
+    async def arevoke_token(self) -> dict:
+        if not self.token:
+            self.logger.warning("No token to revoke")
+            return {"code": 400, "message": "No token to revoke"}
+
+        httpx = _import_httpx()
+        headers = {"content-type": "application/x-www-form-urlencoded"}
+        try:
+            self.logger.info("Revoking access token")
+            response = await self.async_transport.post(
+                f"{self.BASE_URL}/oauth2/revoke", headers=headers, data=self._revoke_request_data()
+            )
+            response.raise_for_status()
+            return self._on_revoked(response.json())
+        except httpx.HTTPError as e:
+            self.logger.error(f"Failed to revoke token: {str(e)}")
+            raise e
+
+
+class AsyncServiceMixin:
+    """
+    BaseService의 엔드포인트 정의를 그대로 사용하면서 요청만 비동기로 수행
+
+    서비스 메서드는 self._request(...)의 반환값을 그대로 돌려주므로
+    비동기 서비스의 메서드는 awaitable(또는 stream=True이면 async iterator)을 반환한다.
+    """
+
+    auth: AsyncOAuth
+
+    def _request(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        data: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        content_type: str = "application/json",
+        cont_yn: str = "N",
+        cont_key: str = None,
+        max_cont_cnt: int = 100,
+        rate_limit_key: Optional[str] = None,
+        stream: bool = False,
+        hook_context: Optional[RequestContext] = None,
+        **kwargs,
+    ):
+        pages = self._aiter_pages(
+            method,
+            endpoint,
+            params=params,
+            data=data,
+            headers=headers,
+            content_type=content_type,
+            cont_yn=cont_yn,
+            cont_key=cont_key,
+            max_cont_cnt=max_cont_cnt,
+            rate_limit_key=rate_limit_key,
+            hook_context=hook_context,
+        )
+        if stream:
+            return pages
+        return self._collect(pages)
+
+    def _cached_request(
+        self,
+        method: str,
+        endpoint: str,
+        data: Optional[Dict[str, Any]] = None,
+        cont_yn: str = "N",
+        cont_key: str = None,
+        **kwargs,
+    ):
+        if self.quote_cache is None or cont_key or kwargs.get("stream"):
+            return self._request(
+                method, endpoint, data=data, cont_yn=cont_yn, cont_key=cont_key, **kwargs
+            )
+        return self.quote_cache.aget_or_fetch(
+            self._cache_key(endpoint, data),
+            lambda: self._request(
+                method, endpoint, data=data, cont_yn=cont_yn, cont_key=cont_key, **kwargs
+            ),
+        )
+
+    @staticmethod
+    async def _collect(pages: AsyncIterator[dict]) -> Union[dict, List[dict]]:
+        outputs = [page async for page in pages]
+        return outputs[0] if len(outputs) == 1 else outputs
+
+    async def _aiter_pages(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        data: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        content_type: str = "application/json",
+        cont_yn: str = "N",
+        cont_key: str = None,
+        max_cont_cnt: int = 100,
+        rate_limit_key: Optional[str] = None,
+        hook_context: Optional[RequestContext] = None,
+    ) -> AsyncIterator[dict]:
+        cont_cnt = 0
+        while True:
+            sent_at = time.monotonic()
+            response = await self._arequest_page(
+                method,
+                endpoint,
+                params=params,
+                data=data,
+                headers=headers,
+                content_type=content_type,
+                cont_yn=cont_yn,
+                cont_key=cont_key,
+                rate_limit_key=rate_limit_key,
+                continuation=cont_cnt,
+                hook_context=hook_context,
+            )
+            if cont_cnt > 0 and self.pacer is not None:
+                self.pacer.on_success(endpoint, rate_limit_key)
+            cont_yn = response.headers.get("cont_yn", "N")
+            cont_key = response.headers.get("cont_key", "")
+            page = self._parse_response(response)
+            if self.metrics is not None:
+                self.metrics.observe_page(endpoint, page.get("rsp_cd"), continuation=cont_cnt > 0)
+            yield page
+
+            # 연속 조회 여부 판단
+            if cont_yn != "Y" or cont_key == "" or cont_cnt >= max_cont_cnt:
+                return
+            cont_cnt += 1
+            if self.pacer is not None:
+                await asyncio.sleep(self.pacer.delay(endpoint, since=sent_at))
+            else:
+                await asyncio.sleep(DEFAULT_CONTINUATION_INTERVAL)
+
+    @retry(
+        stop=stop_after_attempt(3),
+        wait=wait_exponential(
+            multiplier=1,    # 기본 승수
+            min=1,          # 최소 대기 시간 (초)
+            max=10          # 최대 대기 시간 (초)
+        ),
+        reraise=True,
+        before=set_attempt,
+        before_sleep=_record_retry,
+    )
+    async def _arequest_page(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        data: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        content_type: str = "application/json",
+        cont_yn: str = "N",
+        cont_key: str = None,
+        rate_limit_key: Optional[str] = None,
+        continuation: int = 0,
+        hook_context: Optional[RequestContext] = None,
+    ):
+        httpx = _import_httpx()
+        url = f"{self.BASE_URL}{endpoint}"
+        metrics = self.metrics
+        traced = self.hooks is not None and self.hooks.active
+        debug = self.logger.isEnabledFor(logging.DEBUG)
+
+        try:
+            # 토큰 만료로 거절되면 재발급 후 백오프 없이 한 번 즉시 재요청
+            for replay in (False, True):
+                if traced:
+                    ctx = self._begin_trace(hook_context, method, endpoint, content_type, data, continuation, replay)
+                started = None
+                # 훅 before 이후 예외는 모두 error 훅으로 전달 (토큰 발급, 헤더 생성, 유량 제한 대기 포함)
+                try:
+                    await self.auth.aget_token()
+                    generation = self.auth.token_generation
+                    request_headers = self._build_headers(headers, content_type, cont_yn, cont_key)
+
+                    if self.rate_limiter is not None:
+                        # 이벤트 루프를 막지 않고 유량 제한 대기
+                        wait = self.rate_limiter.reserve(rate_limit_key)
+                        if wait > 0:
+                            await asyncio.sleep(wait)
+                            if metrics is not None:
+                                metrics.observe_rate_limit_wait(endpoint, wait)
+                        if traced:
+                            ctx.timings["rate_limit"] = wait
+
+                    if debug:
+                        self.logger.debug(
+                            "Request to %s, method=%s, headers=%s, data=%s",
+                            url, method, redact(request_headers), data,
+                            extra={"endpoint": endpoint, "http_method": method, "continuation": continuation},
+                        )
+
+                    started = time.perf_counter()
+                    response = await self.transport.request(
+                        method,
+                        url,
+                        params=params,
+                        headers=request_headers,
+                        **self._body_kwargs(content_type, data),
+                    )
+                except BaseException as e:
+                    elapsed = time.perf_counter() - started if started is not None else 0.0
+                    if metrics is not None and started is not None and isinstance(e, Exception):
+                        metrics.observe_error(endpoint, e, elapsed)
+                    if traced:
+                        self._end_trace(ctx, None, elapsed, e)
+                    raise
+                if metrics is not None:
+                    self._observe_response(endpoint, response, time.perf_counter() - started)
+                if traced:
+                    self._end_trace(ctx, response, time.perf_counter() - started)
+
+                if replay or not self._is_token_expired(response):
+                    break
+                await self.auth.ainvalidate_token(generation)
+                if metrics is not None:
+                    metrics.observe_retry(endpoint, "token_expired")
+
+            if response.status_code >= 400 and self.pacer is not None:
+                if self.pacer.is_throttled(response.status_code, self._get_rsp_cd(response)):
+                    self.logger.warning("유량 제한 초과: %s", endpoint, extra={"endpoint": endpoint})
+                    self.pacer.on_throttle(endpoint)
+
+            # 오류 응답 본문은 아래 예외 처리에서 한 번만 기록
+            response.raise_for_status()
+            return response
+
+        except Exception as e:
+            error_type = type(e).__name__
+            if isinstance(e, httpx.HTTPError):
+                failed = getattr(e, "response", None)
+                extra = {"endpoint": endpoint, "http_method": method, "error": error_type}
+                if failed is not None:
+                    extra["status_code"] = failed.status_code
+                    self.logger.error(
+                        "API request failed (%s): %s\nResponse(%s): %s",
+                        error_type, e, failed.status_code, failed.text, extra=extra,
+                    )
+                else:
+                    self.logger.error("API request failed (%s): %s", error_type, e, extra=extra)
+            else:
+                self.logger.error("Unexpected error (%s): %s", error_type, e, exc_info=True)
+            raise
+
+
+class AsyncDomesticTradingService(AsyncServiceMixin, DomesticTradingService):
+    pass
+
+
+class AsyncDomesticQuoteService(AsyncServiceMixin, DomesticQuoteService):
+    pass
+
+
+class AsyncDomesticChartService(AsyncServiceMixin, DomesticChartService):
+    pass
+
+
+class AsyncOverseasTradingService(AsyncServiceMixin, OverseasTradingService):
+    pass
+
+
+class AsyncOverseasQuoteService(AsyncServiceMixin, OverseasQuoteService):
+    pass
+
+
+class AsyncOverseasChartService(AsyncServiceMixin, OverseasChartService):
+    pass
+
+
+class AsyncDomesticFuturesTradingService(AsyncServiceMixin, DomesticFuturesTradingService):
+    pass
+
+
+class AsyncAPIMixin:
+    """동기 API의 요청 생성 로직을 재사용하고 결과를 awaitable로 반환"""
+
+    async def close(self):
+        try:
+            # 저장소의 토큰은 다른 프로세스와 공유하므로 폐기하지 않음
+            if self.auth.token_store is None:
+                await self.auth.arevoke_token()
+            self.logger.info("DB증권 API 세션이 종료되었습니다.")
+        except Exception as e:
+            self.logger.error(f"세션 종료 중 오류 발생: {str(e)}")
+
+    def _finish_call(self, hooks: Hooks, ctx: RequestContext, result):
+        if inspect.isawaitable(result):
+            return self._traced_call(hooks, ctx, result)
+        if hasattr(result, "__aiter__"):
+            return self._atraced_pages(hooks, ctx, result)
+        return super()._finish_call(hooks, ctx, result)
+
+    @staticmethod
+    async def _traced_call(hooks: Hooks, ctx: RequestContext, awaitable: Awaitable[Any]):
+        try:
+            result = await awaitable
+        except Exception as e:
+            hooks.error(ctx, e)
+            raise
+        hooks.after(ctx, result)
+        return result
+
+    @staticmethod
+    async def _atraced_pages(hooks: Hooks, ctx: RequestContext, pages: AsyncIterator[Dict[str, Any]]):
+        try:
+            async for page in pages:
+                yield page
+        except GeneratorExit:
+            hooks.after(ctx, None)
+            raise
+        except Exception as e:
+            hooks.error(ctx, e)
+            raise
+        hooks.after(ctx, None)
+
+    async def _fan_out(
+        self, fn: Callable[[str], Awaitable[Any]], codes: Iterable[str], max_workers: int = 8
+    ) -> Dict[str, Dict[str, Any]]:
+        """종목별 조회를 동시 실행 수 max_workers 이내에서 한 이벤트 루프로 실행"""
+        codes = list(dict.fromkeys(codes))
+        semaphore = asyncio.Semaphore(max(1, max_workers))
+
+        async def run(code):
+            async with semaphore:
+                return await fn(code)
+
+        outcomes = await asyncio.gather(*(run(code) for code in codes), return_exceptions=True)
+        results, errors = {}, {}
+        for code, outcome in zip(codes, outcomes):
+            if isinstance(outcome, Exception):
+                self.logger.error(f"{code} 조회 실패: {str(outcome)}")
+                errors[code] = outcome
+            else:
+                results[code] = outcome
+        return dict(results=results, errors=errors)
+
+    async def iter_pages(self, method_name: str, **kwargs) -> AsyncIterator[Dict[str, Any]]:
+        """
+        연속 조회 결과를 페이지 단위로 도착 순서대로 반환
+
+        사용 예:
+            async for page in api.iter_pages("get_minute_chart", stock_code="005930", start_date="20240102"):
+                ...
+        """
+        method = getattr(self, method_name)
+        if "stream" in inspect.signature(method).parameters:
+            kwargs["stream"] = True
+        pages = method(**kwargs)
+        if inspect.isawaitable(pages):
+            # 연속 조회를 지원하지 않는 메서드
+            yield await pages
+        else:
+            async for page in pages:
+                yield page
+
+    async def iter_rows(self, method_name: str, out_key: str = "Out", **kwargs) -> AsyncIterator[Any]:
+        """연속 조회 결과의 out_key(Out, Out1, Out2 등) 행을 순차 반환"""
+        async for page in self.iter_pages(method_name, **kwargs):
+            for row in iter_rows([page], out_key):
+                yield row
+
+    async def get_chart_bars(self, period: str = "daily", fields: Dict[str, str] = None, **kwargs):
+        """차트 조회 결과를 ChartBars(NumPy 배열)로 반환 (numpy 필요)"""
+        from .bars import CHART_TIMEZONES, ChartBars
+
+        return await ChartBars.afrom_pages(
+            self._chart_pages(period, **kwargs), fields=fields, tz=CHART_TIMEZONES.get(self.REGION)
+        )
+
+
+class DomesticAsyncAPI(AsyncAPIMixin, DomesticAPI):
+    TRADING_SERVICE = AsyncDomesticTradingService
+    QUOTE_SERVICE = AsyncDomesticQuoteService
+    CHART_SERVICE = AsyncDomesticChartService
+
+
+class OverseasAsyncAPI(AsyncAPIMixin, OverseasAPI):
+    TRADING_SERVICE = AsyncOverseasTradingService
+    QUOTE_SERVICE = AsyncOverseasQuoteService
+    CHART_SERVICE = AsyncOverseasChartService
+
+
+class DomesticFuturesAsyncAPI(AsyncAPIMixin, DomesticFuturesAPI):
+    TRADING_SERVICE = AsyncDomesticFuturesTradingService
+
+
+class AsyncDBFI(DBFI):
+    """
+    asyncio 기반 클라이언트. DBFI와 같은 메서드를 제공하며 결과를 await로 받는다.
+
+    사용 예:
+        async with AsyncDBFI(app_key="YOUR_APP_KEY", app_secret_key="YOUR_SECRET_KEY") as dbfi:
+            price = await dbfi.get_stock_price(region="domestic", stock_code="005930")
+            await dbfi.buy(region="overseas", stock_code="AAPL", quantity=5, price=150.0)
+
+            async for page in dbfi.iter_pages("domestic", "get_minute_chart", stock_code="005930", start_date="20240102"):
+                ...
+    """
+
+    def __init__(
+        self,
+        app_key: str,
+        app_secret_key: str,
+        log_level=logging.INFO,
+        headers: dict = {},
+        token: str = None,
+        token_type: str = None,
+        expire_in: datetime = None,
+        transport: AsyncHTTPTransport = None,
+        rate_limiter: RateLimiter = None,
+        pacer: ContinuationPacer = None,
+        quote_cache: QuoteCache = None,
+        metrics: MetricsRegistry = None,
+        hooks: Hooks = None,
+        token_store: TokenStore = None,
+        auto_refresh_token: bool = False,
+        base_url: str = None,
+    ):
+        # transport 미지정 시 AsyncDBFI가 커넥션 풀을 생성하고 close()에서 정리
+        self._owns_transport = transport is None
+        self.transport = transport if transport is not None else AsyncHTTPTransport()
+        _oauth = AsyncOAuth(
+            appkey=app_key,
+            appsecretkey=app_secret_key,
+            headers=headers,
+            token=token,
+            token_type=token_type,
+            expire_in=expire_in,
+            token_store=token_store,
+            # 미지정 시 환경 변수 PYDBFI_BASE_URL (없으면 실서버)
+            base_url=base_url or os.environ.get("PYDBFI_BASE_URL") or None,
+            async_transport=self.transport,
+        )
+        self._owns_rate_limiter = rate_limiter is None
+        self.rate_limiter = rate_limiter if rate_limiter is not None else RateLimiter()
+        self.pacer = pacer if pacer is not None else ContinuationPacer(rate_limiter=self.rate_limiter)
+        self.quote_cache = quote_cache  # 미지정 시 시세 캐시 미사용
+        self.metrics = metrics  # 미지정 시 지표 미수집
+        self.hooks = hooks  # 미지정 시 훅 미사용
+        api_kwargs = dict(
+            transport=self.transport,
+            rate_limiter=self.rate_limiter,
+            pacer=self.pacer,
+            quote_cache=self.quote_cache,
+            metrics=self.metrics,
+            hooks=self.hooks,
+        )
+        self.domestic = DomesticAsyncAPI(_oauth, log_level, **api_kwargs)
+        self.overseas = OverseasAsyncAPI(_oauth, log_level, **api_kwargs)
+        self.domestic_futures = DomesticFuturesAsyncAPI(_oauth, log_level, **api_kwargs)
+        self.auth = _oauth
+        # 만료 전 백그라운드 갱신 (요청 경로에서 토큰 발급 대기 제거)
+        self.token_refresher = TokenRefresher(_oauth).start() if auto_refresh_token else None
+
+    async def close(self):
+        if self.token_refresher is not None:
+            self.token_refresher.stop()
+        await self.domestic.close()
+        await self.overseas.close()
+        await self.domestic_futures.close()
+        # 동기 호출용으로 생성된 커넥션 풀 정리
+        self.domestic.auth.transport.close()
+        if self._owns_transport:
+            await self.transport.close()
+        if self._owns_rate_limiter:
+            self.rate_limiter.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
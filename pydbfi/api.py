@@ -1,20 +1,67 @@
 import logging
-import pytz
-from datetime import datetime, timedelta
-from typing import Any, Dict, Literal
+import inspect
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, Iterable, Iterator, Literal, Optional
 
 from .data.domestic.request import *
 from .data.overseas.request import *
+from .cache import QuoteCache
+from .hooks import Hooks, RequestContext
+from .metrics import MetricsRegistry
 from .oauth import OAuth
+from .pacing import DEFAULT_CONTINUATION_INTERVAL, ContinuationPacer
+from .ratelimit import (
+    DEFAULT_RATE_LIMITS,
+    MemoryRateLimitBackend,
+    RateLimitBackend,
+    RateLimiter,
+    SQLiteRateLimitBackend,
+)
+from .transport import HTTPTransport
 from .service.chart import *
+from .service.common.base import iter_rows
 from .service.quote import *
 from .service.trading import *
+from .token_refresher import TokenRefresher
+from .token_store import FileTokenStore, MemoryTokenStore, TokenStore
+
+
+# 한국 표준시 (일광절약시간 없음)
+KST = timezone(timedelta(hours=9))
+
+# get_chart_bars의 period -> 차트 조회 메서드
+CHART_METHODS = {
+    "minute": "get_minute_chart",
+    "daily": "get_daily_chart",
+    "weekly": "get_weekly_chart",
+    "monthly": "get_monthly_chart",
+    "yearly": "get_yearly_chart",
+}
 
 
 class BaseAPI:
-    def __init__(self, auth: OAuth, log_level=logging.INFO):
+    REGION: Optional[str] = None  # 훅 컨텍스트에 전달되는 지역 구분
+
+    def __init__(
+        self,
+        auth: OAuth,
+        log_level=logging.INFO,
+        transport: HTTPTransport = None,
+        rate_limiter: RateLimiter = None,
+        pacer: ContinuationPacer = None,
+        quote_cache: QuoteCache = None,
+        metrics: MetricsRegistry = None,
+        hooks: Hooks = None,
+    ):
         self._setup_logging(log_level)
         self.auth = auth
+        self.transport = transport if transport is not None else auth.transport
+        self.rate_limiter = rate_limiter
+        self.pacer = pacer
+        self.quote_cache = quote_cache
+        self.metrics = metrics
+        self.hooks = hooks
 
     def _setup_logging(self, log_level):
         self.logger = logging.getLogger("db-trading-sdk")
@@ -29,11 +76,25 @@ class BaseAPI:
 
     def close(self):
         try:
-            self.auth.revoke_token()
+            # 저장소의 토큰은 다른 프로세스와 공유하므로 폐기하지 않음
+            if self.auth.token_store is None:
+                self.auth.revoke_token()
             self.logger.info("DB증권 API 세션이 종료되었습니다.")
         except Exception as e:
             self.logger.error(f"세션 종료 중 오류 발생: {str(e)}")
 
+    def _service_kwargs(self) -> Dict[str, Any]:
+        # 서비스 객체 생성 시 공통으로 주입되는 의존성
+        return {
+            "auth": self.auth,
+            "transport": self.transport,
+            "rate_limiter": self.rate_limiter,
+            "pacer": self.pacer,
+            "quote_cache": self.quote_cache,
+            "metrics": self.metrics,
+            "hooks": self.hooks,
+        }
+
     def _execute_service(
         self,
         service_getter,
@@ -42,44 +103,158 @@ class BaseAPI:
         use_cont: bool = False,
         cont_yn: str = "N",
         cont_key: str = None,
+        stream: bool = False,
+        **method_kwargs,
     ):
         service = service_getter()
         method = getattr(service, method_name)
-        if request is not None:
-            if use_cont:
-                return method(request, cont_yn=cont_yn, cont_key=cont_key)
-            else:
-                return method(request)
+        kwargs = dict(method_kwargs)
+        if use_cont:
+            kwargs.update(cont_yn=cont_yn, cont_key=cont_key)
+            if stream:
+                # 연속 조회 페이지를 모으지 않고 제너레이터로 반환
+                kwargs["stream"] = True
+        args = (request,) if request is not None else ()
+
+        hooks = self.hooks
+        if hooks is None or not hooks.active:
+            return method(*args, **kwargs)
+
+        ctx = RequestContext("call", method_name=method_name, region=self.REGION, attempt=0)
+        kwargs["hook_context"] = ctx
+        hooks.before(ctx)
+        try:
+            result = method(*args, **kwargs)
+        except Exception as e:
+            hooks.error(ctx, e)
+            raise
+        return self._finish_call(hooks, ctx, result)
+
+    def _finish_call(self, hooks: Hooks, ctx: RequestContext, result):
+        if isinstance(result, Iterator):
+            # stream=True: 페이지를 모두 소비(또는 중단)한 시점에 after 호출
+            return self._traced_pages(hooks, ctx, result)
+        hooks.after(ctx, result)
+        return result
+
+    @staticmethod
+    def _traced_pages(hooks: Hooks, ctx: RequestContext, pages: Iterator[Dict[str, Any]]):
+        try:
+            yield from pages
+        except GeneratorExit:
+            hooks.after(ctx, None)
+            raise
+        except Exception as e:
+            hooks.error(ctx, e)
+            raise
+        hooks.after(ctx, None)
+
+    def _fan_out(
+        self, fn: Callable[[str], Any], codes: Iterable[str], max_workers: int = 8
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        종목별 조회를 제한된 워커 풀에서 동시에 실행
+
+        Returns:
+            {"results": {종목코드: 응답}, "errors": {종목코드: 예외}}
+        """
+        codes = list(dict.fromkeys(codes))  # 순서 유지 중복 제거
+        results, errors = {}, {}
+        if not codes:
+            return dict(results=results, errors=errors)
+
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(codes)))) as executor:
+            futures = {executor.submit(fn, code): code for code in codes}
+            for future in as_completed(futures):
+                code = futures[future]
+                try:
+                    results[code] = future.result()
+                except Exception as e:
+                    self.logger.error(f"{code} 조회 실패: {str(e)}")
+                    errors[code] = e
+        return dict(results=results, errors=errors)
+
+    def iter_pages(self, method_name: str, **kwargs) -> Iterator[Dict[str, Any]]:
+        """
+        연속 조회 결과를 페이지 단위로 도착 순서대로 반환
+
+        사용 예:
+            for page in api.iter_pages("get_transaction_history", execution_status="1"):
+                ...
+        """
+        method = getattr(self, method_name)
+        if "stream" in inspect.signature(method).parameters:
+            kwargs["stream"] = True
+        pages = method(**kwargs)
+        if isinstance(pages, dict):
+            # 연속 조회를 지원하지 않는 메서드
+            yield pages
         else:
-            if use_cont:
-                return method(cont_yn=cont_yn, cont_key=cont_key)
-            else:
-                return method()
+            yield from pages
+
+    def iter_rows(self, method_name: str, out_key: str = "Out", **kwargs) -> Iterator[Any]:
+        """
+        연속 조회 결과의 out_key(Out, Out1, Out2 등) 행을 순차 반환
+
+        사용 예:
+            for row in api.iter_rows("get_stock_balance", out_key="Out1"):
+                ...
+        """
+        return iter_rows(self.iter_pages(method_name, **kwargs), out_key)
+
+    def _chart_pages(self, period: str, **kwargs):
+        if period not in CHART_METHODS:
+            raise ValueError(f"period는 {', '.join(CHART_METHODS)} 중 하나여야 합니다.")
+        if not hasattr(self, CHART_METHODS[period]):
+            raise ValueError(f"{self.REGION}는 차트 조회를 지원하지 않습니다.")
+        return self.iter_pages(CHART_METHODS[period], **kwargs)
+
+    def get_chart_bars(self, period: str = "daily", fields: Dict[str, str] = None, **kwargs):
+        """
+        차트 조회(연속 조회 포함) 결과를 ChartBars(NumPy 배열)로 반환 (numpy 필요)
+
+        사용 예:
+            bars = api.get_chart_bars("minute", stock_code="005930", start_date="20240105")
+
+        Args:
+            period: minute, daily, weekly, monthly, yearly
+            fields: 응답 필드명 매핑 변경 (bars.DEFAULT_CHART_FIELDS 참고)
+            **kwargs: 해당 차트 조회 메서드 인자
+        """
+        from .bars import CHART_TIMEZONES, ChartBars
+
+        return ChartBars.from_pages(
+            self._chart_pages(period, **kwargs), fields=fields, tz=CHART_TIMEZONES.get(self.REGION)
+        )
 
 
 class DomesticAPI(BaseAPI):
+    REGION = "domestic"
     MARKET_CODE: Literal["J", "E", "EN"] # 국내 시장분류코드 (J:주식, E:ETF, EN:ETN)
     ORDER_TYPE: Literal["0", "1", "2"] # 국내 매매구분 (0:전체, 1:매도, 2:매수)
+    TRADING_SERVICE = DomesticTradingService
+    QUOTE_SERVICE = DomesticQuoteService
+    CHART_SERVICE = DomesticChartService
     
-    def __init__(self, auth: OAuth, log_level=logging.INFO):
-        super().__init__(auth, log_level)
+    def __init__(self, auth: OAuth, log_level=logging.INFO, **kwargs):
+        super().__init__(auth, log_level, **kwargs)
         self._trading_service = None
         self._quote_service = None
         self._chart_service = None
 
     def _get_trading_service(self):
         if self._trading_service is None:
-            self._trading_service = DomesticTradingService(auth=self.auth)
+            self._trading_service = self.TRADING_SERVICE(**self._service_kwargs())
         return self._trading_service
 
     def _get_quote_service(self):
         if self._quote_service is None:
-            self._quote_service = DomesticQuoteService(auth=self.auth)
+            self._quote_service = self.QUOTE_SERVICE(**self._service_kwargs())
         return self._quote_service
 
     def _get_chart_service(self):
         if self._chart_service is None:
-            self._chart_service = DomesticChartService(auth=self.auth)
+            self._chart_service = self.CHART_SERVICE(**self._service_kwargs())
         return self._chart_service
 
     # ===== 매매 관련 =====
@@ -105,8 +280,9 @@ class DomesticAPI(BaseAPI):
             loan_date=loan_date,
             order_condition=order_condition,
         )
-        service = self._get_trading_service()
-        return service.place_order(order_request, use_nxt=use_nxt)
+        return self._execute_service(
+            self._get_trading_service, "place_order", request=order_request, use_nxt=use_nxt
+        )
 
     def sell(
         self,
@@ -129,15 +305,17 @@ class DomesticAPI(BaseAPI):
             loan_date=loan_date,
             order_condition=order_condition,
         )
-        service = self._get_trading_service()
-        return service.place_order(order_request, use_nxt=use_nxt)
+        return self._execute_service(
+            self._get_trading_service, "place_order", request=order_request, use_nxt=use_nxt
+        )
 
     def cancel(self, order_no: int, stock_code: str, quantity: int, use_nxt: bool = False) -> Dict[str, Any]:
         cancel_request = DomesticCancelOrderRequest(
             original_order_no=order_no, stock_code=stock_code, quantity=quantity
         )
-        service = self._get_trading_service()
-        return service.cancel_order(cancel_request, use_nxt=use_nxt)
+        return self._execute_service(
+            self._get_trading_service, "cancel_order", request=cancel_request, use_nxt=use_nxt
+        )
 
     def get_transaction_history(
         self,
@@ -147,6 +325,7 @@ class DomesticAPI(BaseAPI):
         query_type: str = "0",  # 조회구분 (0:전체, 1:ELW, 2:ELW제외)
         cont_yn: str = "N",
         cont_key: str = None,
+        stream: bool = False,
     ) -> Dict[str, Any]:
         request = DomesticTransactionHistoryRequest(
             execution_status=execution_status,
@@ -161,6 +340,7 @@ class DomesticAPI(BaseAPI):
             use_cont=True,
             cont_yn=cont_yn,
             cont_key=cont_key,
+            stream=stream,
         )
 
     def post_trading_history(
@@ -169,6 +349,7 @@ class DomesticAPI(BaseAPI):
         qry_end_dt: str,
         cont_yn: str = "N",
         cont_key: str = None,
+        stream: bool = False,
     ) -> Dict[str, Any]:
         request = DomesticPostTradingHistoryRequest(
             QrySrtDt=qry_srt_dt,
@@ -181,6 +362,7 @@ class DomesticAPI(BaseAPI):
             use_cont=True,
             cont_yn=cont_yn,
             cont_key=cont_key,
+            stream=stream,
         )
 
     def post_daily_trade_report(
@@ -189,6 +371,7 @@ class DomesticAPI(BaseAPI):
         isu_no: str = "",  # 종목번호 (공백: 전체, "A+종목번호": 특정 종목)
         cont_yn: str = "N",
         cont_key: str = None,
+        stream: bool = False,
     ) -> Dict[str, Any]:
         request = DomesticDailyTradeReportRequest(
             isu_no=isu_no,
@@ -201,6 +384,7 @@ class DomesticAPI(BaseAPI):
             use_cont=True,
             cont_yn=cont_yn,
             cont_key=cont_key,
+            stream=stream,
         )
 
     def get_stock_balance(
@@ -208,6 +392,7 @@ class DomesticAPI(BaseAPI):
         query_type: str = "2",  # 조회구분코드 (0:전체, 1:비상장제외, 2:비상장,코넥스,kotc 제외)
         cont_yn: str = "N",
         cont_key: str = None,
+        stream: bool = False,
     ) -> Dict[str, Any]:
         request = DomesticBalanceRequest(query_type=query_type)
         return self._execute_service(
@@ -217,9 +402,10 @@ class DomesticAPI(BaseAPI):
             use_cont=True,
             cont_yn=cont_yn,
             cont_key=cont_key,
+            stream=stream,
         )
 
-    def get_deposit(self, cont_yn: str = "N", cont_key: str = None):
+    def get_deposit(self, cont_yn: str = "N", cont_key: str = None, stream: bool = False):
         return self._execute_service(
             self._get_trading_service,
             "get_deposit",
@@ -227,6 +413,7 @@ class DomesticAPI(BaseAPI):
             use_cont=True,
             cont_yn=cont_yn,
             cont_key=cont_key,
+            stream=stream,
         )
 
     def get_able_order_quantity(
@@ -236,6 +423,7 @@ class DomesticAPI(BaseAPI):
         order_type: str,  # 매매구분 (1:매도, 2:매수)
         cont_yn: str = "N",
         cont_key: str = None,
+        stream: bool = False,
     ) -> Dict[str, Any]:
         stock_code = 'A' + stock_code
         request = DomesticAbleOrderQuantityRequest(
@@ -248,6 +436,7 @@ class DomesticAPI(BaseAPI):
             use_cont=True,
             cont_yn=cont_yn,
             cont_key=cont_key,
+            stream=stream,
         )
 
     # ===== 시세 관련 =====
@@ -257,6 +446,7 @@ class DomesticAPI(BaseAPI):
         market_code: str = "J",  # 시장분류코드 (J:주식, E:ETF, EN:ETN)
         cont_yn: str = "N",
         cont_key: str = None,
+        stream: bool = False,
     ) -> Dict[str, Any]:
         request = DomesticQuoteRequest(market_type=market_code)
         return self._execute_service(
@@ -266,6 +456,7 @@ class DomesticAPI(BaseAPI):
             use_cont=True,
             cont_yn=cont_yn,
             cont_key=cont_key,
+            stream=stream,
         )
 
     def get_stock_price(
@@ -274,6 +465,7 @@ class DomesticAPI(BaseAPI):
         market_code: str = "J",  # 시장분류코드 (J:주식, E:ETF, EN:ETN)
         cont_yn: str = "N",
         cont_key: str = None,
+        stream: bool = False,
     ) -> Dict[str, Any]:
         request = DomesticQuoteRequest(market_type=market_code, stock_code=stock_code)
         return self._execute_service(
@@ -283,6 +475,7 @@ class DomesticAPI(BaseAPI):
             use_cont=True,
             cont_yn=cont_yn,
             cont_key=cont_key,
+            stream=stream,
         )
         
     def get_order_book(
@@ -291,6 +484,7 @@ class DomesticAPI(BaseAPI):
         market_code: str = "J",  # 시장분류코드 (J:주식, E:ETF, EN:ETN)
         cont_yn: str = "N",
         cont_key: str = None,
+        stream: bool = False,
     ) -> Dict[str, Any]:
         request = DomesticQuoteRequest(market_type=market_code, stock_code=stock_code)
         return self._execute_service(
@@ -300,6 +494,43 @@ class DomesticAPI(BaseAPI):
             use_cont=True,
             cont_yn=cont_yn,
             cont_key=cont_key,
+            stream=stream,
+        )
+
+    def get_stock_prices(
+        self,
+        codes: Iterable[str],
+        market_code: str = "J",  # 시장분류코드 (J:주식, E:ETF, EN:ETN)
+        max_workers: int = 8,
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        여러 종목 현재가 동시 조회
+
+        Returns:
+            {"results": {종목코드: 응답}, "errors": {종목코드: 예외}}
+        """
+        return self._fan_out(
+            lambda code: self.get_stock_price(code, market_code=market_code),
+            codes,
+            max_workers,
+        )
+
+    def get_order_books(
+        self,
+        codes: Iterable[str],
+        market_code: str = "J",  # 시장분류코드 (J:주식, E:ETF, EN:ETN)
+        max_workers: int = 8,
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        여러 종목 호가 동시 조회
+
+        Returns:
+            {"results": {종목코드: 응답}, "errors": {종목코드: 예외}}
+        """
+        return self._fan_out(
+            lambda code: self.get_order_book(code, market_code=market_code),
+            codes,
+            max_workers,
         )
 
     # ===== 차트 관련 =====
@@ -313,6 +544,7 @@ class DomesticAPI(BaseAPI):
         adjust_price_yn: str = "0",  # 수정주가 사용 여부 (0:사용, 1:미사용)
         cont_yn: str = "N",
         cont_key: str = None,
+        stream: bool = False,
     ) -> Dict[str, Any]:
         request = DomesticMinuteChartRequest(
             market_type=market_code,
@@ -328,6 +560,7 @@ class DomesticAPI(BaseAPI):
             use_cont=True,
             cont_yn=cont_yn,
             cont_key=cont_key,
+            stream=stream,
         )
 
     def get_daily_chart(
@@ -339,6 +572,7 @@ class DomesticAPI(BaseAPI):
         adjust_price_yn: str = "0",  # 수정주가 사용 여부 (0:사용, 1:미사용)
         cont_yn: str = "N",
         cont_key: str = None,
+        stream: bool = False,
     ) -> Dict[str, Any]:
         request = DomesticDailyChartRequest(
             market_type=market_code,
@@ -354,6 +588,7 @@ class DomesticAPI(BaseAPI):
             use_cont=True,
             cont_yn=cont_yn,
             cont_key=cont_key,
+            stream=stream,
         )
 
     def get_weekly_chart(
@@ -365,6 +600,7 @@ class DomesticAPI(BaseAPI):
         adjust_price_yn: str = "0",  # 수정주가 사용 여부 (0:사용, 1:미사용)
         cont_yn: str = "N",
         cont_key: str = None,
+        stream: bool = False,
     ) -> Dict[str, Any]:
         request = DomesticWeeklyChartRequest(
             market_type=market_code,
@@ -381,6 +617,7 @@ class DomesticAPI(BaseAPI):
             use_cont=True,
             cont_yn=cont_yn,
             cont_key=cont_key,
+            stream=stream,
         )
 
     def get_monthly_chart(
@@ -392,6 +629,7 @@ class DomesticAPI(BaseAPI):
         adjust_price_yn: str = "0",  # 수정주가 사용 여부 (0:사용, 1:미사용)
         cont_yn: str = "N",
         cont_key: str = None,
+        stream: bool = False,
     ) -> Dict[str, Any]:
         request = DomesticMonthlyChartRequest(
             market_type=market_code,
@@ -408,6 +646,7 @@ class DomesticAPI(BaseAPI):
             use_cont=True,
             cont_yn=cont_yn,
             cont_key=cont_key,
+            stream=stream,
         )
 
     def get_yearly_chart(
@@ -419,6 +658,7 @@ class DomesticAPI(BaseAPI):
         adjust_price_yn: str = "0",  # 수정주가 사용 여부 (0:사용, 1:미사용)
         cont_yn: str = "N",
         cont_key: str = None,
+        stream: bool = False,
     ) -> Dict[str, Any]:
         request = DomesticWeeklyChartRequest(
             market_type=market_code,
@@ -430,37 +670,42 @@ class DomesticAPI(BaseAPI):
         )
         return self._execute_service(
             self._get_chart_service,
-            "get_yearly_chart",
+            "get_weekly_chart",  # 주봉 엔드포인트에 기간 구분 코드(Y)로 조회
             request=request,
             use_cont=True,
             cont_yn=cont_yn,
             cont_key=cont_key,
+            stream=stream,
         )
 
 
 class OverseasAPI(BaseAPI):
+    REGION = "overseas"
     MARKET_CODE: Literal["NY", "NA", "AM"] # 미국 시장 코드 (NY:뉴욕, NA:나스닥, AM:아멕스)
     ORDER_TYPE: Literal["0", "1", "2"] # 미국 매매구분 (0:전체, 1:매도, 2:매수)
+    TRADING_SERVICE = OverseasTradingService
+    QUOTE_SERVICE = OverseasQuoteService
+    CHART_SERVICE = OverseasChartService
     
-    def __init__(self, auth: OAuth, log_level=logging.INFO):
-        super().__init__(auth, log_level)
+    def __init__(self, auth: OAuth, log_level=logging.INFO, **kwargs):
+        super().__init__(auth, log_level, **kwargs)
         self._trading_service = None
         self._quote_service = None
         self._chart_service = None
 
     def _get_trading_service(self):
         if self._trading_service is None:
-            self._trading_service = OverseasTradingService(auth=self.auth)
+            self._trading_service = self.TRADING_SERVICE(**self._service_kwargs())
         return self._trading_service
 
     def _get_quote_service(self):
         if self._quote_service is None:
-            self._quote_service = OverseasQuoteService(auth=self.auth)
+            self._quote_service = self.QUOTE_SERVICE(**self._service_kwargs())
         return self._quote_service
 
     def _get_chart_service(self):
         if self._chart_service is None:
-            self._chart_service = OverseasChartService(auth=self.auth)
+            self._chart_service = self.CHART_SERVICE(**self._service_kwargs())
         return self._chart_service
 
     # ===== 매매 관련 =====
@@ -535,10 +780,11 @@ class OverseasAPI(BaseAPI):
         won_fcurr_type: str = "1",  # 원화외화구분코드 (1:원화, 2:외화)
         cont_yn: str = "N",
         cont_key: str = None,
+        stream: bool = False,
     ) -> Dict[str, Any]:
         # TODO :: 날짜 조정 필요, 국가 기준 확립 필요
         if not start_date and not end_date:
-            now = datetime.now(pytz.timezone('Asia/Seoul'))
+            now = datetime.now(KST)
             start_date = (now - timedelta(days=0 if now.hour >= 22 else 1)).strftime("%Y%m%d")
             end_date = now.strftime("%Y%m%d")
 
@@ -561,6 +807,7 @@ class OverseasAPI(BaseAPI):
             use_cont=True,
             cont_yn=cont_yn,
             cont_key=cont_key,
+            stream=stream,
         )
 
 
@@ -572,6 +819,7 @@ class OverseasAPI(BaseAPI):
         decimal_balance_type: str = "1",  # 소수점잔고구분코드 (0:전체, 1:일반, 2:소수점)
         cont_yn: str = "N",
         cont_key: str = None,
+        stream: bool = False,
     ) -> Dict[str, Any]:
         request = OverseasBalanceRequest(
             balance_type=balance_type,
@@ -586,9 +834,10 @@ class OverseasAPI(BaseAPI):
             use_cont=True,
             cont_yn=cont_yn,
             cont_key=cont_key,
+            stream=stream,
         )
 
-    def get_deposit(self, cont_yn: str = "N", cont_key: str = None):
+    def get_deposit(self, cont_yn: str = "N", cont_key: str = None, stream: bool = False):
         return self._execute_service(
             self._get_trading_service,
             "get_deposit",
@@ -596,6 +845,7 @@ class OverseasAPI(BaseAPI):
             use_cont=True,
             cont_yn=cont_yn,
             cont_key=cont_key,
+            stream=stream,
         )
 
     def get_able_order_quantity(
@@ -606,6 +856,7 @@ class OverseasAPI(BaseAPI):
         won_fcurr_type: str = "2",  # 원화외화구분코드 (1:원화, 2:외화)
         cont_yn: str = "N",
         cont_key: str = None,
+        stream: bool = False,
     ) -> Dict[str, Any]:
         request = OverseasAbleOrderQuantityRequest(
             stock_code=stock_code,
@@ -620,6 +871,7 @@ class OverseasAPI(BaseAPI):
             use_cont=True,
             cont_yn=cont_yn,
             cont_key=cont_key,
+            stream=stream,
         )
 
     # ===== 시세 관련  =====
@@ -629,6 +881,7 @@ class OverseasAPI(BaseAPI):
         market_code: str = "NY",  # 시장 코드 (NY:뉴욕, NA:나스닥, AM:아멕스)
         cont_yn: str = "N",
         cont_key: str = None,
+        stream: bool = False,
     ) -> Dict[str, Any]:
         request = OverseasStockTickersRequest(market_code=market_code)
         return self._execute_service(
@@ -638,6 +891,7 @@ class OverseasAPI(BaseAPI):
             use_cont=True,
             cont_yn=cont_yn,
             cont_key=cont_key,
+            stream=stream,
         )
 
     def get_stock_price(
@@ -646,6 +900,7 @@ class OverseasAPI(BaseAPI):
         market_code: str = "FY",  # 시장 코드 (FY:뉴욕, FN:나스닥, FA:아멕스)
         cont_yn: str = "N",
         cont_key: str = None,
+        stream: bool = False,
     ) -> Dict[str, Any]:
         request = OverseasQuoteRequest(market_code=market_code, stock_code=stock_code)
         return self._execute_service(
@@ -655,6 +910,7 @@ class OverseasAPI(BaseAPI):
             use_cont=True,
             cont_yn=cont_yn,
             cont_key=cont_key,
+            stream=stream,
         )
         
     def get_order_book(
@@ -663,6 +919,7 @@ class OverseasAPI(BaseAPI):
         market_code: str = "FY",  # 시장 코드 (FY:뉴욕, FN:나스닥, FA:아멕스)
         cont_yn: str = "N",
         cont_key: str = None,
+        stream: bool = False,
     ) -> Dict[str, Any]:
         request = OverseasQuoteRequest(market_code=market_code, stock_code=stock_code)
         return self._execute_service(
@@ -672,6 +929,43 @@ class OverseasAPI(BaseAPI):
             use_cont=True,
             cont_yn=cont_yn,
             cont_key=cont_key,
+            stream=stream,
+        )
+
+    def get_stock_prices(
+        self,
+        codes: Iterable[str],
+        market_code: str = "FY",  # 시장 코드 (FY:뉴욕, FN:나스닥, FA:아멕스)
+        max_workers: int = 8,
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        여러 종목 현재가 동시 조회
+
+        Returns:
+            {"results": {종목코드: 응답}, "errors": {종목코드: 예외}}
+        """
+        return self._fan_out(
+            lambda code: self.get_stock_price(code, market_code=market_code),
+            codes,
+            max_workers,
+        )
+
+    def get_order_books(
+        self,
+        codes: Iterable[str],
+        market_code: str = "FY",  # 시장 코드 (FY:뉴욕, FN:나스닥, FA:아멕스)
+        max_workers: int = 8,
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        여러 종목 호가 동시 조회
+
+        Returns:
+            {"results": {종목코드: 응답}, "errors": {종목코드: 예외}}
+        """
+        return self._fan_out(
+            lambda code: self.get_order_book(code, market_code=market_code),
+            codes,
+            max_workers,
         )
 
     # ===== 차트 관련 =====
@@ -688,6 +982,7 @@ class OverseasAPI(BaseAPI):
         hour_class_code: str = "0",  # 입력시간구분코드 (항상 "0" 입력)
         cont_yn: str = "N",
         cont_key: str = None,
+        stream: bool = False,
     ) -> Dict[str, Any]:
         request = OverseasMinuteChartRequest(
             market_type=market_code,
@@ -706,6 +1001,7 @@ class OverseasAPI(BaseAPI):
             use_cont=True,
             cont_yn=cont_yn,
             cont_key=cont_key,
+            stream=stream,
         )
 
     def get_daily_chart(
@@ -717,6 +1013,7 @@ class OverseasAPI(BaseAPI):
         adjust_price_yn: str = "1",  # 수정주가 사용 여부 (0:미사용, 1:사용)
         cont_yn: str = "N",
         cont_key: str = None,
+        stream: bool = False,
     ) -> Dict[str, Any]:
         request = OverseasDailyChartRequest(
             adjust_price_yn=adjust_price_yn,
@@ -732,6 +1029,7 @@ class OverseasAPI(BaseAPI):
             use_cont=True,
             cont_yn=cont_yn,
             cont_key=cont_key,
+            stream=stream,
         )
 
     def get_weekly_chart(
@@ -743,6 +1041,7 @@ class OverseasAPI(BaseAPI):
         use_adjust_price: str = "1",  # 수정주가 사용 여부 (0:미사용, 1:사용)
         cont_yn: str = "N",
         cont_key: str = None,
+        stream: bool = False,
     ) -> Dict[str, Any]:
         request = OverseasWeeklyChartRequest(
             market_type=market_code,
@@ -759,6 +1058,7 @@ class OverseasAPI(BaseAPI):
             use_cont=True,
             cont_yn=cont_yn,
             cont_key=cont_key,
+            stream=stream,
         )
 
     def get_monthly_chart(
@@ -770,6 +1070,7 @@ class OverseasAPI(BaseAPI):
         use_adjust_price: str = "1",  # 수정주가 사용 여부 (0:미사용, 1:사용)
         cont_yn: str = "N",
         cont_key: str = None,
+        stream: bool = False,
     ) -> Dict[str, Any]:
         request = OverseasWeeklyChartRequest(
             market_type=market_code,
@@ -786,6 +1087,7 @@ class OverseasAPI(BaseAPI):
             use_cont=True,
             cont_yn=cont_yn,
             cont_key=cont_key,
+            stream=stream,
         )
 
     def get_yearly_chart(
@@ -797,6 +1099,7 @@ class OverseasAPI(BaseAPI):
         use_adjust_price: str = "1",  # 수정주가 사용 여부 (0:미사용, 1:사용)
         cont_yn: str = "N",
         cont_key: str = None,
+        stream: bool = False,
     ) -> Dict[str, Any]:
         request = OverseasWeeklyChartRequest(
             market_type=market_code,
@@ -808,28 +1111,33 @@ class OverseasAPI(BaseAPI):
         )
         return self._execute_service(
             self._get_chart_service,
-            "get_yearly_chart",
+            "get_weekly_chart",  # 주봉 엔드포인트에 기간 구분 코드(Y)로 조회
             request=request,
             use_cont=True,
             cont_yn=cont_yn,
             cont_key=cont_key,
+            stream=stream,
         )
 
 
 class DomesticFuturesAPI(BaseAPI):
-    def __init__(self, auth: OAuth, log_level=logging.INFO):
-        super().__init__(auth, log_level)
+    REGION = "domestic_futures"
+    TRADING_SERVICE = DomesticFuturesTradingService
+
+    def __init__(self, auth: OAuth, log_level=logging.INFO, **kwargs):
+        super().__init__(auth, log_level, **kwargs)
         self._trading_service = None
 
     def _get_trading_service(self):
         if self._trading_service is None:
-            self._trading_service = DomesticFuturesTradingService(auth=self.auth)
+            self._trading_service = self.TRADING_SERVICE(**self._service_kwargs())
         return self._trading_service
 
     def get_futures_balance(
         self,
         cont_yn: str = "N",
         cont_key: str = None,
+        stream: bool = False,
     ) -> Dict[str, Any]:
         """국내 선물옵션 잔고 조회"""
         request = DomesticFuturesBalanceRequest()
@@ -840,4 +1148,5 @@ class DomesticFuturesAPI(BaseAPI):
             use_cont=True,
             cont_yn=cont_yn,
             cont_key=cont_key,
+            stream=stream,
         )
@@ -0,0 +1,265 @@
+import logging
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import timedelta
+from typing import Any, Callable, Deque, Dict, Iterable, List, Optional, Tuple, Union
+
+from .chartstore import ChartStore, _format, _parse
+
+# 작업 단위로 나눌 기간 (일). None이면 빠진 구간 하나를 한 작업으로 처리
+DEFAULT_CHUNK_DAYS = {"minute": 1, "daily": 365, "weekly": 365 * 5, "monthly": None, "yearly": None}
+
+
+@dataclass
+class WorkUnit:
+    """차트 수집 작업 단위 (ChartStore.update 한 번)"""
+
+    region: str
+    symbol: str
+    period: str
+    start_date: str  # YYYYMMDD
+    end_date: str  # YYYYMMDD
+    time_interval: Optional[str] = None  # 분봉 간격 (60*N: N분)
+    chart_kwargs: Dict[str, Any] = field(default_factory=dict)  # 차트 조회 메서드 추가 인자 (market_code 등)
+
+    @property
+    def key(self) -> Tuple[str, str, str]:
+        return (self.region, self.symbol, ChartStore.interval_key(self.period, self.time_interval))
+
+
+@dataclass
+class BackfillProgress:
+    """수집 진행 상황 (처리량/남은 시간은 완료된 작업 기준)"""
+
+    total_units: int
+    done_units: int = 0
+    failed_units: int = 0
+    pages: int = 0
+    bars: int = 0
+    started_at: float = field(default_factory=time.monotonic)
+    finished_at: Optional[float] = None
+    errors: List[Tuple[WorkUnit, BaseException]] = field(default_factory=list)
+
+    @property
+    def elapsed(self) -> float:
+        return (self.finished_at or time.monotonic()) - self.started_at
+
+    @property
+    def remaining_units(self) -> int:
+        return self.total_units - self.done_units - self.failed_units
+
+    @property
+    def units_per_sec(self) -> float:
+        elapsed = self.elapsed
+        return (self.done_units + self.failed_units) / elapsed if elapsed > 0 else 0.0
+
+    @property
+    def eta(self) -> Optional[float]:
+        """남은 예상 시간 (초). 완료된 작업이 없으면 None"""
+        rate = self.units_per_sec
+        return self.remaining_units / rate if rate > 0 else None
+
+    def to_dict(self) -> Dict[str, Any]:
+        elapsed = self.elapsed
+        eta = self.eta
+        return {
+            "total_units": self.total_units,
+            "done_units": self.done_units,
+            "failed_units": self.failed_units,
+            "pages": self.pages,
+            "bars": self.bars,
+            "elapsed": round(elapsed, 3),
+            "units_per_sec": round(self.units_per_sec, 3),
+            "pages_per_sec": round(self.pages / elapsed, 3) if elapsed > 0 else 0.0,
+            "bars_per_sec": round(self.bars / elapsed, 1) if elapsed > 0 else 0.0,
+            "eta": round(eta, 1) if eta is not None else None,
+        }
+
+    def __str__(self):
+        eta = self.eta
+        return (
+            f"{self.done_units + self.failed_units}/{self.total_units} units "
+            f"({self.failed_units} failed), {self.pages} pages, {self.bars} bars, "
+            f"{self.units_per_sec:.2f} units/s, ETA {'-' if eta is None else f'{eta:.0f}s'}"
+        )
+
+
+class BackfillScheduler:
+    """
+    여러 종목 차트 일괄 수집
+
+    (종목 x 주기 x 기간)을 ChartStore 기준 빠진 구간만 작업 단위로 나누고, 제한된 스레드 풀에서
+    종목을 번갈아 실행한다. 같은 종목/주기의 작업은 한 번에 하나만 실행되고 나머지 워커는 다른
+    종목을 처리하므로, 연속 조회 대기 중에도 차트 유량 제한(RateLimiter "chart")을 다른 종목이 사용한다.
+
+    각 작업은 봉과 조회 구간을 한 트랜잭션으로 저장하므로 ChartStore가 체크포인트 역할을 한다.
+    중단된 수집은 같은 인자로 run()을 다시 실행하면 완료된 구간을 건너뛰고 이어서 진행한다.
+
+    사용 예:
+        store = ChartStore(dbfi)
+        scheduler = BackfillScheduler(store, max_workers=4, on_progress=print)
+        progress = scheduler.run(codes, periods=["daily", "weekly"], start_date="20150101")
+        progress.to_dict()  # 처리량, 실패 수 등
+
+    Args:
+        store: ChartStore (store.dbfi로 조회)
+        max_workers: 동시에 실행할 작업 수
+        chunk_days: 주기별 작업 단위 기간 (DEFAULT_CHUNK_DAYS 중 바꿀 항목)
+        on_progress: 작업이 끝날 때마다 BackfillProgress를 받는 함수
+        log_interval: 진행 상황 INFO 로그 간격 (초)
+    """
+
+    def __init__(
+        self,
+        store: ChartStore,
+        max_workers: int = 4,
+        chunk_days: Optional[Dict[str, Optional[int]]] = None,
+        on_progress: Optional[Callable[[BackfillProgress], Any]] = None,
+        log_interval: float = 30.0,
+    ):
+        self.store = store
+        self.max_workers = max(1, max_workers)
+        self.chunk_days = {**DEFAULT_CHUNK_DAYS, **(chunk_days or {})}
+        self.on_progress = on_progress
+        self.log_interval = log_interval
+        self.logger = logging.getLogger(__name__)
+        self.progress: Optional[BackfillProgress] = None
+        self._stop = threading.Event()
+
+    def plan(
+        self,
+        symbols: Iterable[str],
+        periods: Union[str, Iterable[str]] = "daily",
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        region: str = "domestic",
+        time_interval: Optional[str] = None,
+        **chart_kwargs,
+    ) -> List[WorkUnit]:
+        """
+        저장소에 없는 구간만 작업 단위로 분할 (종목 순서 유지)
+
+        start_date를 생략하면 종목/주기별로 기록된 첫 조회 구간부터 이어서 받는다
+        (기록이 없는 종목이 있으면 ValueError).
+        """
+        periods = [periods] if isinstance(periods, str) else list(periods)
+        units = []
+        for symbol in dict.fromkeys(symbols):
+            for period in periods:
+                start = self.store.resolve_start(region, symbol, period, start_date, time_interval)
+                for gap_start, gap_end in self.store.missing_ranges(
+                    region, symbol, period, start, end_date, time_interval
+                ):
+                    for chunk_start, chunk_end in self._split(period, gap_start, gap_end):
+                        units.append(
+                            WorkUnit(region, symbol, period, chunk_start, chunk_end, time_interval, dict(chart_kwargs))
+                        )
+        return units
+
+    def _split(self, period: str, start_date: str, end_date: str) -> List[Tuple[str, str]]:
+        start, end = _parse(start_date), _parse(end_date)
+        days = self.chunk_days.get(period)
+        if not days:
+            return [(start_date, end_date)]
+        chunks = []
+        pending = None  # 앞 작업이 없을 때 다음 작업에 붙일 주말 시작일
+        while start <= end:
+            chunk_end = min(start + timedelta(days=days - 1), end)
+            # 분봉은 거래일별로 조회하므로 주말만 있는 작업은 만들지 않고 인접 작업에 붙여
+            # 조회 구간 기록이 주말마다 끊기지 않도록 함
+            if period != "minute" or any(
+                (start + timedelta(days=offset)).weekday() < 5 for offset in range((chunk_end - start).days + 1)
+            ):
+                chunks.append((_format(pending or start), _format(chunk_end)))
+                pending = None
+            elif chunks:
+                chunks[-1] = (chunks[-1][0], _format(chunk_end))
+            elif pending is None:
+                pending = start
+            start = chunk_end + timedelta(days=1)
+        return chunks
+
+    def run(
+        self,
+        symbols: Iterable[str],
+        periods: Union[str, Iterable[str]] = "daily",
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        region: str = "domestic",
+        time_interval: Optional[str] = None,
+        **chart_kwargs,
+    ) -> BackfillProgress:
+        """plan()으로 나눈 작업을 실행하고 최종 진행 상황을 반환"""
+        units = self.plan(symbols, periods, start_date, end_date, region, time_interval, **chart_kwargs)
+        return self.run_units(units)
+
+    def run_units(self, units: Iterable[WorkUnit]) -> BackfillProgress:
+        """작업 단위 목록 실행 (실패한 작업은 progress.errors에 기록하고 계속 진행)"""
+        queues: "OrderedDict[Tuple[str, str, str], Deque[WorkUnit]]" = OrderedDict()
+        for unit in units:
+            queues.setdefault(unit.key, deque()).append(unit)
+        # 실행 가능한 키를 순환하며 종목을 번갈아 처리 (키마다 동시에 하나만 실행)
+        ready = deque(queues)
+        lock = threading.Lock()
+        progress = self.progress = BackfillProgress(total_units=sum(len(queue) for queue in queues.values()))
+        last_log = [time.monotonic()]
+        self._stop.clear()
+
+        def worker():
+            while not self._stop.is_set():
+                with lock:
+                    if not ready:
+                        # 남은 키는 모두 다른 워커가 실행 중
+                        return
+                    key = ready.popleft()
+                    unit = queues[key].popleft()
+                result, error = None, None
+                try:
+                    result = self.store.update(
+                        unit.region,
+                        unit.symbol,
+                        unit.period,
+                        unit.start_date,
+                        unit.end_date,
+                        unit.time_interval,
+                        **unit.chart_kwargs,
+                    )
+                except Exception as e:
+                    self.logger.warning(
+                        "차트 수집 실패: %s %s %s~%s (%s)", unit.symbol, unit.period, unit.start_date, unit.end_date, e
+                    )
+                    error = e
+                with lock:
+                    if result is None:
+                        progress.failed_units += 1
+                        progress.errors.append((unit, error))
+                    else:
+                        progress.done_units += 1
+                        progress.pages += result["pages"]
+                        progress.bars += result["bars"]
+                    if queues[key]:
+                        ready.append(key)
+                    now = time.monotonic()
+                    log_due = now - last_log[0] >= self.log_interval
+                    if log_due:
+                        last_log[0] = now
+                if log_due:
+                    self.logger.info("차트 수집 진행: %s", progress)
+                if self.on_progress is not None:
+                    self.on_progress(progress)
+
+        if progress.total_units:
+            with ThreadPoolExecutor(max_workers=min(self.max_workers, len(queues))) as executor:
+                futures = [executor.submit(worker) for _ in range(min(self.max_workers, len(queues)))]
+                for future in futures:
+                    future.result()
+        progress.finished_at = time.monotonic()
+        self.logger.info("차트 수집 완료: %s", progress)
+        return progress
+
+    def stop(self):
+        """진행 중인 작업이 끝나면 중단 (다시 run()하면 이어서 진행)"""
+        self._stop.set()
@@ -0,0 +1,254 @@
+"""
+차트 응답을 열 단위 NumPy 배열로 변환
+
+연속 조회 페이지의 행(dict)을 필드별 배열로 바로 옮기므로 행 단위 파이썬 객체를 따로 만들지 않는다.
+1분봉 1년치(약 10만 행)는 약 5MB다.
+
+사용 예:
+    bars = dbfi.get_chart_bars(region="domestic", period="minute", stock_code="005930", start_date="20240105")
+    returns = np.diff(np.log(bars.close))
+    df = bars.to_pandas()
+"""
+from typing import Any, AsyncIterable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError as e:
+    raise ImportError("ChartBars를 사용하려면 numpy가 필요합니다: pip install pydbfi[numpy]") from e
+
+# ChartBars 열 -> 응답 필드명 (DomesticChartService/OverseasChartService의 Out 블록)
+DEFAULT_CHART_FIELDS = {
+    "date": "Date",  # 일자 (YYYYMMDD)
+    "time": "Hour",  # 시간 (HHMMSS, 일/주/월봉은 없거나 000000)
+    "open": "Oprc",
+    "high": "Hprc",
+    "low": "Lprc",
+    "close": "Prpr",
+    "volume": "Cntg_Vol",
+}
+
+# 지역별 거래소 시간대 (timestamp는 거래소 현지 시각 기준)
+CHART_TIMEZONES = {"domestic": "Asia/Seoul", "overseas": "America/New_York"}
+
+COLUMNS = ("timestamp", "open", "high", "low", "close", "volume")
+_PRICE_COLUMNS = ("open", "high", "low", "close")
+
+
+def _numeric(values: List[Any], dtype) -> "np.ndarray":
+    try:
+        return np.array(values, dtype=dtype)
+    except (TypeError, ValueError):
+        # 빈 문자열/None이 섞인 페이지만 느린 경로로 변환
+        fill = np.nan if dtype == np.float64 else 0
+        return np.array([fill if value in (None, "") else float(value) for value in values], dtype=np.float64).astype(dtype)
+
+
+def _required(values: List[Any]) -> Tuple["np.ndarray", Optional["np.ndarray"]]:
+    """일자/시간처럼 0으로 채울 수 없는 열 변환. 빈 값이 있으면 유효 행 마스크를 함께 반환"""
+    try:
+        return np.array(values, dtype=np.int64), None
+    except (TypeError, ValueError):
+        valid = np.array([value not in (None, "") for value in values], dtype=bool)
+        converted = np.array([float(value) if ok else 0 for value, ok in zip(values, valid)], dtype=np.float64)
+        return converted.astype(np.int64), valid
+
+
+def to_timestamps(dates: "np.ndarray", times: Optional["np.ndarray"] = None) -> "np.ndarray":
+    """YYYYMMDD, HHMMSS 정수 배열 -> 1970-01-01 기준 초 (int64, 시간대 없는 현지 시각)"""
+    year, month_day = np.divmod(dates.astype(np.int64), 10000)
+    month, day = np.divmod(month_day, 100)
+    months = (year - 1970) * 12 + (month - 1)
+    days = months.astype("datetime64[M]").astype("datetime64[D]").astype(np.int64) + (day - 1)
+    seconds = days * 86400
+    if times is not None:
+        hour, minute_second = np.divmod(times.astype(np.int64), 10000)
+        minute, second = np.divmod(minute_second, 100)
+        seconds += hour * 3600 + minute * 60 + second
+    return seconds
+
+
+class ChartBars:
+    """
+    OHLCV 봉 배열 (timestamp 오름차순, 중복 없음)
+
+    Attributes:
+        timestamp: 1970-01-01 기준 초 (int64, 거래소 현지 시각)
+        open, high, low, close: 가격 (float64)
+        volume: 거래량 (int64)
+        tz: 거래소 시간대 (to_pandas에서 사용, 예: Asia/Seoul)
+    """
+
+    __slots__ = COLUMNS + ("tz",)
+
+    def __init__(
+        self,
+        timestamp: "np.ndarray",
+        open: "np.ndarray",
+        high: "np.ndarray",
+        low: "np.ndarray",
+        close: "np.ndarray",
+        volume: "np.ndarray",
+        tz: Optional[str] = None,
+    ):
+        self.timestamp = np.ascontiguousarray(timestamp, dtype=np.int64)
+        self.open = np.ascontiguousarray(open, dtype=np.float64)
+        self.high = np.ascontiguousarray(high, dtype=np.float64)
+        self.low = np.ascontiguousarray(low, dtype=np.float64)
+        self.close = np.ascontiguousarray(close, dtype=np.float64)
+        self.volume = np.ascontiguousarray(volume, dtype=np.int64)
+        self.tz = tz
+
+    @classmethod
+    def empty(cls, tz: Optional[str] = None) -> "ChartBars":
+        return cls(*(np.empty(0) for _ in COLUMNS), tz=tz)
+
+    @classmethod
+    def from_rows(
+        cls, rows: Sequence[Dict[str, Any]], fields: Optional[Dict[str, str]] = None, tz: Optional[str] = None
+    ) -> "ChartBars":
+        """
+        응답 한 페이지의 행 목록을 변환 (정렬/중복 제거는 하지 않음, from_pages/concat 참고)
+
+        일자가 비어 있는 행은 제외한다. 시간은 페이지의 모든 행이 비어 있으면(일/주/월봉) 00:00:00으로 보고,
+        일부만 비어 있으면 해당 행을 제외한다. (0으로 채우면 0년 또는 자정 봉이 되어 정렬/중복 제거를 깨뜨림)
+
+        Args:
+            rows: Out 블록 행 목록
+            fields: DEFAULT_CHART_FIELDS 중 바꿀 항목 (예: {"volume": "AcmlVol"})
+            tz: 거래소 시간대
+        """
+        if not rows:
+            return cls.empty(tz)
+        fields = {**DEFAULT_CHART_FIELDS, **fields} if fields else DEFAULT_CHART_FIELDS
+        time_key = fields.get("time")
+        dates, valid = _required([row.get(fields["date"]) for row in rows])
+        valid = dates > 0 if valid is None else valid & (dates > 0)
+        times = None
+        if time_key and time_key in rows[0]:
+            times, has_time = _required([row.get(time_key) for row in rows])
+            if has_time is not None:
+                if has_time.any():
+                    valid &= has_time
+                else:
+                    times = None
+        columns = {name: _numeric([row.get(fields[name]) for row in rows], np.float64) for name in _PRICE_COLUMNS}
+        volume = _numeric([row.get(fields["volume"]) for row in rows], np.int64)
+        bars = cls(to_timestamps(dates, times), volume=volume, tz=tz, **columns)
+        return bars if valid.all() else bars[valid]
+
+    @classmethod
+    def from_pages(
+        cls,
+        pages: Iterable[Dict[str, Any]],
+        fields: Optional[Dict[str, str]] = None,
+        out_key: str = "Out",
+        tz: Optional[str] = None,
+    ) -> "ChartBars":
+        """
+        연속 조회 페이지(iter_pages 결과, 페이지 list 또는 단일 응답 dict)를 한 배열로 변환
+
+        페이지는 도착하는 대로 배열로 바꾸므로 전체 응답 dict를 모아 두지 않는다.
+        """
+        if isinstance(pages, dict):
+            pages = [pages]
+        chunks = [cls.from_rows(page.get(out_key) or (), fields, tz) for page in pages]
+        return cls.concat(chunks, tz=tz)
+
+    @classmethod
+    async def afrom_pages(
+        cls,
+        pages: AsyncIterable[Dict[str, Any]],
+        fields: Optional[Dict[str, str]] = None,
+        out_key: str = "Out",
+        tz: Optional[str] = None,
+    ) -> "ChartBars":
+        """from_pages의 비동기 버전 (AsyncDBFI의 iter_pages 결과)"""
+        chunks = [cls.from_rows(page.get(out_key) or (), fields, tz) async for page in pages]
+        return cls.concat(chunks, tz=tz)
+
+    @classmethod
+    def concat(cls, chunks: Sequence["ChartBars"], tz: Optional[str] = None) -> "ChartBars":
+        """
+        여러 배열을 합쳐 timestamp 오름차순으로 정렬
+
+        같은 timestamp가 여러 번 나오면 나중 배열의 값을 사용한다 (새로 받은 봉으로 갱신).
+        """
+        chunks = [chunk for chunk in chunks if len(chunk)]
+        if tz is None:
+            tz = next((chunk.tz for chunk in chunks if chunk.tz), None)
+        if not chunks:
+            return cls.empty(tz)
+        merged = {name: np.concatenate([getattr(chunk, name) for chunk in chunks]) for name in COLUMNS}
+        order = np.argsort(merged["timestamp"], kind="stable")
+        timestamp = merged["timestamp"][order]
+        # 정렬 후 중복 구간의 마지막(나중에 들어온) 값만 남김
+        keep = np.empty(len(timestamp), dtype=bool)
+        keep[:-1] = timestamp[1:] != timestamp[:-1]
+        keep[-1] = True
+        index = order[keep]
+        return cls(**{name: merged[name][index] for name in COLUMNS}, tz=tz)
+
+    def __len__(self) -> int:
+        return len(self.timestamp)
+
+    def __getitem__(self, key):
+        """열 이름이면 배열, 정수/슬라이스/마스크이면 해당 구간의 ChartBars"""
+        if isinstance(key, str):
+            if key not in COLUMNS:
+                raise KeyError(key)
+            return getattr(self, key)
+        if isinstance(key, (int, np.integer)):
+            key = slice(key, key + 1 or None)
+        return ChartBars(**{name: getattr(self, name)[key] for name in COLUMNS}, tz=self.tz)
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, ChartBars):
+            return NotImplemented
+        return all(np.array_equal(getattr(self, name), getattr(other, name), equal_nan=True) for name in COLUMNS)
+
+    def __repr__(self):
+        if not len(self):
+            return f"ChartBars(0 bars, tz={self.tz!r})"
+        first, last = self.datetime[[0, -1]]
+        return f"ChartBars({len(self)} bars, {first} ~ {last}, tz={self.tz!r})"
+
+    @property
+    def datetime(self) -> "np.ndarray":
+        """timestamp를 datetime64[s]로 본 배열 (복사 없음)"""
+        return self.timestamp.view("datetime64[s]")
+
+    @property
+    def nbytes(self) -> int:
+        return sum(getattr(self, name).nbytes for name in COLUMNS)
+
+    def between(self, start: Optional[int] = None, end: Optional[int] = None) -> "ChartBars":
+        """start <= timestamp < end 구간 (정렬되어 있으므로 이진 탐색)"""
+        lo = 0 if start is None else int(np.searchsorted(self.timestamp, start, side="left"))
+        hi = len(self) if end is None else int(np.searchsorted(self.timestamp, end, side="left"))
+        return self[lo:hi]
+
+    def resample(self, rule, **kwargs) -> "ChartBars":
+        """상위 주기 봉 생성 (resample.resample 참고, 예: bars.resample("5min"), bars.resample("weekly"))"""
+        from .resample import resample
+
+        return resample(self, rule, **kwargs)
+
+    def to_dict(self) -> Dict[str, "np.ndarray"]:
+        return {name: getattr(self, name) for name in COLUMNS}
+
+    def to_pandas(self):
+        """timestamp를 시간대가 지정된 DatetimeIndex로 하는 DataFrame (pandas 필요)"""
+        try:
+            import pandas as pd
+        except ImportError as e:
+            raise ImportError("to_pandas를 사용하려면 pandas가 필요합니다: pip install pydbfi[pandas]") from e
+        index = pd.DatetimeIndex(self.datetime, name="timestamp")
+        if self.tz:
+            index = index.tz_localize(self.tz)
+        return pd.DataFrame({name: getattr(self, name) for name in COLUMNS[1:]}, index=index, copy=False)
+
+    def to_arrow(self, symbol: Optional[str] = None, columns: Optional[Sequence[str]] = None):
+        """symbol 열을 포함한 pyarrow.Table로 변환 (pyarrow 필요, export.chart_batch 참고)"""
+        from .export import chart_batch, chart_schema, to_table
+
+        return to_table([chart_batch(self, symbol, columns)], chart_schema(self.tz, columns))
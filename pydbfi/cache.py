@@ -0,0 +1,159 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional
+
+
+class _InFlight:
+    """진행 중인 조회 결과를 기다리는 호출자들이 공유하는 슬롯"""
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.result = None
+        self.error: Optional[BaseException] = None
+
+
+class _LeaderCancelled(Exception):
+    """비동기 조회를 수행하던 코루틴이 취소되었음을 대기 중인 코루틴에 알림"""
+
+
+class QuoteCache:
+    """
+    시세 조회 결과 TTL 캐시 (LRU 제거, 동시 요청 병합)
+
+    같은 키를 동시에 조회하는 호출자들은 하나의 HTTP 요청 결과를 공유한다.
+    캐시된 응답은 호출자 간에 공유되므로 반환값을 수정하지 않아야 한다.
+
+    사용 예:
+        cache = QuoteCache(ttl=0.5, max_size=2048)
+        dbfi = DBFI(app_key="...", app_secret_key="...", quote_cache=cache)
+        cache.stats()
+
+    Args:
+        ttl: 캐시 유지 시간 (초)
+        max_size: 최대 보관 항목 수 (초과 시 가장 오래 사용되지 않은 항목 제거)
+    """
+
+    def __init__(self, ttl: float = 1.0, max_size: int = 1024):
+        self.ttl = ttl
+        self.max_size = max_size
+        self._entries: "OrderedDict[Hashable, tuple]" = OrderedDict()
+        self._inflight: Dict[Hashable, _InFlight] = {}
+        self._ainflight: Dict[Hashable, "asyncio.Future"] = {}
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "coalesced": 0, "evictions": 0}
+
+    def _lookup(self, key: Hashable):
+        """락을 잡은 상태에서 호출. 유효한 항목이 있으면 (True, 값)"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return False, None
+        if time.monotonic() >= entry[0]:
+            del self._entries[key]
+            return False, None
+        self._entries.move_to_end(key)
+        self._stats["hits"] += 1
+        return True, entry[1]
+
+    def _store(self, key: Hashable, value: Any):
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self._stats["evictions"] += 1
+
+    def get_or_fetch(self, key: Hashable, fetch: Callable[[], Any]) -> Any:
+        """캐시된 값을 반환하고, 없으면 fetch()를 한 번만 실행하여 결과를 공유"""
+        with self._lock:
+            found, value = self._lookup(key)
+            if found:
+                return value
+            inflight = self._inflight.get(key)
+            if inflight is not None:
+                self._stats["coalesced"] += 1
+                leader = False
+            else:
+                inflight = self._inflight[key] = _InFlight()
+                self._stats["misses"] += 1
+                leader = True
+
+        if not leader:
+            inflight.event.wait()
+            if inflight.error is not None:
+                raise inflight.error
+            return inflight.result
+
+        try:
+            inflight.result = fetch()
+            self._store(key, inflight.result)
+            return inflight.result
+        except BaseException as e:
+            # 실패한 결과는 캐시하지 않고 대기 중인 호출자에게만 전달
+            inflight.error = e
+            raise
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+            inflight.event.set()
+
+    async def aget_or_fetch(self, key: Hashable, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        get_or_fetch의 비동기 버전 (같은 이벤트 루프의 코루틴 간 요청 병합)
+
+        조회 중인 코루틴이 취소되면 대기 중인 코루틴 중 하나가 이어서 조회한다.
+        """
+        import asyncio  # 동기 클라이언트만 사용하는 경우 불러오지 않음
+
+        while True:
+            with self._lock:
+                found, value = self._lookup(key)
+                if found:
+                    return value
+                future = self._ainflight.get(key)
+                leader = future is None
+                if leader:
+                    future = self._ainflight[key] = asyncio.get_running_loop().create_future()
+                    self._stats["misses"] += 1
+                else:
+                    self._stats["coalesced"] += 1
+
+            if leader:
+                break
+            try:
+                return await asyncio.shield(future)
+            except _LeaderCancelled:
+                # 조회하던 코루틴이 취소됨 -> 다시 시도하여 먼저 도착한 코루틴이 조회
+                continue
+
+        try:
+            result = await fetch()
+            self._store(key, result)
+            future.set_result(result)
+            return result
+        except asyncio.CancelledError:
+            # future.cancel()은 대기 중인 코루틴까지 취소하므로 재시도 신호만 전달
+            future.set_exception(_LeaderCancelled())
+            future.exception()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            # 대기 중인 코루틴이 없어도 경고가 남지 않도록 예외 확인 처리
+            future.exception()
+            raise
+        finally:
+            with self._lock:
+                self._ainflight.pop(key, None)
+
+    def invalidate(self, key: Optional[Hashable] = None):
+        """key 항목 제거 (None이면 전체 제거)"""
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(key, None)
+
+    def stats(self) -> Dict[str, int]:
+        """hits, misses, coalesced, evictions, size"""
+        with self._lock:
+            return {**self._stats, "size": len(self._entries)}
@@ -0,0 +1,353 @@
+import inspect
+import logging
+import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from .api import CHART_METHODS
+from .bars import CHART_TIMEZONES, ChartBars
+
+try:
+    from zoneinfo import ZoneInfo
+except ImportError:  # Python 3.8 이하
+    ZoneInfo = None
+
+# zoneinfo가 없을 때 사용할 거래소 표준시 (일광절약시간 미반영)
+_FIXED_TIMEZONES = {"domestic": timezone(timedelta(hours=9)), "overseas": timezone(timedelta(hours=-5))}
+
+_EPOCH = date(1970, 1, 1)
+_DAY = timedelta(days=1)
+
+
+def _parse(value) -> date:
+    if isinstance(value, date):
+        return value
+    return datetime.strptime(str(value), "%Y%m%d").date()
+
+
+def _format(value: date) -> str:
+    return value.strftime("%Y%m%d")
+
+
+def _epoch(value: date) -> int:
+    return (value - _EPOCH).days * 86400
+
+
+def period_start(period: str, value: date) -> date:
+    """value가 속한 봉의 시작일 (주봉: 월요일, 월봉: 1일, 년봉: 1월 1일)"""
+    if period == "weekly":
+        return value - timedelta(days=value.weekday())
+    if period == "monthly":
+        return value.replace(day=1)
+    if period == "yearly":
+        return value.replace(month=1, day=1)
+    return value
+
+
+def merge_ranges(ranges: List[Tuple[date, date]]) -> List[Tuple[date, date]]:
+    """겹치거나 이어진 날짜 구간 병합"""
+    merged: List[List[date]] = []
+    for start, end in sorted(ranges):
+        if merged and start <= merged[-1][1] + _DAY:
+            merged[-1][1] = max(merged[-1][1], end)
+        else:
+            merged.append([start, end])
+    return [(start, end) for start, end in merged]
+
+
+class ChartStore:
+    """
+    종목/주기별 차트 로컬 저장소 (SQLite)
+
+    받은 봉과 함께 "조회 완료한 날짜 구간"을 기록하여 다음 조회 때 빠진 구간만 API로 받는다.
+    휴장일처럼 봉이 없는 날도 조회한 구간이면 다시 요청하지 않는다. 아직 끝나지 않은 봉
+    (거래소 현지 기준 오늘, 이번 주/월/년)은 구간 기록에서 빼므로 매번 다시 받아 갱신한다.
+
+    사용 예:
+        store = ChartStore(dbfi)
+        bars = store.get_bars("domestic", "005930", "daily", start_date="20150101")  # 처음: 전체 조회
+        bars = store.get_bars("domestic", "005930", "daily", start_date="20150101")  # 이후: 마지막 봉부터만 조회
+        bars = store.get_bars("domestic", "005930", "minute", start_date="20240102", end_date="20240105", time_interval="60")
+
+    Args:
+        dbfi: DBFI 인스턴스 (동기 클라이언트)
+        path: 저장 파일 경로 (None이면 ~/.cache/pydbfi/charts.sqlite3)
+        fields: 응답 필드명 매핑 변경 (bars.DEFAULT_CHART_FIELDS 참고)
+    """
+
+    def __init__(self, dbfi, path: Optional[str] = None, fields: Optional[Dict[str, str]] = None):
+        self.dbfi = dbfi
+        self.path = os.path.expanduser(path or os.path.join("~", ".cache", "pydbfi", "charts.sqlite3"))
+        self.fields = fields
+        self.logger = logging.getLogger(__name__)
+        # 같은 종목/주기를 동시에 갱신하지 않도록 키별 잠금
+        self._locks: Dict[Tuple[str, str, str], threading.Lock] = {}
+        self._locks_guard = threading.Lock()
+
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        with self._connect() as conn:
+            # 여러 스레드/프로세스의 동시 읽기 허용
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS bars ("
+                "region TEXT NOT NULL, symbol TEXT NOT NULL, interval TEXT NOT NULL, ts INTEGER NOT NULL, "
+                "open REAL, high REAL, low REAL, close REAL, volume INTEGER, "
+                "PRIMARY KEY (region, symbol, interval, ts)) WITHOUT ROWID"
+            )
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS coverage ("
+                "region TEXT NOT NULL, symbol TEXT NOT NULL, interval TEXT NOT NULL, "
+                "start_date TEXT NOT NULL, end_date TEXT NOT NULL, "
+                "PRIMARY KEY (region, symbol, interval, start_date))"
+            )
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """트랜잭션 단위 커넥션 (종료 시 commit/rollback 후 닫음)"""
+        conn = sqlite3.connect(self.path, timeout=30)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def _lock(self, key: Tuple[str, str, str]) -> threading.Lock:
+        with self._locks_guard:
+            return self._locks.setdefault(key, threading.Lock())
+
+    @staticmethod
+    def interval_key(period: str, time_interval: Optional[str] = None) -> str:
+        """저장 키의 주기 이름 (분봉은 간격 포함, 예: minute:60)"""
+        if period not in CHART_METHODS:
+            raise ValueError(f"period는 {', '.join(CHART_METHODS)} 중 하나여야 합니다.")
+        return f"minute:{time_interval or '60'}" if period == "minute" else period
+
+    @staticmethod
+    def exchange_today(region: str) -> date:
+        """거래소 현지 기준 오늘 날짜"""
+        if ZoneInfo is not None and region in CHART_TIMEZONES:
+            return datetime.now(ZoneInfo(CHART_TIMEZONES[region])).date()
+        return datetime.now(_FIXED_TIMEZONES.get(region, timezone.utc)).date()
+
+    def complete_through(self, region: str, period: str) -> date:
+        """완성된 봉만 포함하는 마지막 날짜 (이후 구간은 조회 완료로 기록하지 않음)"""
+        return period_start(period, self.exchange_today(region)) - _DAY
+
+    # ===== 조회 구간 =====
+
+    def coverage(self, region: str, symbol: str, period: str, time_interval: Optional[str] = None) -> List[Tuple[str, str]]:
+        """조회 완료로 기록된 날짜 구간 [(YYYYMMDD, YYYYMMDD), ...]"""
+        with self._connect() as conn:
+            return conn.execute(
+                "SELECT start_date, end_date FROM coverage WHERE region = ? AND symbol = ? AND interval = ? "
+                "ORDER BY start_date",
+                (region, symbol, self.interval_key(period, time_interval)),
+            ).fetchall()
+
+    def resolve_start(
+        self,
+        region: str,
+        symbol: str,
+        period: str,
+        start_date: Optional[str] = None,
+        time_interval: Optional[str] = None,
+    ) -> str:
+        """start_date가 없으면 기록된 첫 조회 구간의 시작일 (기록도 없으면 ValueError)"""
+        if start_date is not None:
+            return start_date
+        covered = self.coverage(region, symbol, period, time_interval)
+        if not covered:
+            raise ValueError(f"{region} {symbol} {period}: 저장된 구간이 없으면 start_date가 필요합니다.")
+        return covered[0][0]
+
+    def missing_ranges(
+        self,
+        region: str,
+        symbol: str,
+        period: str,
+        start_date: str,
+        end_date: Optional[str] = None,
+        time_interval: Optional[str] = None,
+    ) -> List[Tuple[str, str]]:
+        """start_date~end_date 중 API로 받아야 하는 날짜 구간 [(YYYYMMDD, YYYYMMDD), ...]"""
+        start = _parse(start_date)
+        end = _parse(end_date) if end_date else self.exchange_today(region)
+        gaps, cursor = [], start
+        for covered_start, covered_end in self.coverage(region, symbol, period, time_interval):
+            covered_start, covered_end = _parse(covered_start), _parse(covered_end)
+            if covered_end < cursor:
+                continue
+            if covered_start > end:
+                break
+            if covered_start > cursor:
+                gaps.append((cursor, covered_start - _DAY))
+            cursor = covered_end + _DAY
+        if cursor <= end:
+            gaps.append((cursor, end))
+        return [(_format(gap_start), _format(gap_end)) for gap_start, gap_end in gaps]
+
+    # ===== 갱신 =====
+
+    def update(
+        self,
+        region: str,
+        symbol: str,
+        period: str = "daily",
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        time_interval: Optional[str] = None,
+        **chart_kwargs,
+    ) -> Dict[str, Any]:
+        """
+        빠진 구간만 API로 받아 저장
+
+        Args:
+            region: "domestic" 또는 "overseas"
+            symbol: 종목코드
+            period: minute, daily, weekly, monthly, yearly
+            start_date: 시작일 (YYYYMMDD, 생략 시 기록된 첫 조회 구간부터)
+            end_date: 종료일 (YYYYMMDD, 기본: 거래소 기준 오늘)
+            time_interval: 분봉 간격 (get_minute_chart 인자, 기본 "60")
+            **chart_kwargs: 차트 조회 메서드 추가 인자 (market_code 등)
+
+        Returns:
+            {"ranges": 조회한 구간, "pages": 요청 페이지 수, "bars": 저장한 봉 수}
+        """
+        key = (region, symbol, self.interval_key(period, time_interval))
+        start_date = self.resolve_start(region, symbol, period, start_date, time_interval)
+        if period == "minute":
+            chart_kwargs["time_interval"] = time_interval or "60"
+        with self._lock(key):
+            ranges = self.missing_ranges(region, symbol, period, start_date, end_date, time_interval)
+            pages = written = 0
+            for gap_start, gap_end in ranges:
+                bars, fetched = self._fetch(region, symbol, period, _parse(gap_start), _parse(gap_end), chart_kwargs)
+                self._save(key, bars, _parse(gap_start), min(_parse(gap_end), self.complete_through(region, period)))
+                pages += fetched
+                written += len(bars)
+        if ranges:
+            self.logger.debug("차트 저장소 갱신: %s %s %s %s (%d페이지, %d봉)", region, symbol, key[2], ranges, pages, written)
+        return {"ranges": ranges, "pages": pages, "bars": written}
+
+    def _fetch(
+        self, region: str, symbol: str, period: str, start: date, end: date, chart_kwargs: Dict[str, Any]
+    ) -> Tuple[ChartBars, int]:
+        api = getattr(self.dbfi, region)
+        tz = CHART_TIMEZONES.get(region)
+        if period == "minute":
+            # 분봉은 거래일별로 조회 (주말 제외). 해외 분봉은 종료일도 필수
+            with_end = "end_date" in inspect.signature(getattr(api, CHART_METHODS[period])).parameters
+            requests = [
+                (day, day, {"start_date": _format(day), **({"end_date": _format(day)} if with_end else {})})
+                for day in (start + timedelta(days=offset) for offset in range((end - start).days + 1))
+                if day.weekday() < 5
+            ]
+        else:
+            requests = [(period_start(period, start), end, {"start_date": _format(start), "end_date": _format(end)})]
+
+        chunks, pages = [], 0
+        for lower, upper, dates in requests:
+            lo, hi = _epoch(lower), _epoch(upper + _DAY)
+            stream = api.iter_pages(CHART_METHODS[period], stock_code=symbol, **dates, **chart_kwargs)
+            try:
+                for page in stream:
+                    pages += 1
+                    bars = ChartBars.from_rows(page.get("Out") or (), self.fields, tz)
+                    # 페이지 내 행 순서는 보장되지 않으므로 정렬 전제인 between 대신 마스크 사용
+                    chunks.append(bars[(bars.timestamp >= lo) & (bars.timestamp < hi)])
+                    # 최신 봉부터 오므로 구간 이전 봉이 나오면 연속 조회 중단
+                    if len(bars) and bars.timestamp.min() < lo:
+                        break
+            finally:
+                stream.close()
+        return ChartBars.concat(chunks, tz=tz), pages
+
+    def _save(self, key: Tuple[str, str, str], bars: ChartBars, start: date, covered_end: date):
+        with self._connect() as conn:
+            if len(bars):
+                conn.executemany(
+                    "INSERT OR REPLACE INTO bars (region, symbol, interval, ts, open, high, low, close, volume) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        key + row
+                        for row in zip(
+                            bars.timestamp.tolist(),
+                            bars.open.tolist(),
+                            bars.high.tolist(),
+                            bars.low.tolist(),
+                            bars.close.tolist(),
+                            bars.volume.tolist(),
+                        )
+                    ),
+                )
+            if start <= covered_end:
+                ranges = [
+                    (_parse(s), _parse(e))
+                    for s, e in conn.execute(
+                        "SELECT start_date, end_date FROM coverage WHERE region = ? AND symbol = ? AND interval = ?", key
+                    )
+                ]
+                conn.execute("DELETE FROM coverage WHERE region = ? AND symbol = ? AND interval = ?", key)
+                conn.executemany(
+                    "INSERT INTO coverage (region, symbol, interval, start_date, end_date) VALUES (?, ?, ?, ?, ?)",
+                    [key + (_format(s), _format(e)) for s, e in merge_ranges(ranges + [(start, covered_end)])],
+                )
+
+    # ===== 조회 =====
+
+    def load(
+        self,
+        region: str,
+        symbol: str,
+        period: str = "daily",
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        time_interval: Optional[str] = None,
+    ) -> ChartBars:
+        """저장된 봉만 반환 (API 호출 없음)"""
+        query = "SELECT ts, open, high, low, close, volume FROM bars WHERE region = ? AND symbol = ? AND interval = ?"
+        params: List[Any] = [region, symbol, self.interval_key(period, time_interval)]
+        if start_date:
+            query += " AND ts >= ?"
+            params.append(_epoch(period_start(period, _parse(start_date))))
+        if end_date:
+            query += " AND ts < ?"
+            params.append(_epoch(_parse(end_date) + _DAY))
+        with self._connect() as conn:
+            rows = conn.execute(query + " ORDER BY ts", params).fetchall()
+        tz = CHART_TIMEZONES.get(region)
+        if not rows:
+            return ChartBars.empty(tz)
+        return ChartBars(*zip(*rows), tz=tz)
+
+    def get_bars(
+        self,
+        region: str,
+        symbol: str,
+        period: str = "daily",
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        time_interval: Optional[str] = None,
+        refresh: bool = True,
+        **chart_kwargs,
+    ) -> ChartBars:
+        """빠진 구간을 받아 저장한 뒤(refresh=True) start_date~end_date 봉을 반환"""
+        if refresh:
+            self.update(region, symbol, period, start_date, end_date, time_interval, **chart_kwargs)
+        return self.load(region, symbol, period, start_date, end_date, time_interval)
+
+    def delete(self, region: str, symbol: Optional[str] = None, period: Optional[str] = None, time_interval: Optional[str] = None):
+        """저장된 봉과 조회 구간 삭제 (symbol/period 미지정 시 해당 범위 전체)"""
+        where, params = "region = ?", [region]
+        if symbol is not None:
+            where += " AND symbol = ?"
+            params.append(symbol)
+        if period is not None:
+            where += " AND interval = ?"
+            params.append(self.interval_key(period, time_interval))
+        with self._connect() as conn:
+            conn.execute(f"DELETE FROM bars WHERE {where}", params)
+            conn.execute(f"DELETE FROM coverage WHERE {where}", params)
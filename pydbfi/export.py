@@ -0,0 +1,385 @@
+"""
+차트/거래 내역/잔고를 Arrow 테이블 또는 Parquet 파일로 내보내기 (pyarrow 필요)
+
+열 이름과 타입은 스키마(Column 목록)로 고정되어 응답에 필드가 빠져도 같은 스키마(null)로 기록된다.
+연속 조회 페이지는 도착하는 대로 RecordBatch로 바꿔 Parquet row group으로 쓰므로 전체 결과를 모아 두지 않는다.
+
+사용 예:
+    export_chart(dbfi, "005930_1m.parquet", "domestic", "005930", period="minute", start_date="20240105")
+    export_transaction_history(dbfi, "trades.parquet", "overseas", columns=["executed_at", "symbol", "won_amount"],
+                               start_date="20240101", end_date="20240131")
+    export_balance(dbfi, "balance.parquet", "domestic", compression="snappy")
+"""
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Union
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.parquet as pq
+except ImportError as e:
+    raise ImportError("Arrow/Parquet 내보내기를 사용하려면 pyarrow가 필요합니다: pip install pydbfi[arrow]") from e
+
+from .api import CHART_METHODS
+from .bars import CHART_TIMEZONES, ChartBars
+
+# Parquet은 초 단위 timestamp를 ms로 바꿔 저장하므로 처음부터 ms를 사용 (pq.read_table 결과와 스키마 일치)
+TIMESTAMP_UNIT = "ms"
+
+
+@dataclass(frozen=True)
+class Column:
+    """
+    내보내기 열 정의
+
+    Attributes:
+        name: 출력 열 이름
+        field: 응답 행의 필드명
+        type: Arrow 타입 (문자열 숫자는 이 타입으로 변환)
+        format: type이 timestamp일 때 응답 문자열의 strptime 형식 (앞부분만 사용)
+    """
+
+    name: str
+    field: str
+    type: pa.DataType = pa.string()
+    format: Optional[str] = None
+
+
+DOMESTIC_TRANSACTION_COLUMNS = (
+    Column("order_no", "OrdNo", pa.int64()),
+    Column("symbol", "IsuNo"),
+    Column("name", "IsuNm"),
+    Column("side", "BnsTpCode"),  # 1:매도, 2:매수
+    Column("order_qty", "OrdQty", pa.int64()),
+    Column("exec_qty", "ExecQty", pa.int64()),
+    Column("order_price", "OrdPrc", pa.float64()),
+    Column("exec_price", "ExecPrc", pa.float64()),
+    Column("exec_amount", "ExecAmt", pa.float64()),
+    Column("order_time", "OrdTime"),
+)
+
+OVERSEAS_TRANSACTION_COLUMNS = (
+    Column("executed_at", "AstkExecDttm", pa.timestamp(TIMESTAMP_UNIT), "%Y%m%d%H%M%S"),  # 한국 시각
+    Column("symbol", "AstkIsuNo"),
+    Column("side", "AstkBnsTpCode"),  # 1:매도, 2:매수
+    Column("exec_qty", "AstkExecQty", pa.int64()),
+    Column("exec_price", "AstkExecPrc", pa.float64()),
+    Column("won_amount", "WonAmt3", pa.float64()),
+)
+
+# post_daily_trade_report Out1 (국내 거래 내역과 같은 필드)
+DAILY_TRADE_REPORT_COLUMNS = DOMESTIC_TRANSACTION_COLUMNS
+
+DOMESTIC_BALANCE_COLUMNS = (
+    Column("symbol", "IsuNo"),
+    Column("name", "IsuNm"),
+    Column("quantity", "BalQty0", pa.int64()),
+    Column("orderable_qty", "AbleQty", pa.int64()),
+    Column("purchase_amount", "PchsAmt", pa.float64()),
+    Column("eval_amount", "EvalAmt", pa.float64()),
+    Column("eval_pnl", "EvalPnlAmt", pa.float64()),
+    Column("return_rate", "Ernrat", pa.float64()),
+    Column("price", "NowPrc", pa.float64()),
+)
+
+OVERSEAS_BALANCE_COLUMNS = (
+    Column("symbol", "SymCode"),
+    Column("name", "AstkHanglIsuNm"),
+    Column("quantity", "AstkExecBaseQty", pa.int64()),
+    Column("orderable_qty", "AstkOrdAbleQty", pa.int64()),
+    Column("avg_price", "AstkAvrPchsPrc", pa.float64()),
+    Column("price", "AstkNowPrc", pa.float64()),
+    Column("purchase_amount", "AstkBuyAmt", pa.float64()),
+    Column("eval_amount", "AstkEvalAmt", pa.float64()),
+    Column("eval_pnl", "AstkEvalPnlAmt", pa.float64()),
+    Column("return_rate", "EvalPnlRat", pa.float64()),
+    Column("change_rate", "AstkUpdnRat", pa.float64()),
+)
+
+# 지역별 (스키마, 응답 블록)
+TRANSACTION_SCHEMAS = {
+    "domestic": (DOMESTIC_TRANSACTION_COLUMNS, "Out1"),
+    "overseas": (OVERSEAS_TRANSACTION_COLUMNS, "Out"),
+}
+BALANCE_SCHEMAS = {
+    "domestic": (DOMESTIC_BALANCE_COLUMNS, "Out1"),
+    "overseas": (OVERSEAS_BALANCE_COLUMNS, "Out2"),
+}
+
+PagesLike = Union[Dict[str, Any], Iterable[Dict[str, Any]]]
+
+
+def _pages(pages: PagesLike) -> Iterable[Dict[str, Any]]:
+    # 연속 조회가 없으면 응답 dict 하나
+    return [pages] if isinstance(pages, dict) else pages
+
+
+def _project(schema: pa.Schema, columns: Optional[Sequence[str]]) -> pa.Schema:
+    if columns is None:
+        return schema
+    unknown = [name for name in columns if schema.get_field_index(name) < 0]
+    if unknown:
+        raise ValueError(f"스키마에 없는 열입니다: {unknown} (사용 가능: {schema.names})")
+    return pa.schema([schema.field(name) for name in columns])
+
+
+def _to_array(values: List[Any], column: Column) -> pa.Array:
+    if column.format is not None:
+        width = len(datetime(2000, 1, 1).strftime(column.format))
+        text = pa.array([None if value in (None, "") else str(value)[:width] for value in values], pa.string())
+        return pc.strptime(text, format=column.format, unit=column.type.unit).cast(column.type)
+    try:
+        # 숫자/None은 그대로 변환
+        return pa.array(values, type=column.type)
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        text = pa.array([None if value in (None, "") else str(value) for value in values], pa.string())
+        if pa.types.is_string(column.type):
+            return text
+        if pa.types.is_integer(column.type):
+            # "12.0" 같은 정수 문자열 허용
+            return pc.cast(pc.cast(text, pa.float64()), column.type)
+        return pc.cast(text, column.type)
+
+
+def rows_schema(columns: Sequence[Column], constants: Optional[Dict[str, Any]] = None) -> pa.Schema:
+    """Column 목록(+ 상수 열)의 Arrow 스키마"""
+    fields = [pa.field(column.name, column.type) for column in columns]
+    for name, value in (constants or {}).items():
+        fields.append(pa.field(name, value.type if isinstance(value, pa.Scalar) else pa.scalar(value).type))
+    return pa.schema(fields)
+
+
+def iter_row_batches(
+    pages: PagesLike,
+    columns: Sequence[Column],
+    out_key: str,
+    select: Optional[Sequence[str]] = None,
+    constants: Optional[Dict[str, Any]] = None,
+) -> Iterator[pa.RecordBatch]:
+    """
+    페이지별 out_key 행을 RecordBatch로 변환
+
+    Args:
+        pages: iter_pages 결과, 페이지 list 또는 단일 응답 dict
+        columns: 열 정의
+        out_key: 행 블록 (Out, Out1, Out2 등)
+        select: 출력할 열 이름 (None이면 전체)
+        constants: 모든 행에 같은 값으로 추가할 열 (값 또는 pyarrow.Scalar)
+    """
+    schema = _project(rows_schema(columns, constants), select)
+    scalars = {
+        name: value if isinstance(value, pa.Scalar) else pa.scalar(value) for name, value in (constants or {}).items()
+    }
+    by_name = {column.name: column for column in columns}
+    for page in _pages(pages):
+        block = page.get(out_key) if isinstance(page, dict) else None
+        rows = [block] if isinstance(block, dict) else (block or [])
+        if not rows:
+            continue
+        arrays = []
+        for field in schema:
+            column = by_name.get(field.name)
+            if column is None:
+                arrays.append(pa.repeat(scalars[field.name], len(rows)))
+            else:
+                arrays.append(_to_array([row.get(column.field) for row in rows], column))
+        yield pa.RecordBatch.from_arrays(arrays, schema=schema)
+
+
+def chart_schema(tz: Optional[str] = None, select: Optional[Sequence[str]] = None) -> pa.Schema:
+    """차트 봉 스키마 (timestamp는 거래소 시간대가 지정된 시각)"""
+    schema = pa.schema(
+        [
+            pa.field("symbol", pa.string()),
+            pa.field("timestamp", pa.timestamp(TIMESTAMP_UNIT, tz=tz)),
+            pa.field("open", pa.float64()),
+            pa.field("high", pa.float64()),
+            pa.field("low", pa.float64()),
+            pa.field("close", pa.float64()),
+            pa.field("volume", pa.int64()),
+        ]
+    )
+    return _project(schema, select)
+
+
+def chart_batch(bars: ChartBars, symbol: Optional[str] = None, select: Optional[Sequence[str]] = None) -> pa.RecordBatch:
+    """ChartBars -> RecordBatch (배열 복사 없이 변환, timestamp만 ms 단위와 시간대 변환)"""
+    schema = chart_schema(bars.tz, select)
+    arrays = []
+    for field in schema:
+        if field.name == "symbol":
+            arrays.append(pa.array([symbol] * len(bars), pa.string()))
+        elif field.name == "timestamp":
+            local = pa.array(bars.datetime, pa.timestamp("s")).cast(pa.timestamp(TIMESTAMP_UNIT))
+            # 거래소 현지 시각을 시간대가 있는 시각으로 해석 (일광절약시간 경계는 앞선 시각)
+            arrays.append(
+                pc.assume_timezone(local, bars.tz, ambiguous="earliest", nonexistent="earliest") if bars.tz else local
+            )
+        else:
+            arrays.append(pa.array(getattr(bars, field.name)))
+    return pa.RecordBatch.from_arrays(arrays, schema=schema)
+
+
+def iter_chart_batches(
+    pages: PagesLike,
+    symbol: Optional[str] = None,
+    tz: Optional[str] = None,
+    fields: Optional[Dict[str, str]] = None,
+    select: Optional[Sequence[str]] = None,
+    out_key: str = "Out",
+) -> Iterator[pa.RecordBatch]:
+    """차트 조회 페이지를 도착 순서대로 RecordBatch로 변환 (페이지 내 시각 오름차순)"""
+    for page in _pages(pages):
+        bars = ChartBars.concat([ChartBars.from_rows(page.get(out_key) or (), fields, tz)], tz=tz)
+        if len(bars):
+            yield chart_batch(bars, symbol, select)
+
+
+def to_table(batches: Iterable[pa.RecordBatch], schema: pa.Schema) -> pa.Table:
+    """RecordBatch를 모아 Table로 반환 (결과가 없어도 스키마 유지)"""
+    return pa.Table.from_batches(list(batches), schema=schema)
+
+
+def write_parquet(
+    batches: Iterable[pa.RecordBatch],
+    path: str,
+    schema: pa.Schema,
+    compression: Optional[str] = "zstd",
+    compression_level: Optional[int] = None,
+    **writer_kwargs,
+) -> int:
+    """
+    RecordBatch를 받는 대로 Parquet row group으로 기록하고 행 수를 반환
+
+    Args:
+        compression: none, snappy, gzip, brotli, lz4, zstd
+        compression_level: 압축 수준 (코덱 기본값 사용 시 None)
+        **writer_kwargs: pyarrow.parquet.ParquetWriter 추가 인자 (use_dictionary 등)
+    """
+    rows = 0
+    with pq.ParquetWriter(
+        path, schema, compression=compression or "none", compression_level=compression_level, **writer_kwargs
+    ) as writer:
+        for batch in batches:
+            writer.write_batch(batch)
+            rows += batch.num_rows
+    return rows
+
+
+# ===== DBFI 조회 결과 내보내기 =====
+
+
+def _region_api(dbfi, region: str):
+    region = region.lower()
+    if region not in ("domestic", "overseas"):
+        raise ValueError("region은 'domestic' 또는 'overseas'여야 합니다.")
+    return region, getattr(dbfi, region)
+
+
+def _output(batches, schema, path, compression, compression_level, writer_kwargs):
+    if path is None:
+        return to_table(batches, schema)
+    return write_parquet(batches, path, schema, compression, compression_level, **writer_kwargs)
+
+
+def export_chart(
+    dbfi,
+    path: Optional[str],
+    region: str,
+    symbol: str,
+    period: str = "daily",
+    columns: Optional[Sequence[str]] = None,
+    compression: Optional[str] = "zstd",
+    compression_level: Optional[int] = None,
+    fields: Optional[Dict[str, str]] = None,
+    writer_kwargs: Optional[Dict[str, Any]] = None,
+    **chart_kwargs,
+):
+    """
+    차트 조회 결과를 페이지 단위로 Parquet에 기록 (path=None이면 Arrow Table 반환)
+
+    row group은 도착 순서(최신 페이지부터)이며 각 row group 안은 시각 오름차순이다.
+    전체 정렬/중복 제거가 필요하면 ChartBars로 받은 뒤 write_parquet([chart_batch(bars)], ...)을 사용한다.
+
+    Returns:
+        기록한 행 수 (path=None이면 pyarrow.Table)
+    """
+    region, api = _region_api(dbfi, region)
+    if period not in CHART_METHODS:
+        raise ValueError(f"period는 {', '.join(CHART_METHODS)} 중 하나여야 합니다.")
+    tz = CHART_TIMEZONES.get(region)
+    pages = api.iter_pages(CHART_METHODS[period], stock_code=symbol, **chart_kwargs)
+    batches = iter_chart_batches(pages, symbol, tz, fields, columns)
+    return _output(batches, chart_schema(tz, columns), path, compression, compression_level, writer_kwargs or {})
+
+
+def export_transaction_history(
+    dbfi,
+    path: Optional[str],
+    region: str,
+    columns: Optional[Sequence[str]] = None,
+    compression: Optional[str] = "zstd",
+    compression_level: Optional[int] = None,
+    schema: Optional[Sequence[Column]] = None,
+    writer_kwargs: Optional[Dict[str, Any]] = None,
+    **kwargs,
+):
+    """
+    get_transaction_history 결과를 페이지 단위로 기록 (path=None이면 Arrow Table 반환)
+
+    Args:
+        schema: 열 정의 변경 (기본: DOMESTIC/OVERSEAS_TRANSACTION_COLUMNS)
+        **kwargs: get_transaction_history 인자
+    """
+    region, api = _region_api(dbfi, region)
+    default, out_key = TRANSACTION_SCHEMAS[region]
+    schema = schema or default
+    batches = iter_row_batches(api.iter_pages("get_transaction_history", **kwargs), schema, out_key, columns)
+    return _output(batches, _project(rows_schema(schema), columns), path, compression, compression_level, writer_kwargs or {})
+
+
+def export_daily_trade_report(
+    dbfi,
+    path: Optional[str],
+    bns_dt: str,
+    columns: Optional[Sequence[str]] = None,
+    compression: Optional[str] = "zstd",
+    compression_level: Optional[int] = None,
+    schema: Optional[Sequence[Column]] = None,
+    writer_kwargs: Optional[Dict[str, Any]] = None,
+    **kwargs,
+):
+    """국내 post_daily_trade_report 결과를 페이지 단위로 기록 (path=None이면 Arrow Table 반환)"""
+    schema = schema or DAILY_TRADE_REPORT_COLUMNS
+    pages = dbfi.domestic.iter_pages("post_daily_trade_report", bns_dt=bns_dt, **kwargs)
+    batches = iter_row_batches(pages, schema, "Out1", columns)
+    return _output(batches, _project(rows_schema(schema), columns), path, compression, compression_level, writer_kwargs or {})
+
+
+def export_balance(
+    dbfi,
+    path: Optional[str],
+    region: str,
+    columns: Optional[Sequence[str]] = None,
+    compression: Optional[str] = "zstd",
+    compression_level: Optional[int] = None,
+    schema: Optional[Sequence[Column]] = None,
+    snapshot_at: Optional[datetime] = None,
+    writer_kwargs: Optional[Dict[str, Any]] = None,
+    **kwargs,
+):
+    """
+    보유 종목 잔고 스냅샷 기록 (path=None이면 Arrow Table 반환)
+
+    모든 행에 조회 시각 snapshot_at(UTC) 열을 추가하여 여러 스냅샷 파일을 그대로 합칠 수 있다.
+    """
+    region, api = _region_api(dbfi, region)
+    default, out_key = BALANCE_SCHEMAS[region]
+    schema = schema or default
+    snapshot_at = (snapshot_at or datetime.now(timezone.utc)).astimezone(timezone.utc)
+    constants = {"snapshot_at": pa.scalar(snapshot_at.replace(microsecond=0), pa.timestamp(TIMESTAMP_UNIT, tz="UTC"))}
+    batches = iter_row_batches(api.iter_pages("get_stock_balance", **kwargs), schema, out_key, columns, constants)
+    return _output(
+        batches, _project(rows_schema(schema, constants), columns), path, compression, compression_level, writer_kwargs or {}
+    )
@@ -0,0 +1,196 @@
+import json
+import logging
+import threading
+import time
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# tenacity 재시도 회차 (_request_page의 before 콜백에서 설정)
+_current_attempt: ContextVar[int] = ContextVar("pydbfi_current_attempt", default=1)
+
+
+class RequestContext:
+    """
+    훅에 전달되는 요청 정보
+
+    kind가 "call"이면 BaseAPI._execute_service 호출 하나(연속 조회 전체 포함),
+    "request"이면 BaseService의 HTTP 요청 하나(페이지/재시도 단위)를 나타낸다.
+
+    Attributes:
+        kind: "call" 또는 "request"
+        method_name: API 메서드명 (예: get_stock_price)
+        region: "domestic", "overseas", "domestic_futures"
+        endpoint: 요청 경로 (call은 첫 HTTP 요청 시 채워짐)
+        http_method: HTTP 메서드 (request만)
+        payload_size: 요청 본문 크기 (바이트)
+        continuation: 연속 조회 페이지 번호 (0: 첫 페이지)
+        attempt: 재시도 회차 (1부터). call은 전체 HTTP 요청 수
+        replay: 토큰 만료(IGW00121) 후 즉시 재요청 여부 (request만)
+        started_at: 시작 시각 (time.perf_counter)
+        duration: 소요 시간 (초, after/error 시점에 설정)
+        timings: 구간별 시간 (request: rate_limit, server, total)
+        status_code: HTTP 상태 코드 (request만)
+        parent: 상위 call 컨텍스트 (request만)
+        data: 훅이 자유롭게 사용하는 저장소 (예: span 객체)
+    """
+
+    __slots__ = (
+        "kind", "method_name", "region", "endpoint", "http_method", "payload_size", "continuation",
+        "attempt", "replay", "started_at", "duration", "timings", "status_code", "parent", "data",
+    )
+
+    def __init__(
+        self,
+        kind: str,
+        method_name: Optional[str] = None,
+        region: Optional[str] = None,
+        endpoint: Optional[str] = None,
+        http_method: Optional[str] = None,
+        payload_size: Optional[int] = None,
+        continuation: int = 0,
+        attempt: int = 1,
+        replay: bool = False,
+        parent: Optional["RequestContext"] = None,
+    ):
+        self.kind = kind
+        self.method_name = method_name
+        self.region = region
+        self.endpoint = endpoint
+        self.http_method = http_method
+        self.payload_size = payload_size
+        self.continuation = continuation
+        self.attempt = attempt
+        self.replay = replay
+        self.parent = parent
+        self.started_at = time.perf_counter()
+        self.duration: Optional[float] = None
+        self.timings: Dict[str, float] = {}
+        self.status_code: Optional[int] = None
+        self.data: Dict[str, Any] = {}
+
+    def finish(self) -> float:
+        self.duration = time.perf_counter() - self.started_at
+        return self.duration
+
+    def __repr__(self):
+        return (
+            f"RequestContext(kind={self.kind!r}, method_name={self.method_name!r}, region={self.region!r}, "
+            f"endpoint={self.endpoint!r}, continuation={self.continuation}, attempt={self.attempt}, "
+            f"status_code={self.status_code}, duration={self.duration})"
+        )
+
+
+class Hooks:
+    """
+    API 호출/HTTP 요청 전후 훅
+
+    before(ctx), after(ctx, result), error(ctx, exc) 순서로 호출된다. result는 call이면 API 반환값,
+    request이면 HTTP 응답 객체다. 훅에서 발생한 예외는 로그만 남기고 요청은 계속 진행한다.
+    등록된 훅이 없으면 요청 경로에서 속성 확인 한 번만 수행한다.
+
+    사용 예:
+        hooks = Hooks()
+
+        # span 형태 추적
+        def start_span(ctx):
+            ctx.data["span"] = tracer.start_span(f"{ctx.kind} {ctx.method_name or ctx.endpoint}")
+
+        def end_span(ctx, result=None):
+            ctx.data["span"].end()
+
+        hooks.register(before=start_span, after=end_span, error=end_span)
+
+        # 느린 주문 호출만 기록
+        hooks.add_after(lambda ctx, result: ctx.kind == "call" and ctx.duration > 0.5 and log.warning(ctx))
+
+        dbfi = DBFI(app_key="...", app_secret_key="...", hooks=hooks)
+    """
+
+    def __init__(self):
+        self._before: tuple = ()
+        self._after: tuple = ()
+        self._error: tuple = ()
+        self._lock = threading.Lock()
+        self.active = False
+
+    def _update(self):
+        self.active = bool(self._before or self._after or self._error)
+
+    def register(
+        self,
+        before: Optional[Callable] = None,
+        after: Optional[Callable] = None,
+        error: Optional[Callable] = None,
+    ) -> "Hooks":
+        with self._lock:
+            # 호출 중 순회하는 튜플은 교체만 하므로 요청 경로에 락이 필요 없음
+            if before is not None:
+                self._before += (before,)
+            if after is not None:
+                self._after += (after,)
+            if error is not None:
+                self._error += (error,)
+            self._update()
+        return self
+
+    def add_before(self, fn: Callable[[RequestContext], Any]) -> "Hooks":
+        return self.register(before=fn)
+
+    def add_after(self, fn: Callable[[RequestContext, Any], Any]) -> "Hooks":
+        return self.register(after=fn)
+
+    def add_error(self, fn: Callable[[RequestContext, BaseException], Any]) -> "Hooks":
+        return self.register(error=fn)
+
+    def remove(self, fn: Callable):
+        """등록된 모든 단계에서 fn 제거"""
+        with self._lock:
+            # 바인딩 메서드는 접근할 때마다 새 객체이므로 동일성(is)이 아닌 동등성으로 비교
+            self._before = tuple(h for h in self._before if h != fn)
+            self._after = tuple(h for h in self._after if h != fn)
+            self._error = tuple(h for h in self._error if h != fn)
+            self._update()
+
+    def clear(self):
+        with self._lock:
+            self._before = self._after = self._error = ()
+            self._update()
+
+    def before(self, ctx: RequestContext):
+        for hook in self._before:
+            try:
+                hook(ctx)
+            except Exception:
+                logger.exception(f"before hook failed: {hook!r}")
+
+    def after(self, ctx: RequestContext, result: Any):
+        ctx.finish()
+        for hook in self._after:
+            try:
+                hook(ctx, result)
+            except Exception:
+                logger.exception(f"after hook failed: {hook!r}")
+
+    def error(self, ctx: RequestContext, exc: BaseException):
+        ctx.finish()
+        for hook in self._error:
+            try:
+                hook(ctx, exc)
+            except Exception:
+                logger.exception(f"error hook failed: {hook!r}")
+
+
+def payload_size(content_type: str, data: Any) -> int:
+    """요청 본문 크기 추정 (requests/httpx의 json 직렬화 기준)"""
+    if data is None:
+        return 0
+    if content_type == "application/json":
+        return len(json.dumps(data).encode("utf-8"))
+    return len(str(data).encode("utf-8"))
+
+
+def set_attempt(retry_state):
+    """tenacity before 콜백: 현재 재시도 회차를 컨텍스트에 기록"""
+    _current_attempt.set(retry_state.attempt_number)
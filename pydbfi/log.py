@@ -0,0 +1,131 @@
+import logging
+import random
+import re
+from typing import Any, Dict, Mapping, Optional
+
+from .hooks import Hooks, RequestContext
+
+# 로그에 값을 남기지 않는 헤더/필드 (소문자)
+SENSITIVE_KEYS = frozenset(
+    {"authorization", "appkey", "appsecretkey", "appsecret", "token", "access_token", "x-forwarded-for"}
+)
+
+_BEARER = re.compile(r"(?i)\b(bearer)\s+[A-Za-z0-9._~+/=-]+")
+
+
+def redact(mapping: Optional[Mapping[str, Any]]) -> Dict[str, Any]:
+    """민감한 헤더/필드 값을 가린 사본 (Authorization은 토큰 유형만 남김)"""
+    if not mapping:
+        return {}
+    redacted = {}
+    for key, value in mapping.items():
+        lowered = key.lower()
+        if lowered == "authorization" and isinstance(value, str):
+            redacted[key] = f"{value.split(' ', 1)[0]} ***" if " " in value else "***"
+        elif lowered in SENSITIVE_KEYS:
+            redacted[key] = "***"
+        else:
+            redacted[key] = value
+    return redacted
+
+
+def redact_text(text: str) -> str:
+    """문자열에 포함된 Bearer 토큰 제거"""
+    return _BEARER.sub(r"\1 ***", text)
+
+
+class RedactingFilter(logging.Filter):
+    """
+    포맷된 메시지의 Bearer 토큰을 가리는 로그 필터 (사용자 로그 처리기용 안전장치)
+
+    사용 예:
+        handler.addFilter(RedactingFilter())
+    """
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        message = record.getMessage()
+        redacted = redact_text(message)
+        if redacted != message:
+            record.msg, record.args = redacted, None
+        return True
+
+
+class RequestLog:
+    """
+    HTTP 요청 샘플 로그 (Hooks의 after/error 훅)
+
+    sample_rate 비율의 요청과 slow_threshold초를 넘는 요청, 실패한 요청을 한 줄씩 기록한다.
+    레코드에는 endpoint, http_method, status_code, duration_ms 등이 extra 속성으로 포함되어
+    JSON 포매터 등으로 그대로 수집할 수 있다.
+
+    사용 예:
+        hooks = Hooks()
+        RequestLog(sample_rate=0.01, slow_threshold=1.0).attach(hooks)
+        dbfi = DBFI(app_key="...", app_secret_key="...", hooks=hooks)
+
+    Args:
+        sample_rate: 정상 요청 중 기록할 비율 (0~1)
+        slow_threshold: 이 시간(초)을 넘는 요청은 항상 WARNING으로 기록 (None이면 미사용)
+        logger: 기록할 로거 (기본: pydbfi.requests)
+        level: 샘플 요청 로그 수준
+    """
+
+    def __init__(
+        self,
+        sample_rate: float = 0.01,
+        slow_threshold: Optional[float] = None,
+        logger: Optional[logging.Logger] = None,
+        level: int = logging.INFO,
+    ):
+        self.sample_rate = sample_rate
+        self.slow_threshold = slow_threshold
+        self.logger = logger if logger is not None else logging.getLogger("pydbfi.requests")
+        self.level = level
+
+    def attach(self, hooks: Hooks) -> Hooks:
+        return hooks.register(after=self.after, error=self.error)
+
+    def detach(self, hooks: Hooks):
+        hooks.remove(self.after)
+        hooks.remove(self.error)
+
+    @staticmethod
+    def _extra(ctx: RequestContext) -> Dict[str, Any]:
+        return {
+            "endpoint": ctx.endpoint,
+            "http_method": ctx.http_method,
+            "method_name": ctx.method_name,
+            "region": ctx.region,
+            "status_code": ctx.status_code,
+            "duration_ms": round(ctx.duration * 1000, 3),
+            "continuation": ctx.continuation,
+            "attempt": ctx.attempt,
+            "replay": ctx.replay,
+            "payload_size": ctx.payload_size,
+        }
+
+    def after(self, ctx: RequestContext, response: Any):
+        if ctx.kind != "request":
+            return
+        if self.slow_threshold is not None and ctx.duration > self.slow_threshold:
+            level = logging.WARNING
+        elif self.sample_rate > 0 and random.random() < self.sample_rate:
+            level = self.level
+        else:
+            return
+        if self.logger.isEnabledFor(level):
+            self.logger.log(
+                level,
+                "%s %s -> %s in %.1fms (page %d, attempt %d)",
+                ctx.http_method, ctx.endpoint, ctx.status_code, ctx.duration * 1000, ctx.continuation, ctx.attempt,
+                extra=self._extra(ctx),
+            )
+
+    def error(self, ctx: RequestContext, exc: BaseException):
+        if ctx.kind != "request" or not self.logger.isEnabledFor(logging.WARNING):
+            return
+        self.logger.warning(
+            "%s %s failed after %.1fms: %s",
+            ctx.http_method, ctx.endpoint, ctx.duration * 1000, type(exc).__name__,
+            extra={**self._extra(ctx), "error": type(exc).__name__},
+        )
@@ -1,4 +1,5 @@
 import logging
+import os
 from .api import *
 
 class DBFI():
@@ -29,8 +30,20 @@ class DBFI():
         headers: dict = {}, 
         token: str = None, 
         token_type: str = None,
-        expire_in: datetime = None
+        expire_in: datetime = None,
+        transport: HTTPTransport = None,
+        rate_limiter: RateLimiter = None,
+        pacer: ContinuationPacer = None,
+        quote_cache: QuoteCache = None,
+        metrics: MetricsRegistry = None,
+        hooks: Hooks = None,
+        token_store: TokenStore = None,
+        auto_refresh_token: bool = False,
+        base_url: str = None,
     ):
+        # transport 미지정 시 DBFI가 커넥션 풀을 생성하고 close()에서 정리
+        self._owns_transport = transport is None
+        self.transport = transport if transport is not None else HTTPTransport()
         _oauth = OAuth(
             appkey=app_key,
             appsecretkey=app_secret_key,
@@ -38,15 +51,44 @@ class DBFI():
             token=token,
             token_type=token_type,
             expire_in=expire_in,
+            token_store=token_store,
+            # 미지정 시 환경 변수 PYDBFI_BASE_URL (없으면 실서버)
+            base_url=base_url or os.environ.get("PYDBFI_BASE_URL") or None,
+            transport=self.transport,
         )
-        self.domestic = DomesticAPI(_oauth, log_level)
-        self.overseas = OverseasAPI(_oauth, log_level)
-        self.domestic_futures = DomesticFuturesAPI(_oauth, log_level)
+        # README 유량 제한을 기본으로 적용 (지역/서비스 간 공유)
+        self._owns_rate_limiter = rate_limiter is None
+        self.rate_limiter = rate_limiter if rate_limiter is not None else RateLimiter()
+        # 연속 조회 간격을 엔드포인트별로 조절 (유량 제한 설정 참조)
+        self.pacer = pacer if pacer is not None else ContinuationPacer(rate_limiter=self.rate_limiter)
+        self.quote_cache = quote_cache  # 미지정 시 시세 캐시 미사용
+        self.metrics = metrics  # 미지정 시 지표 미수집
+        self.hooks = hooks  # 미지정 시 훅 미사용
+        api_kwargs = dict(
+            transport=self.transport,
+            rate_limiter=self.rate_limiter,
+            pacer=self.pacer,
+            quote_cache=self.quote_cache,
+            metrics=self.metrics,
+            hooks=self.hooks,
+        )
+        self.domestic = DomesticAPI(_oauth, log_level, **api_kwargs)
+        self.overseas = OverseasAPI(_oauth, log_level, **api_kwargs)
+        self.domestic_futures = DomesticFuturesAPI(_oauth, log_level, **api_kwargs)
+        self.auth = _oauth
+        # 만료 전 백그라운드 갱신 (요청 경로에서 토큰 발급 대기 제거)
+        self.token_refresher = TokenRefresher(_oauth).start() if auto_refresh_token else None
     
     def close(self):
+        if self.token_refresher is not None:
+            self.token_refresher.stop()
         self.domestic.close()
         self.overseas.close()
         self.domestic_futures.close()
+        if self._owns_transport:
+            self.transport.close()
+        if self._owns_rate_limiter:
+            self.rate_limiter.close()
     
     def buy(self, region: str, **kwargs):
         region = region.lower()
@@ -160,6 +202,26 @@ class DBFI():
         else:
             raise ValueError("region은 'domestic' 또는 'overseas'여야 합니다.")
     
+    def get_stock_prices(self, region: str, **kwargs):
+        """여러 종목 현재가 동시 조회 (codes=[...]) -> {"results": {...}, "errors": {...}}"""
+        region = region.lower()
+        if region == 'domestic':
+            return self.domestic.get_stock_prices(**kwargs)
+        elif region == 'overseas':
+            return self.overseas.get_stock_prices(**kwargs)
+        else:
+            raise ValueError("region은 'domestic' 또는 'overseas'여야 합니다.")
+
+    def get_order_books(self, region: str, **kwargs):
+        """여러 종목 호가 동시 조회 (codes=[...]) -> {"results": {...}, "errors": {...}}"""
+        region = region.lower()
+        if region == 'domestic':
+            return self.domestic.get_order_books(**kwargs)
+        elif region == 'overseas':
+            return self.overseas.get_order_books(**kwargs)
+        else:
+            raise ValueError("region은 'domestic' 또는 'overseas'여야 합니다.")
+    
     def get_minute_chart(self, region: str, **kwargs):
         region = region.lower()
         if region == 'domestic':
@@ -205,6 +267,36 @@ class DBFI():
         else:
             raise ValueError("region은 'domestic' 또는 'overseas'여야 합니다.")
     
+    def get_chart_bars(self, region: str, **kwargs):
+        """차트 조회 결과를 ChartBars로 반환 (예: dbfi.get_chart_bars("domestic", period="minute", stock_code="005930", start_date="20240105"))"""
+        region = region.lower()
+        if region == 'domestic':
+            return self.domestic.get_chart_bars(**kwargs)
+        elif region == 'overseas':
+            return self.overseas.get_chart_bars(**kwargs)
+        else:
+            raise ValueError("region은 'domestic' 또는 'overseas'여야 합니다.")
+
+    def iter_pages(self, region: str, method_name: str, **kwargs):
+        """연속 조회 결과를 페이지 단위로 순차 반환 (예: dbfi.iter_pages("domestic", "get_minute_chart", ...))"""
+        region = region.lower()
+        if region == 'domestic':
+            return self.domestic.iter_pages(method_name, **kwargs)
+        elif region == 'overseas':
+            return self.overseas.iter_pages(method_name, **kwargs)
+        else:
+            raise ValueError("region은 'domestic' 또는 'overseas'여야 합니다.")
+
+    def iter_rows(self, region: str, method_name: str, out_key: str = "Out", **kwargs):
+        """연속 조회 결과의 out_key 행을 순차 반환 (예: dbfi.iter_rows("overseas", "get_stock_balance", out_key="Out2"))"""
+        region = region.lower()
+        if region == 'domestic':
+            return self.domestic.iter_rows(method_name, out_key, **kwargs)
+        elif region == 'overseas':
+            return self.overseas.iter_rows(method_name, out_key, **kwargs)
+        else:
+            raise ValueError("region은 'domestic' 또는 'overseas'여야 합니다.")
+
     def get_domestic_futures_balance(self, **kwargs):
         """국내 선물옵션 잔고 조회"""
         return self.domestic_futures.get_futures_balance(**kwargs)
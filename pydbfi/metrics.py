@@ -0,0 +1,323 @@
+import bisect
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+# 요청 지연 히스토그램 구간 상한 (초)
+DEFAULT_LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class _Histogram:
+    """누적 구간 히스토그램 (구간별 개수, 합계, 최대값)"""
+
+    __slots__ = ("bounds", "counts", "count", "sum", "max")
+
+    def __init__(self, bounds: Tuple[float, ...]):
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)  # 마지막은 +Inf
+        self.count = 0
+        self.sum = 0.0
+        self.max = 0.0
+
+    def observe(self, value: float):
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.sum += value
+        if value > self.max:
+            self.max = value
+
+    def quantile(self, q: float) -> Optional[float]:
+        """구간 내 선형 보간으로 추정한 분위수 (+Inf 구간은 최대값 사용)"""
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for i, n in enumerate(self.counts):
+            if n and seen + n >= rank:
+                lower = self.bounds[i - 1] if i > 0 else 0.0
+                upper = self.bounds[i] if i < len(self.bounds) else self.max
+                return min(self.max, lower + (upper - lower) * (rank - seen) / n)
+            seen += n
+        return self.max
+
+    def snapshot(self) -> Dict[str, Any]:
+        cumulative, buckets = 0, {}
+        for bound, n in zip(self.bounds, self.counts):
+            cumulative += n
+            buckets[bound] = cumulative
+        return {
+            "count": self.count,
+            "sum": self.sum,
+            "avg": self.sum / self.count if self.count else 0.0,
+            "max": self.max,
+            "p50": self.quantile(0.5),
+            "p95": self.quantile(0.95),
+            "p99": self.quantile(0.99),
+            "buckets": buckets,
+        }
+
+
+class _EndpointStats:
+    __slots__ = (
+        "requests", "errors", "status", "rsp_cd", "retries", "pages", "continuation_pages",
+        "bytes_sent", "bytes_received", "rate_limit_waits", "rate_limit_wait", "latency",
+    )
+
+    def __init__(self):
+        self.requests = 0
+        self.errors: Dict[str, int] = {}
+        self.status: Dict[int, int] = {}
+        self.rsp_cd: Dict[str, int] = {}
+        self.retries: Dict[str, int] = {}
+        self.pages = 0
+        self.continuation_pages = 0
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.rate_limit_waits = 0
+        self.rate_limit_wait = 0.0
+        self.latency: Dict[str, _Histogram] = {}
+
+
+def _increment(counter: Dict[Any, int], key: Any, n: int = 1):
+    counter[key] = counter.get(key, 0) + n
+
+
+class MetricsRegistry:
+    """
+    엔드포인트별 요청 지표 수집
+
+    BaseService가 HTTP 요청마다 상태 코드, rsp_cd, 지연 시간, 송수신 바이트, 재시도,
+    연속 조회 페이지 수, 유량 제한 대기 시간을 기록한다.
+
+    지연 시간 구간(phase):
+        server: 요청 전송부터 응답 헤더 수신까지 (requests의 response.elapsed, 동기 클라이언트만)
+        total: transport 호출 전체 (본문 수신 포함)
+        rate_limit: 로컬 RateLimiter 대기 (대기한 요청만)
+    DNS/연결/TLS 시간은 requests/httpx가 요청 단위로 제공하지 않아 기록하지 않는다.
+
+    사용 예:
+        metrics = MetricsRegistry()
+        dbfi = DBFI(app_key="...", app_secret_key="...", metrics=metrics)
+        metrics.snapshot()["endpoints"]["/api/v1/quote/kr-stock/inquiry/price"]["latency"]["total"]["p95"]
+        print(metrics.to_prometheus())
+        server = serve_prometheus(metrics, port=9464)  # http://127.0.0.1:9464/metrics
+
+    Args:
+        buckets: 지연 시간 히스토그램 구간 상한 (초)
+    """
+
+    def __init__(self, buckets: Iterable[float] = DEFAULT_LATENCY_BUCKETS):
+        self.buckets = tuple(sorted(buckets))
+        self._endpoints: Dict[str, _EndpointStats] = {}
+        self._lock = threading.Lock()
+        self._started_at = time.time()
+
+    def _get(self, endpoint: str) -> _EndpointStats:
+        """락을 잡은 상태에서 호출"""
+        stats = self._endpoints.get(endpoint)
+        if stats is None:
+            stats = self._endpoints[endpoint] = _EndpointStats()
+        return stats
+
+    def _observe_latency(self, stats: _EndpointStats, phase: str, seconds: float):
+        histogram = stats.latency.get(phase)
+        if histogram is None:
+            histogram = stats.latency[phase] = _Histogram(self.buckets)
+        histogram.observe(seconds)
+
+    # ===== 기록 (BaseService에서 호출) =====
+
+    def observe_response(
+        self,
+        endpoint: str,
+        status: int,
+        total: float,
+        server: Optional[float] = None,
+        bytes_sent: int = 0,
+        bytes_received: int = 0,
+        rsp_cd: Optional[str] = None,
+    ):
+        """HTTP 응답 한 건 (rsp_cd는 오류 응답처럼 페이지로 파싱되지 않는 경우에만 전달)"""
+        with self._lock:
+            stats = self._get(endpoint)
+            stats.requests += 1
+            _increment(stats.status, status)
+            if rsp_cd is not None:
+                _increment(stats.rsp_cd, rsp_cd)
+            stats.bytes_sent += bytes_sent
+            stats.bytes_received += bytes_received
+            self._observe_latency(stats, "total", total)
+            if server is not None:
+                self._observe_latency(stats, "server", server)
+
+    def observe_error(self, endpoint: str, error: BaseException, total: Optional[float] = None):
+        """응답을 받지 못한 요청 (연결 실패, 타임아웃 등)"""
+        with self._lock:
+            stats = self._get(endpoint)
+            stats.requests += 1
+            _increment(stats.errors, type(error).__name__)
+            if total is not None:
+                self._observe_latency(stats, "total", total)
+
+    def observe_page(self, endpoint: str, rsp_cd: Optional[str], continuation: bool):
+        """파싱된 응답 페이지"""
+        with self._lock:
+            stats = self._get(endpoint)
+            stats.pages += 1
+            if continuation:
+                stats.continuation_pages += 1
+            if rsp_cd is not None:
+                _increment(stats.rsp_cd, rsp_cd)
+
+    def observe_retry(self, endpoint: str, reason: str):
+        """재요청 (token_expired: 토큰 재발급 후 즉시 재요청, 그 외: 백오프 재시도 사유)"""
+        with self._lock:
+            _increment(self._get(endpoint).retries, reason)
+
+    def observe_rate_limit_wait(self, endpoint: str, seconds: float):
+        with self._lock:
+            stats = self._get(endpoint)
+            stats.rate_limit_waits += 1
+            stats.rate_limit_wait += seconds
+            self._observe_latency(stats, "rate_limit", seconds)
+
+    # ===== 조회 =====
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        엔드포인트별 지표
+
+        Returns:
+            {"since": 수집 시작 시각(epoch), "endpoints": {endpoint: {requests, errors, status, rsp_cd, retries,
+             pages, continuation_pages, bytes_sent, bytes_received, rate_limit_waits, rate_limit_wait,
+             latency: {phase: {count, sum, avg, max, p50, p95, p99, buckets}}}}}
+        """
+        with self._lock:
+            endpoints = {
+                endpoint: {
+                    "requests": stats.requests,
+                    "errors": dict(stats.errors),
+                    "status": dict(stats.status),
+                    "rsp_cd": dict(stats.rsp_cd),
+                    "retries": dict(stats.retries),
+                    "pages": stats.pages,
+                    "continuation_pages": stats.continuation_pages,
+                    "bytes_sent": stats.bytes_sent,
+                    "bytes_received": stats.bytes_received,
+                    "rate_limit_waits": stats.rate_limit_waits,
+                    "rate_limit_wait": stats.rate_limit_wait,
+                    "latency": {phase: h.snapshot() for phase, h in stats.latency.items()},
+                }
+                for endpoint, stats in self._endpoints.items()
+            }
+            return {"since": self._started_at, "endpoints": endpoints}
+
+    def slowest(self, phase: str = "total", quantile: float = 0.95, limit: int = 10) -> List[Tuple[str, float]]:
+        """분위수 지연 시간이 큰 엔드포인트 순 [(endpoint, 초)]"""
+        with self._lock:
+            items = [
+                (endpoint, stats.latency[phase].quantile(quantile))
+                for endpoint, stats in self._endpoints.items()
+                if phase in stats.latency and stats.latency[phase].count
+            ]
+        return sorted(items, key=lambda item: item[1], reverse=True)[:limit]
+
+    def reset(self):
+        with self._lock:
+            self._endpoints.clear()
+            self._started_at = time.time()
+
+    def to_prometheus(self, prefix: str = "pydbfi") -> str:
+        """Prometheus text exposition format (0.0.4)"""
+        snapshot = self.snapshot()["endpoints"]
+        lines: List[str] = []
+
+        def family(name: str, kind: str, help_text: str):
+            lines.append(f"# HELP {prefix}_{name} {help_text}")
+            lines.append(f"# TYPE {prefix}_{name} {kind}")
+
+        def sample(name: str, labels: Dict[str, Any], value: Any):
+            rendered = ",".join(f'{key}="{_escape(val)}"' for key, val in labels.items())
+            lines.append(f"{prefix}_{name}{{{rendered}}} {_format_value(value)}")
+
+        family("requests_total", "counter", "HTTP requests by endpoint and status code")
+        for endpoint, stats in snapshot.items():
+            for status, n in stats["status"].items():
+                sample("requests_total", {"endpoint": endpoint, "status": status}, n)
+            for error, n in stats["errors"].items():
+                sample("requests_total", {"endpoint": endpoint, "status": "error", "error": error}, n)
+
+        family("responses_total", "counter", "Responses by endpoint and rsp_cd")
+        for endpoint, stats in snapshot.items():
+            for rsp_cd, n in stats["rsp_cd"].items():
+                sample("responses_total", {"endpoint": endpoint, "rsp_cd": rsp_cd}, n)
+
+        family("retries_total", "counter", "Retried requests by endpoint and reason")
+        for endpoint, stats in snapshot.items():
+            for reason, n in stats["retries"].items():
+                sample("retries_total", {"endpoint": endpoint, "reason": reason}, n)
+
+        counters = (
+            ("pages_total", "pages", "Parsed response pages (including continuation pages)"),
+            ("continuation_pages_total", "continuation_pages", "Continuation (cont_yn=Y) pages"),
+            ("sent_bytes_total", "bytes_sent", "Request body bytes sent"),
+            ("received_bytes_total", "bytes_received", "Response body bytes received"),
+            ("rate_limit_wait_seconds_total", "rate_limit_wait", "Time spent waiting for the local rate limiter"),
+        )
+        for name, key, help_text in counters:
+            family(name, "counter", help_text)
+            for endpoint, stats in snapshot.items():
+                sample(name, {"endpoint": endpoint}, stats[key])
+
+        family("request_duration_seconds", "histogram", "Request latency by endpoint and phase")
+        for endpoint, stats in snapshot.items():
+            for phase, histogram in stats["latency"].items():
+                labels = {"endpoint": endpoint, "phase": phase}
+                for bound, cumulative in histogram["buckets"].items():
+                    sample("request_duration_seconds_bucket", {**labels, "le": _format_value(bound)}, cumulative)
+                sample("request_duration_seconds_bucket", {**labels, "le": "+Inf"}, histogram["count"])
+                sample("request_duration_seconds_sum", labels, histogram["sum"])
+                sample("request_duration_seconds_count", labels, histogram["count"])
+
+        return "\n".join(lines) + "\n"
+
+
+def _escape(value: Any) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: Any) -> str:
+    if isinstance(value, float):
+        return repr(value) if value != int(value) or abs(value) >= 1e15 else f"{value:.1f}"
+    return str(value)
+
+
+def serve_prometheus(registry: MetricsRegistry, port: int = 9464, host: str = "127.0.0.1", prefix: str = "pydbfi"):
+    """
+    /metrics 경로로 Prometheus 지표를 제공하는 HTTP 서버를 백그라운드 스레드로 시작
+
+    Returns:
+        실행 중인 서버 (http.server.ThreadingHTTPServer, server.shutdown()으로 종료)
+    """
+    # 지표 수집만 하는 클라이언트가 http.server를 불러오지 않도록 호출 시점에 import
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split("?", 1)[0] != "/metrics":
+                self.send_error(404)
+                return
+            payload = registry.to_prometheus(prefix).encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer((host, port), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, name="pydbfi-metrics", daemon=True).start()
+    return server
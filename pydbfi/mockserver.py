@@ -0,0 +1,684 @@
+"""
+DB증권 API 로컬 모의 서버 (테스트/벤치마크용)
+
+실서버 없이 DBFI의 요청, 연속 조회, 토큰 재발급, 유량 제한 처리를 확인할 수 있도록
+service/trading.py, service/quote.py, service/chart.py의 엔드포인트와 /oauth2/token,
+/oauth2/revoke를 구현한다. 응답 값은 종목코드로부터 결정적으로 생성된다.
+
+사용 예:
+    from pydbfi import DBFI
+    from pydbfi.mockserver import MockDBFIServer
+
+    with MockDBFIServer(latency=0.005, total_rows=200, rate_limits={"chart": 5}) as server:
+        dbfi = DBFI(app_key="test", app_secret_key="test", base_url=server.url)
+        pages = dbfi.get_daily_chart(region="domestic", stock_code="005930", start_date="20240101", end_date="20240630")
+        server.expire_tokens()  # 다음 요청은 IGW00121로 거절됨
+        server.stats()
+
+    # 별도 프로세스로 실행 후 PYDBFI_BASE_URL=http://127.0.0.1:8443 으로 연결
+    python -m pydbfi.mockserver --port 8443 --latency 0.01
+"""
+import argparse
+import hashlib
+import json
+import math
+import random
+import threading
+import time
+from collections import deque
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Dict, Optional, Tuple, Union
+from urllib.parse import parse_qs, urlencode, urlsplit
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+# 토큰 유효성 만료 응답 코드 (service.common.base.TOKEN_EXPIRED_CODE와 동일)
+TOKEN_EXPIRED_CODE = "IGW00121"
+# 유량 제한 거절 응답 코드 (모의 서버 전용 값, HTTP 429와 함께 반환)
+THROTTLED_CODE = "IGW00201"
+OK_CODE = "00000"
+OK_MESSAGE = "정상처리 되었습니다."
+
+# 차트 응답 행 필드
+CHART_FIELDS = ("Date", "Hour", "Oprc", "Hprc", "Lprc", "Prpr", "Cntg_Vol")
+
+DOMESTIC_STOCKS = (
+    ("005930", "삼성전자"),
+    ("000660", "SK하이닉스"),
+    ("373220", "LG에너지솔루션"),
+    ("207940", "삼성바이오로직스"),
+    ("005380", "현대차"),
+    ("035420", "NAVER"),
+    ("000270", "기아"),
+    ("051910", "LG화학"),
+    ("035720", "카카오"),
+    ("105560", "KB금융"),
+)
+OVERSEAS_STOCKS = (
+    ("AAPL", "애플", "Apple Inc"),
+    ("MSFT", "마이크로소프트", "Microsoft Corp"),
+    ("NVDA", "엔비디아", "NVIDIA Corp"),
+    ("AMZN", "아마존닷컴", "Amazon.com Inc"),
+    ("GOOGL", "알파벳 A", "Alphabet Inc Class A"),
+    ("META", "메타 플랫폼스", "Meta Platforms Inc"),
+    ("TSLA", "테슬라", "Tesla Inc"),
+    ("TQQQ", "프로셰어즈 울트라프로 QQQ", "ProShares UltraPro QQQ"),
+)
+
+
+def _seed(value: str) -> int:
+    return int(hashlib.md5(value.encode()).hexdigest()[:8], 16)
+
+
+def _domestic_stock(i: int) -> Tuple[str, str]:
+    if i < len(DOMESTIC_STOCKS):
+        return DOMESTIC_STOCKS[i]
+    return f"{900000 + i:06d}", f"모의종목{i}"
+
+
+def _overseas_stock(i: int) -> Tuple[str, str, str]:
+    if i < len(OVERSEAS_STOCKS):
+        return OVERSEAS_STOCKS[i]
+    return f"MOCK{i}", f"모의해외종목{i}", f"Mock Corp {i}"
+
+
+def _base_price(code: str, overseas: bool) -> float:
+    seed = _seed(code)
+    return round(20 + seed % 480, 2) if overseas else float(1000 + (seed % 900) * 100)
+
+
+def _price_at(code: str, i: int, overseas: bool) -> float:
+    """i번째 과거 시점 가격 (페이지와 무관하게 같은 값)"""
+    seed = _seed(code)
+    base = _base_price(code, overseas)
+    price = base * (1 + 0.05 * math.sin(i / 17 + seed % 7) + 0.01 * math.sin(i / 3.3))
+    return round(price, 2) if overseas else float(int(price))
+
+
+def _parse_date(value: Any) -> datetime:
+    try:
+        return datetime.strptime(str(value), "%Y%m%d")
+    except ValueError:
+        return datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    mock: "MockDBFIServer"
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # keep-alive 연결에서 헤더/본문 분할 전송 시 지연 ACK(약 40ms) 방지
+    disable_nagle_algorithm = True
+    server: _Server
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_POST(self):
+        self.server.mock._handle(self)
+
+    do_GET = do_POST
+
+
+class MockDBFIServer:
+    """
+    DB증권 API 모의 서버
+
+    Args:
+        host: 바인딩 주소
+        port: 포트 (0이면 임의 포트)
+        latency: 응답 지연 (초). (최소, 최대) 튜플이면 범위 내 무작위
+        page_size: 연속 조회 페이지당 행 수
+        total_rows: 연속 조회 엔드포인트의 전체 행 수
+        rows_per_endpoint: 엔드포인트별 전체 행 수 지정 ({"/api/v1/quote/kr-chart/min": 1000})
+        rate_limits: 분류별 초당 허용 요청 수 (초과 시 HTTP 429). 분류는 RateLimiter와 동일
+        token_ttl: 발급 토큰의 expires_in (초)
+        token_expire_after: 발급 후 이 시간(초)이 지나면 IGW00121로 거절 (None이면 만료 없음)
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency: Union[float, Tuple[float, float]] = 0.0,
+        page_size: int = 20,
+        total_rows: int = 60,
+        rows_per_endpoint: Optional[Dict[str, int]] = None,
+        rate_limits: Optional[Dict[str, float]] = None,
+        token_ttl: int = 86400,
+        token_expire_after: Optional[float] = None,
+    ):
+        self.host = host
+        self.port = port
+        self.latency = latency
+        self.page_size = page_size
+        self.total_rows = total_rows
+        self.rows_per_endpoint = dict(rows_per_endpoint or {})
+        self.rate_limits = dict(rate_limits or {})
+        self.token_ttl = token_ttl
+        self.token_expire_after = token_expire_after
+        self._tokens: Dict[str, float] = {}  # {토큰: 발급 시각}
+        self._windows: Dict[str, deque] = {}
+        self._order_no = 0
+        self._lock = threading.Lock()
+        self._server: Optional[_Server] = None
+        self._thread: Optional[threading.Thread] = None
+        self.reset_stats()
+
+        # 엔드포인트 -> (유량 제한 분류, 응답 생성 함수, 연속 조회 행 키)
+        self.routes: Dict[str, Tuple[str, Callable, Optional[str]]] = {
+            # 국내 주문/조회
+            "/api/v1/trading/kr-stock/order": ("order", self._order, None),
+            "/api/v1/trading/kr-stock/order-nxt": ("order", self._order, None),
+            "/api/v1/trading/kr-stock/order-cancel": ("cancel", self._cancel, None),
+            "/api/v1/trading/kr-stock/order-cancel-nxt": ("cancel", self._cancel, None),
+            "/api/v1/trading/kr-stock/inquiry/transaction-history": ("history", self._kr_transactions, "Out1"),
+            "/api/v1/trading/kr-stock/inquiry/trading-history": ("history", self._kr_transactions, "Out1"),
+            "/api/v1/trading/kr-stock/inquiry/daliy-trade-report": ("history", self._kr_transactions, "Out1"),
+            "/api/v1/trading/kr-stock/inquiry/able-orderqty": ("inquiry", self._kr_able_qty, None),
+            "/api/v1/trading/kr-stock/inquiry/balance": ("inquiry", self._kr_balance, "Out1"),
+            "/api/v1/trading/kr-stock/inquiry/acnt-deposit": ("deposit", self._kr_deposit, None),
+            "/api/v1/trading/kr-futureoption/inquiry/balance": ("futures_balance", self._futures_balance, "Out1"),
+            # 해외 주문/조회
+            "/api/v1/trading/overseas-stock/order": ("order", self._order, None),
+            "/api/v1/trading/overseas-stock/inquiry/transaction-history": ("history", self._us_transactions, "Out"),
+            "/api/v1/trading/overseas-stock/inquiry/able-orderqty": ("inquiry", self._us_able_qty, None),
+            "/api/v1/trading/overseas-stock/inquiry/balance-margin": ("inquiry", self._us_balance, "Out2"),
+            "/api/v1/trading/overseas-stock/inquiry/deposit-detail": ("deposit", self._us_deposit, None),
+            # 시세
+            "/api/v1/quote/kr-stock/inquiry/stock-ticker": ("quote", self._kr_tickers, "Out"),
+            "/api/v1/quote/kr-stock/inquiry/price": ("quote", self._kr_price, None),
+            "/api/v1/quote/kr-stock/inquiry/orderbook": ("quote", self._kr_orderbook, None),
+            "/api/v1/quote/overseas-stock/inquiry/stock-ticker": ("quote", self._us_tickers, "Out"),
+            "/api/v1/quote/overseas-stock/inquiry/price": ("quote", self._us_price, None),
+            "/api/v1/quote/overseas-stock/inquiry/orderbook": ("quote", self._us_orderbook, None),
+            # 차트
+            "/api/v1/quote/kr-chart/min": ("chart", self._chart("min", False), "Out"),
+            "/api/v1/quote/kr-chart/day": ("chart", self._chart("day", False), "Out"),
+            "/api/v1/quote/kr-chart/week": ("chart", self._chart("week", False), "Out"),
+            "/api/v1/quote/kr-chart/month": ("chart", self._chart("month", False), "Out"),
+            "/api/v1/quote/overseas-stock/chart/min": ("chart", self._chart("min", True), "Out"),
+            "/api/v1/quote/overseas-stock/chart/day": ("chart", self._chart("day", True), "Out"),
+            "/api/v1/quote/overseas-stock/chart/week": ("chart", self._chart("week", True), "Out"),
+            "/api/v1/quote/overseas-stock/chart/month": ("chart", self._chart("month", True), "Out"),
+        }
+
+    # ===== 서버 수명 =====
+
+    def start(self) -> "MockDBFIServer":
+        if self._server is None:
+            self._server = _Server((self.host, self.port), _Handler)
+            self._server.mock = self
+            self.port = self._server.server_address[1]
+            self._thread = threading.Thread(
+                target=self._server.serve_forever, name="pydbfi-mockserver", daemon=True
+            )
+            self._thread.start()
+        return self
+
+    def stop(self):
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    def __enter__(self) -> "MockDBFIServer":
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    # ===== 시나리오 제어 =====
+
+    def expire_tokens(self):
+        """발급된 모든 토큰을 만료시킴 (다음 API 요청은 IGW00121)"""
+        with self._lock:
+            self._tokens.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """엔드포인트별 요청 수, 상태 코드 분포, 토큰 발급/만료 거절/유량 제한 거절 횟수"""
+        with self._lock:
+            return {
+                "requests": dict(self._stats["requests"]),
+                "status": dict(self._stats["status"]),
+                "tokens_issued": self._stats["tokens_issued"],
+                "expired": self._stats["expired"],
+                "throttled": self._stats["throttled"],
+            }
+
+    def reset_stats(self):
+        self._stats = {"requests": {}, "status": {}, "tokens_issued": 0, "expired": 0, "throttled": 0}
+
+    # ===== 요청 처리 =====
+
+    def _handle(self, request: _Handler):
+        length = int(request.headers.get("Content-Length") or 0)
+        raw = request.rfile.read(length) if length else b""
+        status, body, headers = self.dispatch(urlsplit(request.path).path, request.headers, raw)
+        payload = json.dumps(body, ensure_ascii=False).encode("utf-8")
+        request.send_response(status)
+        request.send_header("Content-Type", "application/json; charset=utf-8")
+        request.send_header("Content-Length", str(len(payload)))
+        for name, value in headers.items():
+            request.send_header(name, value)
+        request.end_headers()
+        request.wfile.write(payload)
+
+    def dispatch(self, path: str, headers, raw: bytes) -> Tuple[int, Dict[str, Any], Dict[str, str]]:
+        """요청 하나를 처리하여 (상태 코드, 응답 본문, 응답 헤더)를 반환 (HTTP 서버와 MockTransport 공용)"""
+        with self._lock:
+            requests_by_path = self._stats["requests"]
+            requests_by_path[path] = requests_by_path.get(path, 0) + 1
+
+        latency = self.latency
+        if isinstance(latency, tuple):
+            latency = random.uniform(*latency)
+        if latency > 0:
+            time.sleep(latency)
+
+        status, body, response_headers = self._route(path, headers, raw)
+        with self._lock:
+            by_status = self._stats["status"]
+            by_status[status] = by_status.get(status, 0) + 1
+        return status, body, response_headers
+
+    def _route(self, path: str, headers, raw: bytes) -> Tuple[int, Dict[str, Any], Dict[str, str]]:
+        if path == "/oauth2/token":
+            return 200, self._issue_token(), {}
+        if path == "/oauth2/revoke":
+            form = parse_qs(raw.decode())
+            with self._lock:
+                self._tokens.pop(form.get("token", [""])[0], None)
+            return 200, {"code": 200, "message": "Token revoked"}, {}
+
+        route = self.routes.get(path)
+        if route is None:
+            return 404, {"rsp_cd": "IGW00404", "rsp_msg": f"Unknown endpoint: {path}"}, {}
+        category, build, out_key = route
+
+        if not self._token_valid(headers.get("Authorization", "")):
+            with self._lock:
+                self._stats["expired"] += 1
+            return 500, {"rsp_cd": TOKEN_EXPIRED_CODE, "rsp_msg": "토큰 유효성이 만료되었습니다."}, {}
+
+        if not self._allow(category):
+            with self._lock:
+                self._stats["throttled"] += 1
+            return 429, {"rsp_cd": THROTTLED_CODE, "rsp_msg": "초당 거래건수를 초과하였습니다."}, {}
+
+        try:
+            inputs = (json.loads(raw) if raw else {}).get("In", {})
+        except ValueError:
+            return 400, {"rsp_cd": "IGW00400", "rsp_msg": "Invalid JSON"}, {}
+
+        if out_key is None:
+            return 200, {"rsp_cd": OK_CODE, "rsp_msg": OK_MESSAGE, **build(inputs)}, {}
+
+        # 연속 조회: cont_key는 다음 행 위치
+        body, row = build(inputs)
+        total = self.rows_per_endpoint.get(path, self.total_rows)
+        try:
+            start = int(headers.get("cont_key") or 0)
+        except ValueError:
+            start = 0
+        end = min(total, start + self.page_size)
+        body = {"rsp_cd": OK_CODE, "rsp_msg": OK_MESSAGE, **body, out_key: [row(i) for i in range(start, end)]}
+        return 200, body, {"cont_yn": "Y" if end < total else "N", "cont_key": str(end) if end < total else ""}
+
+    def _issue_token(self) -> Dict[str, Any]:
+        with self._lock:
+            self._stats["tokens_issued"] += 1
+            token = f"mock-{self._stats['tokens_issued']}-{random.getrandbits(32):08x}"
+            self._tokens[token] = time.monotonic()
+        return {"access_token": token, "token_type": "Bearer", "expires_in": self.token_ttl, "scope": "oob"}
+
+    def _token_valid(self, authorization: str) -> bool:
+        token = authorization.split(" ", 1)[-1]
+        with self._lock:
+            issued = self._tokens.get(token)
+        if issued is None:
+            return False
+        return self.token_expire_after is None or time.monotonic() - issued < self.token_expire_after
+
+    def _allow(self, category: str) -> bool:
+        rate = self.rate_limits.get(category)
+        if rate is None:
+            return True
+        now = time.monotonic()
+        with self._lock:
+            window = self._windows.setdefault(category, deque())
+            while window and now - window[0] >= 1.0:
+                window.popleft()
+            if len(window) >= rate:
+                return False
+            window.append(now)
+            return True
+
+    # ===== 응답 생성 =====
+
+    def _next_order_no(self) -> int:
+        with self._lock:
+            self._order_no += 1
+            return self._order_no
+
+    def _order(self, inputs):
+        return {"Out": {"OrdNo": self._next_order_no(), "OrdTime": datetime.now().strftime("%H%M%S%f")[:9]}}
+
+    def _cancel(self, inputs):
+        return {"Out": {"OrdNo": self._next_order_no(), "OrgOrdNo": inputs.get("OrgOrdNo", 0)}}
+
+    def _kr_transactions(self, inputs):
+        def row(i):
+            code, name = _domestic_stock(i % len(DOMESTIC_STOCKS))
+            price = _price_at(code, i, False)
+            qty = 1 + _seed(f"{code}{i}") % 50
+            return {
+                "OrdNo": i + 1,
+                "IsuNo": f"A{code}",
+                "IsuNm": name,
+                "BnsTpCode": "2" if i % 2 else "1",
+                "OrdQty": qty,
+                "ExecQty": qty,
+                "OrdPrc": price,
+                "ExecPrc": price,
+                "ExecAmt": price * qty,
+                "OrdTime": f"{9 + i % 6:02d}{i % 60:02d}00000",
+            }
+        return {"Out": {"TotExecQty": 0}}, row
+
+    def _kr_able_qty(self, inputs):
+        price = float(inputs.get("OrdPrc") or 0) or 10000.0
+        return {"Out": {"OrdAbleAmt": 10_000_000, "OrdAbleQty": int(10_000_000 // price)}}
+
+    def _kr_holding(self, i):
+        code, name = _domestic_stock(i)
+        price = _price_at(code, 0, False)
+        qty = 10 + _seed(code) % 90
+        buy_amt = int(price * 0.95) * qty
+        eval_amt = int(price) * qty
+        return {
+            "IsuNo": f"A{code}",
+            "IsuNm": name,
+            "BalQty0": qty,
+            "AbleQty": qty,
+            "PchsAmt": buy_amt,
+            "EvalAmt": eval_amt,
+            "EvalPnlAmt": eval_amt - buy_amt,
+            "Ernrat": f"{(eval_amt - buy_amt) / buy_amt:.6f}",
+            "NowPrc": f"{price:.0f}",
+        }
+
+    def _kr_balance(self, inputs):
+        total = self.rows_per_endpoint.get("/api/v1/trading/kr-stock/inquiry/balance", self.total_rows)
+        holdings = [self._kr_holding(i) for i in range(total)]
+        buy_amt = sum(h["PchsAmt"] for h in holdings)
+        eval_amt = sum(h["EvalAmt"] for h in holdings)
+        summary = {
+            "DpsastAmt": eval_amt + 5_000_000,
+            "TotErnrat": f"{(eval_amt - buy_amt) / buy_amt:.6f}" if buy_amt else "0",
+            "TotBuyAmt": buy_amt,
+            "TotEvalAmt": eval_amt,
+            "TotEvalPnlAmt": eval_amt - buy_amt,
+            "ThdayBuyAmt": 0,
+            "ThdaySellAmt": 0,
+            "Dps2": 5_000_000,
+        }
+        return {"Out": summary}, self._kr_holding
+
+    def _kr_deposit(self, inputs):
+        return {
+            "Out": {"DpsastTotamt": 5_000_000},
+            "Out1": {"DpsBalAmt": 5_000_000, "PrsmptDpsD1": 5_000_000, "PrsmptDpsD2": 5_000_000},
+        }
+
+    def _futures_balance(self, inputs):
+        def row(i):
+            return {
+                "FnoIsuNo": f"101W{i:04d}",
+                "FnoIsuNm": f"F {2400 + i}",
+                "BnsTpCode": "2",
+                "UnsttQty": 1 + i % 5,
+                "FnoAvrPrc": 350.0 + i,
+                "NowPrc": 352.5 + i,
+                "EvalPnlAmt": 625_000,
+            }
+        return {"Out": {"EvalDpstgTotamt": 50_000_000}}, row
+
+    def _us_transactions(self, inputs):
+        # 전일 22시부터 당일 06시 사이 체결 (get_execute_amounts_overseas 기준 구간)
+        opened = _parse_date(inputs.get("QrySrtDt")) + timedelta(hours=22)
+
+        def row(i):
+            symbol = _overseas_stock(i % len(OVERSEAS_STOCKS))[0]
+            executed = opened + timedelta(minutes=(i * 7) % 480)
+            price = _price_at(symbol, i, True)
+            qty = 1 + _seed(f"{symbol}{i}") % 20
+            return {
+                "AstkExecDttm": executed.strftime("%Y%m%d%H%M%S") + "000",
+                "AstkIsuNo": symbol,
+                "AstkBnsTpCode": "2" if i % 2 else "1",
+                "AstkExecQty": str(qty),
+                "AstkExecPrc": f"{price:.2f}",
+                "WonAmt3": f"{price * qty * 1350:.0f}",
+            }
+        return {}, row
+
+    def _us_able_qty(self, inputs):
+        return {"Out": {"AstkOrdAbleAmt": "7407.40", "AstkOrdAbleAmt0": "10000000", "AstkOrdAbleQty": "50"}}
+
+    def _us_holding(self, i):
+        symbol, name, _ = _overseas_stock(i)
+        price = _price_at(symbol, 0, True)
+        avg = round(price * 0.9, 2)
+        qty = 1 + _seed(symbol) % 30
+        return {
+            "SymCode": symbol,
+            "AstkHanglIsuNm": name,
+            "AstkExecBaseQty": f"{qty}",
+            "AstkOrdAbleQty": f"{qty}",
+            "AstkAvrPchsPrc": f"{avg:.4f}",
+            "AstkNowPrc": f"{price:.4f}",
+            "AstkBuyAmt": f"{avg * qty:.2f}",
+            "AstkEvalAmt": f"{price * qty:.2f}",
+            "AstkEvalPnlAmt": f"{(price - avg) * qty:.2f}",
+            "EvalPnlRat": f"{(price - avg) / avg * 100:.4f}",
+            "AstkUpdnRat": f"{(_price_at(symbol, 0, True) / _price_at(symbol, 1, True) - 1) * 100:.2f}",
+        }
+
+    def _us_balance(self, inputs):
+        return {"Out": {"WonDpsBalAmt": "10000000"}, "Out1": [{"CrcyCode": "USD", "FcurrDps": "7407.40"}]}, self._us_holding
+
+    def _us_deposit(self, inputs):
+        return {
+            "Out": {"WonDpsBalAmt": "10000000", "FcurrOrdAbleAmt": "7407.40"},
+            "Out1": [{"CrcyCode": "USD", "FcurrDps": "7407.40", "BaseXchrat": "1350.00"}],
+        }
+
+    def _kr_tickers(self, inputs):
+        def row(i):
+            code, name = _domestic_stock(i)
+            return {"Iscd": code, "KorIsnm": name, "MrktDivCode": inputs.get("InputCondMrktDivCode", "J")}
+        return {}, row
+
+    def _us_tickers(self, inputs):
+        def row(i):
+            symbol, name, eng_name = _overseas_stock(i)
+            return {"SymCode": symbol, "KorIsnm": name, "EngIsnm": eng_name, "MrktDivCode": inputs.get("InputDataCode", "NY")}
+        return {}, row
+
+    def _price(self, code: str, overseas: bool):
+        now, prev = _price_at(code, 0, overseas), _price_at(code, 1, overseas)
+        fmt = "{:.4f}" if overseas else "{:.0f}"
+        return {
+            "Out": {
+                "Iscd": code,
+                "Prpr": fmt.format(now),
+                "PrdyVrss": fmt.format(now - prev),
+                "PrdyCtrt": f"{(now / prev - 1) * 100:.2f}",
+                "Oprc": fmt.format(prev),
+                "Hprc": fmt.format(max(now, prev) * 1.01),
+                "Lprc": fmt.format(min(now, prev) * 0.99),
+                "AcmlVol": str(100_000 + _seed(code) % 900_000),
+            }
+        }
+
+    def _orderbook(self, code: str, overseas: bool):
+        price = _price_at(code, 0, overseas)
+        tick = 0.01 if overseas else (100 if price >= 50_000 else 50 if price >= 10_000 else 10)
+        fmt = "{:.2f}" if overseas else "{:.0f}"
+        out = {}
+        for level in range(1, 11):
+            out[f"Askp{level}"] = fmt.format(price + tick * level)
+            out[f"Bidp{level}"] = fmt.format(price - tick * (level - 1))
+            out[f"AskpRsqn{level}"] = str(100 * level + _seed(f"{code}a{level}") % 1000)
+            out[f"BidpRsqn{level}"] = str(100 * level + _seed(f"{code}b{level}") % 1000)
+        out["TotalAskpRsqn"] = str(sum(int(out[f"AskpRsqn{level}"]) for level in range(1, 11)))
+        out["TotalBidpRsqn"] = str(sum(int(out[f"BidpRsqn{level}"]) for level in range(1, 11)))
+        return {"Out": out}
+
+    def _kr_price(self, inputs):
+        return self._price(str(inputs.get("InputIscd1", "")), False)
+
+    def _us_price(self, inputs):
+        return self._price(str(inputs.get("InputIscd1", "")), True)
+
+    def _kr_orderbook(self, inputs):
+        return self._orderbook(str(inputs.get("InputIscd1", "")), False)
+
+    def _us_orderbook(self, inputs):
+        return self._orderbook(str(inputs.get("InputIscd1", "")), True)
+
+    def _chart(self, period: str, overseas: bool) -> Callable:
+        """기준일부터 과거 방향으로 최신 봉이 먼저 오는 차트 응답"""
+
+        def build(inputs):
+            code = str(inputs.get("InputIscd1", ""))
+            end = inputs.get("InputDate2") or inputs.get("InputDate1")
+            if end in (None, "", "0"):
+                end = datetime.now().strftime("%Y%m%d")
+            base = _parse_date(end)
+            interval = int(inputs.get("InputDivXtick") or 60)  # 초 단위 (60: 1분)
+            close_time = base + (timedelta(hours=16) if overseas else timedelta(hours=15, minutes=30))
+            last_weekday = base - timedelta(days=max(0, base.weekday() - 4))
+
+            def row(i):
+                if period == "min":
+                    at = close_time - timedelta(seconds=interval * i)
+                elif period == "day":
+                    # 기준일 이전 마지막 평일부터 i 거래일 전 (주말 제외)
+                    at = last_weekday - timedelta(days=(i // 5) * 7)
+                    step = 0
+                    while step < i % 5:
+                        at -= timedelta(days=1)
+                        if at.weekday() < 5:
+                            step += 1
+                elif period == "week":
+                    at = base - timedelta(days=base.weekday() + 7 * i)
+                else:
+                    month = base.year * 12 + base.month - 1 - i
+                    at = datetime(month // 12, month % 12 + 1, 1)
+                close = _price_at(code, i, overseas)
+                open_ = _price_at(code, i + 1, overseas)
+                high, low = max(open_, close) * 1.005, min(open_, close) * 0.995
+                fmt = "{:.4f}" if overseas else "{:.0f}"
+                return {
+                    "Date": at.strftime("%Y%m%d"),
+                    "Hour": at.strftime("%H%M%S") if period == "min" else "000000",
+                    "Oprc": fmt.format(open_),
+                    "Hprc": fmt.format(high),
+                    "Lprc": fmt.format(low),
+                    "Prpr": fmt.format(close),
+                    "Cntg_Vol": str(1000 + (_seed(code) + i * 7919) % 50_000),
+                }
+
+            return {}, row
+
+        return build
+
+
+class MockTransport:
+    """
+    소켓 없이 MockDBFIServer로 요청을 전달하는 HTTPTransport 호환 전송 계층
+
+    네트워크 비용을 제외한 SDK 자체 오버헤드를 측정할 때 사용한다. 서버를 start()하지 않아도 된다.
+
+    사용 예:
+        server = MockDBFIServer(total_rows=500)
+        dbfi = DBFI(app_key="test", app_secret_key="test", base_url=server.url, transport=MockTransport(server))
+    """
+
+    def __init__(self, server: MockDBFIServer):
+        self.server = server
+        self._closed = False
+
+    def request(self, method: str, url: str, headers=None, **kwargs) -> requests.Response:
+        data = kwargs.get("data")
+        if kwargs.get("json") is not None:
+            raw = json.dumps(kwargs["json"]).encode("utf-8")
+        elif isinstance(data, dict):
+            raw = urlencode(data).encode("utf-8")
+        else:
+            raw = data.encode("utf-8") if isinstance(data, str) else (data or b"")
+        started = time.perf_counter()
+        status, body, response_headers = self.server.dispatch(
+            urlsplit(url).path, CaseInsensitiveDict(headers or {}), raw
+        )
+        response = requests.Response()
+        response.elapsed = timedelta(seconds=time.perf_counter() - started)
+        response.status_code = status
+        response.url = url
+        response.encoding = "utf-8"
+        response._content = json.dumps(body, ensure_ascii=False).encode("utf-8")
+        response.headers = CaseInsensitiveDict(
+            {"Content-Type": "application/json; charset=utf-8", **response_headers}
+        )
+        return response
+
+    def post(self, url: str, **kwargs) -> requests.Response:
+        return self.request("POST", url, **kwargs)
+
+    def close(self):
+        self._closed = True
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="DB증권 API 모의 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8443)
+    parser.add_argument("--latency", type=float, default=0.0, help="응답 지연 (초)")
+    parser.add_argument("--page-size", type=int, default=20)
+    parser.add_argument("--total-rows", type=int, default=60)
+    parser.add_argument("--rate-limit", action="append", default=[], metavar="분류=초당요청수")
+    parser.add_argument("--token-expire-after", type=float, default=None, help="토큰 만료 시간 (초)")
+    args = parser.parse_args()
+
+    server = MockDBFIServer(
+        host=args.host,
+        port=args.port,
+        latency=args.latency,
+        page_size=args.page_size,
+        total_rows=args.total_rows,
+        rate_limits={key: float(value) for key, value in (item.split("=", 1) for item in args.rate_limit)},
+        token_expire_after=args.token_expire_after,
+    ).start()
+    print(f"Mock DB증권 API: {server.url} (PYDBFI_BASE_URL={server.url})")
+    try:
+        server._thread.join()
+    except KeyboardInterrupt:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
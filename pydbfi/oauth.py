@@ -1,11 +1,15 @@
 import uuid
 import random
+import hashlib
 import logging
 import requests
 import threading
 from datetime import datetime, timedelta
 from tenacity import retry, stop_after_attempt, wait_fixed
 
+from .token_store import TokenStore
+from .transport import HTTPTransport
+
 # user agent samples
 desktop_agents = [
     # Chrome Windows
@@ -48,6 +52,33 @@ mobile_agents = [
     "Mozilla/5.0 (Android 13; Mobile; rv:121.0) Gecko/121.0 Firefox/121.0",
 ]
 
+# fake_useragent에서 한 번만 생성하는 User-Agent 풀
+USER_AGENT_POOL_SIZE = 100
+_user_agents = None
+_user_agents_lock = threading.Lock()
+
+
+def get_user_agents() -> list:
+    """
+    요청 헤더에 사용할 User-Agent 목록 (최초 호출 시 한 번만 생성)
+
+    fake_useragent 데이터셋 로드는 비용이 크므로 매 요청마다 UserAgent()를 만들지 않고
+    미리 뽑아 둔 목록에서 선택한다. 사용할 수 없으면 내장 샘플 목록을 사용한다.
+    """
+    global _user_agents
+    if _user_agents is None:
+        with _user_agents_lock:
+            if _user_agents is None:
+                try:
+                    from fake_useragent import UserAgent
+                    user_agent = UserAgent()
+                    agents = list({user_agent.random for _ in range(USER_AGENT_POOL_SIZE)})
+                except Exception as e:
+                    logging.getLogger(__name__).error(f"UserAgent Error: {e}")
+                    agents = desktop_agents + mobile_agents
+                _user_agents = agents
+    return _user_agents
+
 
 class TokenRequestError(Exception):
     """API 토큰 요청 과정에서 발생한 오류를 처리하기 위한 커스텀 예외"""
@@ -79,16 +110,27 @@ class OAuth:
         token: str = None,
         token_type: str = None,
         expire_in: str = None,
+        transport: HTTPTransport = None,
+        token_store: TokenStore = None,
+        base_url: str = None,
     ):
         self.appkey = appkey
         self.appsecretkey = appsecretkey
-        self.token = token
-        self.token_type = token_type
-        self.expire_in = expire_in
+        # (token, token_type, expire_in, 세대)를 한 번에 교체하여 읽는 쪽이 섞인 값을 보지 않도록 함
+        self._token_state = (token, token_type, expire_in, 0)
         self.logger = logging.getLogger(__name__)
         self._initialized = True
-        self.headers = headers
+        self.headers = dict(headers)  # 모든 요청에 공통으로 추가할 헤더
+        self._static_headers = None  # ((token_type, token), 고정 헤더)
         self._lock = threading.Lock()  # 인스턴스별 락
+        self.transport = transport if transport is not None else HTTPTransport()
+        # 지정 시 BASE_URL 대신 사용 (모의 서버 등). 서비스 객체도 같은 주소 사용
+        self.base_url = base_url
+        if base_url is not None:
+            self.BASE_URL = base_url.rstrip("/")
+        # 지정 시 프로세스/재시작 간 토큰 공유 (app key별 항목)
+        self.token_store = token_store
+        self._store_key = hashlib.sha256(appkey.encode()).hexdigest()[:16]
         
         # init auth
         self.init_auth()
@@ -104,22 +146,122 @@ class OAuth:
         # init headers
         self.get_auth_header()
 
+    @property
+    def token(self) -> str:
+        return self._token_state[0]
+
+    @token.setter
+    def token(self, value: str):
+        self._replace_token(value, self.token_type, self.expire_in)
+
+    @property
+    def token_type(self) -> str:
+        return self._token_state[1]
+
+    @token_type.setter
+    def token_type(self, value: str):
+        self._replace_token(self.token, value, self.expire_in)
+
+    @property
+    def expire_in(self) -> datetime:
+        return self._token_state[2]
+
+    @expire_in.setter
+    def expire_in(self, value: datetime):
+        self._replace_token(self.token, self.token_type, value)
+
+    @property
+    def token_generation(self) -> int:
+        """토큰이 교체될 때마다 1씩 증가"""
+        return self._token_state[3]
+
+    def _replace_token(self, token: str, token_type: str, expire_in: datetime) -> None:
+        self._token_state = (token, token_type, expire_in, self._token_state[3] + 1)
+
+    def invalidate_token(self, generation: int) -> None:
+        """
+        서버가 토큰 만료(IGW00121)로 거절한 경우 호출
+
+        같은 세대에 대해서는 한 번만 재발급하고, 동시에 호출한 스레드는 락에서 대기한 뒤
+        이미 교체된 토큰을 그대로 사용한다.
+
+        Args:
+            generation: 거절된 요청에 사용한 토큰 세대 (token_generation)
+        """
+        if self.token_generation != generation:
+            return
+        with self._lock:
+            if self.token_generation != generation:
+                return
+            self.logger.warning("token 유효성 만료: 토큰 재발급 진행합니다.")
+            self._refresh_token(rejected=self.token)
+
     def get_token(self, is_refresh: bool = False) -> str:
         # 토큰 강제 업데이트
         if is_refresh:
-            self.request_token()
+            self._refresh_token(rejected=self.token)
             return self.token
         
         if not self.is_token_valid():
             with self._lock:
                 if not self.is_token_valid():
-                    self.request_token()
+                    self._refresh_token()
         return self.token
 
+    def _refresh_token(self, rejected: str = None) -> None:
+        """
+        저장소에 유효한 토큰이 있으면 재사용하고, 없으면 저장소 잠금 안에서 발급
+
+        Args:
+            rejected: 서버가 거절한 토큰 (저장소에 같은 토큰이 있어도 재사용하지 않음)
+        """
+        if self.token_store is None:
+            self.request_token()
+            return
+        if self._load_stored_token(rejected):
+            return
+        with self.token_store.lock():
+            # 잠금을 기다리는 동안 다른 프로세스가 발급했을 수 있음
+            if self._load_stored_token(rejected):
+                return
+            self.request_token()
+
+    def _load_stored_token(self, rejected: str = None) -> bool:
+        try:
+            stored = self.token_store.load(self._store_key)
+        except Exception as e:
+            self.logger.error(f"Failed to load stored token: {e}")
+            return False
+        if not stored or stored.get("access_token") == rejected:
+            return False
+        expire_in = datetime.fromtimestamp(stored["expire_at"])
+        if datetime.now() + timedelta(minutes=10) >= expire_in:
+            return False
+        self._replace_token(stored["access_token"], stored["token_type"], expire_in)
+        self.logger.info(f"Reusing stored access token. Valid until: {self.expire_in}")
+        return True
+
+    def _store_token(self) -> None:
+        if self.token_store is None:
+            return
+        try:
+            self.token_store.save(
+                self._store_key,
+                {
+                    "access_token": self.token,
+                    "token_type": self.token_type,
+                    "expire_at": self.expire_in.timestamp(),
+                },
+            )
+        except Exception as e:
+            # 저장 실패는 발급된 토큰 사용에 영향을 주지 않음
+            self.logger.error(f"Failed to store access token: {e}")
+
     def is_token_valid(self) -> bool:
-        if not self.token or not self.token_type or not self.expire_in:
+        token, token_type, expire_in, _ = self._token_state
+        if not token or not token_type or not expire_in:
             return False
-        return datetime.now() + timedelta(minutes=10) < self.expire_in
+        return datetime.now() + timedelta(minutes=10) < expire_in
 
     @retry(
         stop=stop_after_attempt(3),
@@ -128,47 +270,56 @@ class OAuth:
     )
     def request_token(self) -> None:
         headers = {"content-type": "application/x-www-form-urlencoded"}
-        data = {
-            "grant_type": "client_credentials",
-            "appkey": self.appkey,
-            "appsecretkey": self.appsecretkey,
-            "scope": "oob",
-        }
         try:
             self.logger.info("Requesting new access token from DB Securities API")
-            response = requests.post(
-                f"{self.BASE_URL}/oauth2/token", headers=headers, data=data
+            response = self.transport.post(
+                f"{self.BASE_URL}/oauth2/token", headers=headers, data=self._token_request_data()
             )
             response.raise_for_status()
-            token_data = response.json()
-
-            self.token = token_data.get("access_token")
-            expire_in = int(token_data.get("expires_in", 86400))
-            self.expire_in = datetime.now() + timedelta(seconds=expire_in)
-            self.token_type = token_data.get("token_type")
-            self.logger.info(
-                f"New access token obtained. Valid until: {self.expire_in}"
-            )
+            self._set_token(response.json())
         except requests.exceptions.RequestException as e:
-            status_code = None
-            error_message = str(e)
-            response_body = None
-            
-            # response 객체가 있는 경우 상태 코드와 응답 내용 추출
-            if hasattr(e, 'response') and e.response is not None:
-                status_code = e.response.status_code
-                
-                # 응답 본문 저장
-                try:
-                    response_body = e.response.json()
-                    error_message = response_body.get('error_description', response_body.get('error', str(e)))
-                except ValueError:
-                    # JSON이 아닌 경우 텍스트 내용 사용
-                    response_body = e.response.text
-                    error_message = response_body
+            raise self._token_error(e, getattr(e, "response", None))
+
+    def _token_request_data(self) -> dict:
+        return {
+            "grant_type": "client_credentials",
+            "appkey": self.appkey,
+            "appsecretkey": self.appsecretkey,
+            "scope": "oob",
+        }
+
+    def _set_token(self, token_data: dict) -> None:
+        expire_in = int(token_data.get("expires_in", 86400))
+        self._replace_token(
+            token_data.get("access_token"),
+            token_data.get("token_type"),
+            datetime.now() + timedelta(seconds=expire_in),
+        )
+        self.logger.info(
+            f"New access token obtained. Valid until: {self.expire_in}"
+        )
+        self._store_token()
+
+    def _token_error(self, e: Exception, response=None) -> TokenRequestError:
+        status_code = None
+        error_message = str(e)
+        response_body = None
+        
+        # response 객체가 있는 경우 상태 코드와 응답 내용 추출
+        if response is not None:
+            status_code = response.status_code
             
-            self.logger.error(f"Failed to obtain access token: Status code: {status_code}, Error: {error_message}")
-            raise TokenRequestError(e, status_code, error_message, response_body)
+            # 응답 본문 저장
+            try:
+                response_body = response.json()
+                error_message = response_body.get('error_description', response_body.get('error', str(e)))
+            except ValueError:
+                # JSON이 아닌 경우 텍스트 내용 사용
+                response_body = response.text
+                error_message = response_body
+        
+        self.logger.error(f"Failed to obtain access token: Status code: {status_code}, Error: {error_message}")
+        return TokenRequestError(e, status_code, error_message, response_body)
 
     def revoke_token(self) -> dict:
         if not self.token:
@@ -176,53 +327,64 @@ class OAuth:
             return {"code": 400, "message": "No token to revoke"}
 
         headers = {"content-type": "application/x-www-form-urlencoded"}
-        data = {
-            "appkey": self.appkey,
-            "appsecretkey": self.appsecretkey,
-            "token": self.token,
-            "token_type_hint": "access_token",
-        }
         try:
             self.logger.info("Revoking access token")
-            response = requests.post(
-                f"{self.BASE_URL}/oauth2/revoke", headers=headers, data=data
+            response = self.transport.post(
+                f"{self.BASE_URL}/oauth2/revoke", headers=headers, data=self._revoke_request_data()
             )
             response.raise_for_status()
-            result = response.json()
-            if result.get("code") == 200:
-                self.token = None
-                self.expire_in = None
-                self.token_type = None
-                self.logger.info("Token successfully revoked")
-            return result
+            return self._on_revoked(response.json())
         except requests.RequestException as e:
             self.logger.error(f"Failed to revoke token: {str(e)}")
             if hasattr(e, "response") and e.response:
                 self.logger.error(f"Response: {e.response.text}")
             raise e
 
-    def get_auth_header(self) -> dict:    
-        try:
-            from fake_useragent import UserAgent
-            user_agent = UserAgent().random
-        except Exception as e:
-            self.logger.error(f"UserAgent Error: {e}")
-            user_agent = random.choice(desktop_agents + mobile_agents)
-        
-        headers = {
-            **self.headers,
-            'Authorization': f"{self.token_type} {self.get_token()}",
-            'User-Agent': user_agent,
-            'X-Session-ID': str(uuid.uuid4()),
-            'Accept': 'application/json',
-            'Accept-Language': 'ko-KR,ko;q=0.9,en;q=0.8',
-            'Accept-Encoding': 'gzip, deflate',
-            'Cache-Control': 'no-cache',
-            'Pragma': 'no-cache',
-            'Connection': 'keep-alive',
+    def _revoke_request_data(self) -> dict:
+        return {
+            "appkey": self.appkey,
+            "appsecretkey": self.appsecretkey,
+            "token": self.token,
+            "token_type_hint": "access_token",
         }
+
+    def _on_revoked(self, result: dict) -> dict:
+        if result.get("code") == 200:
+            if self.token_store is not None:
+                self.token_store.delete(self._store_key)
+            self._replace_token(None, None, None)
+            self.logger.info("Token successfully revoked")
+        return result
+
+    def get_auth_header(self) -> dict:
+        """
+        요청 헤더 생성
+
+        토큰이 바뀔 때만 고정 헤더(Authorization 등)를 다시 만들고,
+        호출마다 User-Agent, X-Session-ID 등 요청별 필드만 추가한다.
+        """
+        self.get_token()
+        token, token_type, _, _ = self._token_state
+        static = self._static_headers
+        if static is None or static[0] != (token_type, token):
+            static = self._static_headers = (
+                (token_type, token),
+                {
+                    **self.headers,
+                    'Authorization': f"{token_type} {token}",
+                    'Accept': 'application/json',
+                    'Accept-Language': 'ko-KR,ko;q=0.9,en;q=0.8',
+                    'Accept-Encoding': 'gzip, deflate',
+                    'Cache-Control': 'no-cache',
+                    'Pragma': 'no-cache',
+                    'Connection': 'keep-alive',
+                },
+            )
+
+        headers = dict(static[1])
+        headers['User-Agent'] = random.choice(get_user_agents())
+        headers['X-Session-ID'] = str(uuid.uuid4())
         # 20% 확률로 추가 헤더 삽입 (자연스러운 변화)
         if random.random() < 0.2:
             headers['X-Forwarded-For'] = f"10.0.{random.randint(1,254)}.{random.randint(1,254)}"
-        self.headers = headers        
-        return self.headers
\ No newline at end of file
+        return headers
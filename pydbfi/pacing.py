@@ -0,0 +1,145 @@
+import threading
+import time
+from typing import Dict, Iterable, Optional
+
+from .ratelimit import RateLimiter
+
+# 페이서 미지정 시 연속 조회 간 고정 대기 시간 (초)
+DEFAULT_CONTINUATION_INTERVAL = 1.5
+
+
+class ContinuationPacer:
+    """
+    엔드포인트별 연속 조회 간격 조절
+
+    연속 페이지가 정상 응답되면 간격을 speedup 배로 줄이고, 서버가 유량 제한으로
+    거절하면 backoff 배로 늘린 뒤 그 간격을 하한으로 기억한다. 하한은 이후 floor_decay_pages
+    페이지가 연속으로 정상 응답될 때마다 speedup 배로 낮아지므로, 다른 프로세스 등으로 인한
+    일시적인 거절이 간격을 계속 늘려 두지 않는다. 학습한 간격은 엔드포인트별로 유지된다.
+
+    사용 예:
+        pacer = ContinuationPacer(intervals={"/api/v1/quote/kr-chart/min": 0.5})
+        dbfi = DBFI(app_key="...", app_secret_key="...", pacer=pacer)
+        pacer.stats()
+
+    Args:
+        initial_interval: 엔드포인트별 최초 간격 (초)
+        min_interval: 최소 간격 (초). 유량 제한이 설정된 분류는 RateLimiter가 간격을 보장
+        max_interval: 최대 간격 (초)
+        speedup: 정상 응답 시 간격 감소 비율
+        backoff: 유량 제한 거절 시 간격 증가 비율
+        intervals: 엔드포인트별 최초 간격 지정
+        adaptive: False이면 간격을 조절하지 않고 고정 간격으로 동작
+        rate_limiter: 분류별 유량 제한 참조용
+        throttle_codes: 유량 제한 거절로 간주할 rsp_cd 목록 (HTTP 429는 항상 포함)
+        floor_decay_pages: 하한을 낮추기까지 필요한 연속 정상 페이지 수 (None이면 하한 유지)
+    """
+
+    def __init__(
+        self,
+        initial_interval: float = DEFAULT_CONTINUATION_INTERVAL,
+        min_interval: float = 0.1,
+        max_interval: float = 10.0,
+        speedup: float = 0.75,
+        backoff: float = 2.0,
+        intervals: Optional[Dict[str, float]] = None,
+        adaptive: bool = True,
+        rate_limiter: Optional[RateLimiter] = None,
+        throttle_codes: Iterable[str] = (),
+        floor_decay_pages: Optional[int] = 20,
+    ):
+        self.initial_interval = initial_interval
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.speedup = speedup
+        self.backoff = backoff
+        self.intervals = dict(intervals or {})
+        self.adaptive = adaptive
+        self.rate_limiter = rate_limiter
+        self.throttle_codes = set(throttle_codes)
+        self.floor_decay_pages = floor_decay_pages
+        self._state: Dict[str, Dict[str, float]] = {}
+        self._lock = threading.Lock()
+
+    def _get_state(self, endpoint: str) -> Dict[str, float]:
+        state = self._state.get(endpoint)
+        if state is None:
+            interval = self.intervals.get(endpoint, self.initial_interval)
+            state = self._state[endpoint] = {
+                "interval": interval,
+                "floor": 0.0,
+                "clean_pages": 0,  # 마지막 거절(또는 하한 감소) 이후 연속 정상 페이지 수
+                "pages": 0,
+                "throttles": 0,
+                "total_wait": 0.0,
+            }
+        return state
+
+    def _min_interval(self, rate_limit_key: Optional[str]) -> float:
+        if self.rate_limiter is not None and rate_limit_key:
+            if self.rate_limiter.get_limit(rate_limit_key) is not None:
+                # 제한이 있는 분류는 RateLimiter가 간격을 보장하므로 중복 대기하지 않음
+                return 0.0
+        return self.min_interval
+
+    def interval(self, endpoint: str) -> float:
+        with self._lock:
+            return self._get_state(endpoint)["interval"]
+
+    def delay(self, endpoint: str, since: Optional[float] = None) -> float:
+        """
+        다음 연속 페이지 요청 전 대기해야 할 시간(초)을 반환 (대기는 호출자가 수행)
+
+        Args:
+            since: 직전 페이지 요청 시각 (time.monotonic). 응답 처리에 걸린 시간만큼 대기를 줄임
+        """
+        elapsed = 0.0 if since is None else time.monotonic() - since
+        with self._lock:
+            state = self._get_state(endpoint)
+            delay = max(0.0, state["interval"] - elapsed)
+            state["total_wait"] += delay
+        return delay
+
+    def wait(self, endpoint: str, since: Optional[float] = None) -> float:
+        """다음 연속 페이지 요청 전 대기하고 대기한 시간(초)을 반환"""
+        delay = self.delay(endpoint, since)
+        if delay > 0:
+            time.sleep(delay)
+        return delay
+
+    def on_success(self, endpoint: str, rate_limit_key: Optional[str] = None):
+        """연속 페이지 정상 응답"""
+        with self._lock:
+            state = self._get_state(endpoint)
+            state["pages"] += 1
+            if self.adaptive:
+                state["clean_pages"] += 1
+                if state["floor"] and self.floor_decay_pages and state["clean_pages"] >= self.floor_decay_pages:
+                    state["clean_pages"] = 0
+                    state["floor"] *= self.speedup
+                    if state["floor"] < self.min_interval:
+                        state["floor"] = 0.0
+                lower = max(self._min_interval(rate_limit_key), state["floor"])
+                state["interval"] = max(lower, state["interval"] * self.speedup)
+
+    def on_throttle(self, endpoint: str):
+        """서버 유량 제한 거절"""
+        with self._lock:
+            state = self._get_state(endpoint)
+            state["throttles"] += 1
+            if self.adaptive:
+                state["clean_pages"] = 0
+                # 거절된 간격보다 약간 높은 값을 하한으로 학습
+                state["floor"] = min(self.max_interval, state["interval"] * 1.1)
+                state["interval"] = min(
+                    self.max_interval,
+                    max(state["floor"], state["interval"] * self.backoff, self.min_interval),
+                )
+
+    def is_throttled(self, status_code: int, rsp_cd: Optional[str] = None) -> bool:
+        return status_code == 429 or (rsp_cd is not None and rsp_cd in self.throttle_codes)
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        """엔드포인트별 현재 간격, 페이지 수, 거절 횟수, 누적 대기 시간"""
+        with self._lock:
+            return {endpoint: dict(state) for endpoint, state in self._state.items()}
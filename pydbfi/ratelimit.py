@@ -0,0 +1,235 @@
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, Optional, Tuple
+
+# README 유량 제한 (초당 요청 수)
+DEFAULT_RATE_LIMITS = {
+    "order": 10,  # 주문
+    "cancel": 3,  # 취소
+    "history": 2,  # 체결 내역 및 거래 내역 조회
+    "inquiry": 2,  # 주문 가능 수량 및 주식 잔고 조회
+    "futures_balance": 2,  # 국내 선물옵션 잔고 조회
+    "deposit": 1,  # 계좌 예수금 조회
+    # README에 명시되지 않은 분류는 동시 조회(get_stock_prices 등)가 서버 제한에 걸리지 않도록 보수적으로 제한
+    "quote": 10,  # 현재가, 호가, 종목 조회
+    "chart": 5,  # 차트 조회
+}
+
+
+class _TokenBucket:
+    """
+    예약 방식 토큰 버킷
+
+    호출자는 락 안에서 다음 슬롯을 예약하고 락 밖에서 대기하므로
+    동시에 들어온 요청이 도착 순서대로 1/rate 간격으로 배치된다.
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = float(rate)
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """토큰 1개를 예약하고 대기해야 할 시간(초)을 반환"""
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = _refill(self.tokens, self.updated, now, self.rate, self.burst) - 1
+            self.updated = now
+            return 0.0 if self.tokens >= 0 else -self.tokens / self.rate
+
+
+def _refill(tokens: float, updated: float, now: float, rate: float, burst: int) -> float:
+    return min(burst, tokens + max(0.0, now - updated) * rate)
+
+
+class RateLimitBackend:
+    """토큰 버킷 상태 저장소 인터페이스"""
+
+    def reserve(self, key: str, rate: float, burst: int) -> float:
+        """key 버킷에서 토큰 1개를 예약하고 대기해야 할 시간(초)을 반환"""
+        raise NotImplementedError
+
+    def close(self):
+        pass
+
+
+class MemoryRateLimitBackend(RateLimitBackend):
+    """프로세스 내 스레드 간 공유 (기본값)"""
+
+    def __init__(self):
+        self._buckets: Dict[str, _TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def reserve(self, key: str, rate: float, burst: int) -> float:
+        bucket = self._buckets.get(key)
+        if bucket is None or bucket.rate != rate or bucket.burst != burst:
+            with self._lock:
+                bucket = self._buckets.get(key)
+                if bucket is None or bucket.rate != rate or bucket.burst != burst:
+                    bucket = self._buckets[key] = _TokenBucket(rate, burst)
+        return bucket.reserve()
+
+
+class SQLiteRateLimitBackend(RateLimitBackend):
+    """
+    동일 호스트의 여러 프로세스가 공유하는 SQLite 기반 토큰 버킷
+
+    하나의 app key를 사용하는 모든 워커가 같은 파일을 지정하면
+    분류별 유량 제한이 프로세스 전체 합계 기준으로 적용된다.
+
+    사용 예:
+        backend = SQLiteRateLimitBackend("/var/run/pydbfi/ratelimit.db")
+        dbfi = DBFI(..., rate_limiter=RateLimiter(backend=backend))
+
+    Args:
+        path: 상태 파일 경로 (로컬 파일시스템이어야 함)
+        namespace: 같은 파일을 쓰는 서로 다른 app key 구분용 접두어
+        timeout: 파일 잠금 대기 시간 (초)
+    """
+
+    def __init__(self, path: str, namespace: str = "", timeout: float = 10.0):
+        self.path = path
+        self.namespace = namespace
+        self.timeout = timeout
+        # 프로세스당 커넥션 하나를 락으로 보호하여 공유 (트랜잭션이 짧아 스레드별 커넥션이 필요 없음)
+        self._conn: Optional[sqlite3.Connection] = None
+        self._pid: Optional[int] = None
+        self._lock = threading.Lock()
+        with self._lock:
+            self._connect()
+
+    def _connect(self) -> sqlite3.Connection:
+        """락을 잡은 상태에서 호출"""
+        # fork 이후 상속된 커넥션은 재사용하지 않음 (부모 프로세스가 닫음)
+        if self._conn is not None and self._pid == os.getpid():
+            return self._conn
+        conn = sqlite3.connect(self.path, timeout=self.timeout, isolation_level=None, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS buckets ("
+            "key TEXT PRIMARY KEY, tokens REAL NOT NULL, updated REAL NOT NULL)"
+        )
+        self._conn, self._pid = conn, os.getpid()
+        return conn
+
+    def reserve(self, key: str, rate: float, burst: int) -> float:
+        key = f"{self.namespace}:{key}"
+        with self._lock:
+            conn = self._connect()
+            # 프로세스 간 공유를 위해 단조 시계 대신 벽시계 사용
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                now = time.time()
+                row = conn.execute(
+                    "SELECT tokens, updated FROM buckets WHERE key = ?", (key,)
+                ).fetchone()
+                tokens = float(burst) if row is None else _refill(row[0], row[1], now, rate, burst)
+                tokens -= 1
+                conn.execute(
+                    "INSERT OR REPLACE INTO buckets (key, tokens, updated) VALUES (?, ?, ?)",
+                    (key, tokens, now),
+                )
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+        return 0.0 if tokens >= 0 else -tokens / rate
+
+    def close(self):
+        with self._lock:
+            conn, self._conn = self._conn, None
+            if conn is not None and self._pid == os.getpid():
+                conn.close()
+
+
+class RateLimiter:
+    """
+    엔드포인트 분류별 초당 요청 수 제한
+
+    사용 예:
+        limiter = RateLimiter({"order": 5, "quote": 20})
+        dbfi = DBFI(app_key="...", app_secret_key="...", rate_limiter=limiter)
+        limiter.stats()
+
+    Args:
+        limits: 분류별 초당 요청 수 (None이면 DEFAULT_RATE_LIMITS)
+        burst: 순간 허용 요청 수 (기본 1: 1/rate 간격으로 균등 배치)
+        backend: 버킷 상태 저장소 (기본: MemoryRateLimitBackend)
+    """
+
+    def __init__(
+        self,
+        limits: Optional[Dict[str, float]] = None,
+        burst: int = 1,
+        backend: Optional[RateLimitBackend] = None,
+    ):
+        self.burst = burst
+        self.backend = backend if backend is not None else MemoryRateLimitBackend()
+        self._limits: Dict[str, Tuple[float, int]] = {}
+        self._stats: Dict[str, Dict[str, float]] = {}
+        self._lock = threading.Lock()
+        for key, rate in (DEFAULT_RATE_LIMITS if limits is None else limits).items():
+            self.set_limit(key, rate)
+
+    def set_limit(self, key: str, rate: Optional[float], burst: Optional[int] = None):
+        """분류별 제한 변경 (rate가 None이면 제한 해제)"""
+        with self._lock:
+            if rate is None:
+                self._limits.pop(key, None)
+            elif rate <= 0:
+                raise ValueError("rate는 0보다 커야 합니다.")
+            else:
+                self._limits[key] = (float(rate), max(1, int(self.burst if burst is None else burst)))
+
+    def get_limit(self, key: str) -> Optional[float]:
+        limit = self._limits.get(key)
+        return limit[0] if limit else None
+
+    def reserve(self, key: Optional[str]) -> float:
+        """요청 슬롯을 예약하고 대기해야 할 시간(초)을 반환 (대기는 호출자가 수행)"""
+        limit = self._limits.get(key) if key else None
+        if limit is None:
+            return 0.0
+        wait = self.backend.reserve(key, *limit)
+        self._record(key, wait)
+        return wait
+
+    def acquire(self, key: Optional[str]) -> float:
+        """제한 내에서 요청이 가능할 때까지 대기하고 대기한 시간(초)을 반환"""
+        wait = self.reserve(key)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    def _record(self, key: str, wait: float):
+        with self._lock:
+            stat = self._stats.setdefault(
+                key, {"count": 0, "waited": 0, "total_wait": 0.0, "max_wait": 0.0}
+            )
+            stat["count"] += 1
+            if wait > 0:
+                stat["waited"] += 1
+                stat["total_wait"] += wait
+                stat["max_wait"] = max(stat["max_wait"], wait)
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        """분류별 대기 통계 (count, waited, total_wait, max_wait, avg_wait)"""
+        with self._lock:
+            return {
+                key: {
+                    **stat,
+                    "avg_wait": stat["total_wait"] / stat["count"] if stat["count"] else 0.0,
+                }
+                for key, stat in self._stats.items()
+            }
+
+    def reset_stats(self):
+        with self._lock:
+            self._stats.clear()
+
+    def close(self):
+        self.backend.close()
@@ -0,0 +1,165 @@
+"""
+분봉/일봉 ChartBars로 상위 주기 봉을 로컬에서 생성
+
+같은 키(버킷)의 봉을 np.*.reduceat으로 한 번에 집계하므로 행 단위 파이썬 반복이 없다.
+N분봉은 정규장 시작 시각에 맞춰 나누고 정규장 밖의 봉은 제외한다.
+장 시작/마감 시각의 봉(동시호가 체결)은 정규장에 포함하여 첫/마지막 구간에 합친다.
+
+사용 예:
+    minute = store.load("domestic", "005930", "minute", "20240101", "20240131")
+    five = resample(minute, "5min")
+    daily = resample(minute, "daily")
+    weekly = resample(daily, "weekly")
+"""
+import re
+from dataclasses import dataclass
+from typing import Optional, Union
+
+import numpy as np
+
+from .bars import CHART_TIMEZONES, ChartBars
+
+_DAY = 86400
+# 1970-01-01(목)부터 월요일 시작 주 번호를 구하기 위한 보정 (일)
+_WEEK_OFFSET = 3
+_MINUTES = re.compile(r"^(\d+)\s*(min|m|h)$")
+
+
+@dataclass(frozen=True)
+class Session:
+    """정규장 시간 (거래소 현지 시각, 자정 기준 초)"""
+
+    open: int
+    close: int
+
+    @classmethod
+    def parse(cls, open: str, close: str) -> "Session":
+        """HHMM 문자열로 생성 (예: Session.parse("0900", "1530"))"""
+        return cls(int(open[:2]) * 3600 + int(open[2:4]) * 60, int(close[:2]) * 3600 + int(close[2:4]) * 60)
+
+
+# 지역별 정규장 (KRX 09:00~15:30, 미국 09:30~16:00)
+SESSIONS = {
+    "domestic": Session.parse("0900", "1530"),
+    "overseas": Session.parse("0930", "1600"),
+}
+
+_TIMEZONE_SESSIONS = {tz: SESSIONS[region] for region, tz in CHART_TIMEZONES.items()}
+
+
+def _minutes(rule: Union[str, int]) -> Optional[int]:
+    if isinstance(rule, int):
+        return rule
+    match = _MINUTES.match(rule.strip().lower())
+    if match is None:
+        return None
+    return int(match.group(1)) * (60 if match.group(2) == "h" else 1)
+
+
+def _resolve_session(bars: ChartBars, session) -> Optional[Session]:
+    if session == "auto":
+        return _TIMEZONE_SESSIONS.get(bars.tz)
+    if isinstance(session, str):
+        return SESSIONS[session]
+    return session
+
+
+def _in_session(seconds: "np.ndarray", session: Session) -> "np.ndarray":
+    # 시작(09:00)과 마감(15:30) 시각의 봉은 label과 무관하게 포함
+    return (seconds >= session.open) & (seconds <= session.close)
+
+
+def resample(
+    bars: ChartBars,
+    rule: Union[str, int],
+    session: Union[str, Session, None] = "auto",
+    label: str = "right",
+    period_label: str = "start",
+) -> ChartBars:
+    """
+    상위 주기 봉 생성
+
+    시가는 구간 첫 봉의 시가, 종가는 마지막 봉의 종가, 고가/저가는 최대/최소, 거래량은 합계다.
+
+    Args:
+        bars: 시각 오름차순 ChartBars (분봉 또는 일봉)
+        rule: N분봉("5min", "30m", "1h" 또는 분 단위 정수), "daily", "weekly", "monthly", "yearly"
+        session: 정규장 ("auto": bars.tz로 판단, "domestic"/"overseas", Session, None: 전체 시간)
+        label: 분봉 시각 기준. "right"이면 봉 시각이 구간 종료 시각(09:01 = 09:00~09:01),
+            "left"이면 구간 시작 시각. 입력 분봉과 결과 N분봉이 같은 기준을 사용한다.
+            장 시작 시각의 봉은 right에서 첫 구간에, 마감 시각의 봉은 left에서 마지막 구간에 합친다.
+        period_label: 일/주/월/년봉 시각. "start"이면 기간 시작일(주: 월요일, 월: 1일, 년: 1월 1일),
+            "first"/"last"이면 구간의 첫/마지막 봉 날짜
+    """
+    if label not in ("right", "left"):
+        raise ValueError("label은 'right' 또는 'left'여야 합니다.")
+    if period_label not in ("start", "first", "last"):
+        raise ValueError("period_label은 'start', 'first', 'last' 중 하나여야 합니다.")
+    minutes = _minutes(rule)
+    if minutes is None and rule not in ("daily", "weekly", "monthly", "yearly"):
+        raise ValueError(f"지원하지 않는 주기입니다: {rule!r}")
+    if not len(bars):
+        return ChartBars.empty(bars.tz)
+
+    timestamp = bars.timestamp
+    days, seconds = np.divmod(timestamp, _DAY)
+    session = _resolve_session(bars, session)
+    intraday = bool(seconds.any())
+    if session is not None and intraday:
+        mask = _in_session(seconds, session)
+        if not mask.all():
+            bars = bars[mask]
+            if not len(bars):
+                return ChartBars.empty(bars.tz)
+            timestamp, days, seconds = bars.timestamp, days[mask], seconds[mask]
+
+    if minutes is not None:
+        if minutes <= 0:
+            raise ValueError("분봉 간격은 1분 이상이어야 합니다.")
+        width = minutes * 60
+        origin = session.open if session is not None else 0
+        offset = seconds - origin
+        # right: (시작, 끝] 구간 -> 끝 시각, left: [시작, 끝) 구간 -> 시작 시각
+        bucket = -((-offset) // width) if label == "right" else offset // width
+        if session is not None:
+            if label == "right":
+                # 장 시작 시각의 봉은 첫 구간에 포함 (예: 5분봉 09:00 -> 09:05)
+                bucket = np.maximum(bucket, 1)
+            else:
+                # 장 마감 시각의 봉은 마지막 구간에 포함 (예: 30분봉 15:30 -> 15:00)
+                bucket = np.minimum(bucket, -(-(session.close - session.open) // width) - 1)
+        stamps = days * _DAY + origin + bucket * width
+        if session is not None and label == "right":
+            # 마지막 구간이 장 마감을 넘으면 마감 시각으로 표시 (예: 60분봉 15:30)
+            stamps = np.minimum(stamps, days * _DAY + session.close)
+        keys = stamps
+    elif rule == "daily":
+        keys = days
+        stamps = days * _DAY
+    elif rule == "weekly":
+        keys = (days + _WEEK_OFFSET) // 7
+        stamps = (keys * 7 - _WEEK_OFFSET) * _DAY
+    else:
+        unit = "datetime64[M]" if rule == "monthly" else "datetime64[Y]"
+        periods = timestamp.view("datetime64[s]").astype(unit)
+        keys = periods.astype(np.int64)
+        stamps = periods.astype("datetime64[s]").astype(np.int64)
+
+    # 정렬된 입력이므로 키가 바뀌는 위치가 구간 경계
+    starts = np.flatnonzero(np.r_[True, keys[1:] != keys[:-1]])
+    ends = np.r_[starts[1:], len(keys)] - 1
+    if minutes is None and period_label != "start":
+        picked = starts if period_label == "first" else ends
+        stamps = days[picked] * _DAY
+    else:
+        stamps = stamps[starts]
+
+    return ChartBars(
+        timestamp=stamps,
+        open=bars.open[starts],
+        high=np.maximum.reduceat(bars.high, starts),
+        low=np.minimum.reduceat(bars.low, starts),
+        close=bars.close[ends],
+        volume=np.add.reduceat(bars.volume, starts),
+        tz=bars.tz,
+    )
@@ -13,7 +13,7 @@ class DomesticChartService(BaseService, IChartService):
         endpoint = "/api/v1/quote/kr-chart/min"
         data = request.to_request_data()
         return self._request(
-            "POST", endpoint, data=data, cont_yn=cont_yn, cont_key=cont_key, **kwargs
+            "POST", endpoint, data=data, cont_yn=cont_yn, cont_key=cont_key, rate_limit_key="chart", **kwargs
         )
 
     def get_daily_chart(
@@ -22,7 +22,7 @@ class DomesticChartService(BaseService, IChartService):
         endpoint = "/api/v1/quote/kr-chart/day"
         data = request.to_request_data()
         return self._request(
-            "POST", endpoint, data=data, cont_yn=cont_yn, cont_key=cont_key, **kwargs
+            "POST", endpoint, data=data, cont_yn=cont_yn, cont_key=cont_key, rate_limit_key="chart", **kwargs
         )
 
     def get_weekly_chart(
@@ -31,7 +31,7 @@ class DomesticChartService(BaseService, IChartService):
         endpoint = "/api/v1/quote/kr-chart/week"
         data = request.to_request_data()
         return self._request(
-            "POST", endpoint, data=data, cont_yn=cont_yn, cont_key=cont_key, **kwargs
+            "POST", endpoint, data=data, cont_yn=cont_yn, cont_key=cont_key, rate_limit_key="chart", **kwargs
         )
 
     def get_monthly_chart(
@@ -40,7 +40,7 @@ class DomesticChartService(BaseService, IChartService):
         endpoint = "/api/v1/quote/kr-chart/month"
         data = request.to_request_data()
         return self._request(
-            "POST", endpoint, data=data, cont_yn=cont_yn, cont_key=cont_key, **kwargs
+            "POST", endpoint, data=data, cont_yn=cont_yn, cont_key=cont_key, rate_limit_key="chart", **kwargs
         )
 
 
@@ -51,7 +51,7 @@ class OverseasChartService(BaseService, IChartService):
         endpoint = "/api/v1/quote/overseas-stock/chart/min"
         data = request.to_request_data()
         return self._request(
-            "POST", endpoint, data=data, cont_yn=cont_yn, cont_key=cont_key, **kwargs
+            "POST", endpoint, data=data, cont_yn=cont_yn, cont_key=cont_key, rate_limit_key="chart", **kwargs
         )
 
     def get_daily_chart(
@@ -60,7 +60,7 @@ class OverseasChartService(BaseService, IChartService):
         endpoint = "/api/v1/quote/overseas-stock/chart/day"
         data = request.to_request_data()
         return self._request(
-            "POST", endpoint, data=data, cont_yn=cont_yn, cont_key=cont_key, **kwargs
+            "POST", endpoint, data=data, cont_yn=cont_yn, cont_key=cont_key, rate_limit_key="chart", **kwargs
         )
 
     def get_weekly_chart(
@@ -69,7 +69,7 @@ class OverseasChartService(BaseService, IChartService):
         endpoint = "/api/v1/quote/overseas-stock/chart/week"
         data = request.to_request_data()
         return self._request(
-            "POST", endpoint, data=data, cont_yn=cont_yn, cont_key=cont_key, **kwargs
+            "POST", endpoint, data=data, cont_yn=cont_yn, cont_key=cont_key, rate_limit_key="chart", **kwargs
         )
 
     def get_monthly_chart(
@@ -78,5 +78,5 @@ class OverseasChartService(BaseService, IChartService):
         endpoint = "/api/v1/quote/overseas-stock/chart/month"
         data = request.to_request_data()
         return self._request(
-            "POST", endpoint, data=data, cont_yn=cont_yn, cont_key=cont_key, **kwargs
+            "POST", endpoint, data=data, cont_yn=cont_yn, cont_key=cont_key, rate_limit_key="chart", **kwargs
         )
@@ -1,30 +1,63 @@
+import json
 import logging
 import random
 import time
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Union
 
 import requests
 from tenacity import retry, stop_after_attempt, wait_exponential
 
+from ...cache import QuoteCache
+from ...hooks import Hooks, RequestContext, _current_attempt, payload_size, set_attempt
+from ...log import redact
+from ...metrics import MetricsRegistry
 from ...oauth import OAuth
+from ...pacing import DEFAULT_CONTINUATION_INTERVAL, ContinuationPacer
+from ...ratelimit import RateLimiter
+from ...transport import HTTPTransport
+
+# 토큰 유효성 만료 응답 코드
+TOKEN_EXPIRED_CODE = "IGW00121"
+
+
+def _record_retry(retry_state):
+    """tenacity before_sleep: 백오프 재시도를 서비스의 MetricsRegistry에 기록"""
+    service = retry_state.args[0] if retry_state.args else None
+    metrics = getattr(service, "metrics", None)
+    if metrics is None:
+        return
+    endpoint = retry_state.args[2] if len(retry_state.args) > 2 else retry_state.kwargs.get("endpoint")
+    error = retry_state.outcome.exception()
+    response = getattr(error, "response", None)
+    reason = str(response.status_code) if response is not None else type(error).__name__
+    metrics.observe_retry(endpoint, reason)
 
 
 class BaseService:
     BASE_URL = "https://openapi.dbsec.co.kr:8443"
 
-    def __init__(self, auth: OAuth):
+    def __init__(
+        self,
+        auth: OAuth,
+        transport: HTTPTransport = None,
+        rate_limiter: RateLimiter = None,
+        pacer: ContinuationPacer = None,
+        quote_cache: QuoteCache = None,
+        metrics: MetricsRegistry = None,
+        hooks: Hooks = None,
+    ):
         self.auth = auth
+        # 별도 지정이 없으면 인증 객체와 커넥션 풀 공유
+        self.transport = transport if transport is not None else auth.transport
+        if getattr(auth, "base_url", None) is not None:
+            self.BASE_URL = auth.BASE_URL
+        self.rate_limiter = rate_limiter
+        self.pacer = pacer
+        self.quote_cache = quote_cache
+        self.metrics = metrics
+        self.hooks = hooks
         self.logger = logging.getLogger(__name__)
         
-    @retry(
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(
-            multiplier=1,    # 기본 승수
-            min=1,          # 최소 대기 시간 (초)
-            max=10          # 최대 대기 시간 (초)
-        ),
-        reraise=True
-    )
     def _request(
         self,
         method: str,
@@ -36,14 +69,121 @@ class BaseService:
         cont_yn: str = "N",
         cont_key: str = None,
         max_cont_cnt: int = 100,
+        rate_limit_key: Optional[str] = None,
+        stream: bool = False,
+        hook_context: Optional[RequestContext] = None,
         **kwargs,
-    ) -> dict:
-        url = f"{self.BASE_URL}{endpoint}"
+    ) -> Union[dict, List[dict], Iterator[dict]]:
+        """
+        API 요청
+
+        연속 조회가 없으면 응답 dict, 있으면 페이지별 응답 list를 반환한다.
+        stream=True이면 페이지를 도착 순서대로 반환하는 제너레이터를 반환한다.
+        """
+        pages = self._iter_pages(
+            method,
+            endpoint,
+            params=params,
+            data=data,
+            headers=headers,
+            content_type=content_type,
+            cont_yn=cont_yn,
+            cont_key=cont_key,
+            max_cont_cnt=max_cont_cnt,
+            rate_limit_key=rate_limit_key,
+            hook_context=hook_context,
+        )
+        if stream:
+            return pages
+
+        outputs = list(pages)
+        return outputs[0] if len(outputs) == 1 else outputs
+
+    def _cached_request(
+        self,
+        method: str,
+        endpoint: str,
+        data: Optional[Dict[str, Any]] = None,
+        cont_yn: str = "N",
+        cont_key: str = None,
+        **kwargs,
+    ):
+        """quote_cache가 설정된 경우 (endpoint, 요청 데이터) 기준으로 캐시/병합하여 요청"""
+        if self.quote_cache is None or cont_key or kwargs.get("stream"):
+            return self._request(
+                method, endpoint, data=data, cont_yn=cont_yn, cont_key=cont_key, **kwargs
+            )
+        return self.quote_cache.get_or_fetch(
+            self._cache_key(endpoint, data),
+            lambda: self._request(
+                method, endpoint, data=data, cont_yn=cont_yn, cont_key=cont_key, **kwargs
+            ),
+        )
+
+    @staticmethod
+    def _cache_key(endpoint: str, data: Optional[Dict[str, Any]]) -> tuple:
+        return endpoint, json.dumps(data, sort_keys=True, default=str)
 
-        request_headers = {
-            **(headers if isinstance(headers, dict) else {}),
-            **self.auth.get_auth_header()
-        }
+    def _iter_pages(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        data: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        content_type: str = "application/json",
+        cont_yn: str = "N",
+        cont_key: str = None,
+        max_cont_cnt: int = 100,
+        rate_limit_key: Optional[str] = None,
+        hook_context: Optional[RequestContext] = None,
+    ) -> Iterator[dict]:
+        cont_cnt = 0
+        while True:
+            sent_at = time.monotonic()
+            response = self._request_page(
+                method,
+                endpoint,
+                params=params,
+                data=data,
+                headers=headers,
+                content_type=content_type,
+                cont_yn=cont_yn,
+                cont_key=cont_key,
+                rate_limit_key=rate_limit_key,
+                continuation=cont_cnt,
+                hook_context=hook_context,
+            )
+            if cont_cnt > 0 and self.pacer is not None:
+                self.pacer.on_success(endpoint, rate_limit_key)
+            cont_yn = response.headers.get("cont_yn", "N")
+            cont_key = response.headers.get("cont_key", "")
+            page = self._parse_response(response)
+            if self.metrics is not None:
+                self.metrics.observe_page(endpoint, page.get("rsp_cd"), continuation=cont_cnt > 0)
+            yield page
+
+            # 연속 조회 여부 판단
+            if cont_yn != "Y" or cont_key == "" or cont_cnt >= max_cont_cnt:
+                return
+            cont_cnt += 1
+            # 연속 조회를 위한 대기
+            if self.pacer is not None:
+                self.pacer.wait(endpoint, since=sent_at)
+            else:
+                time.sleep(DEFAULT_CONTINUATION_INTERVAL)
+
+    def _build_headers(
+        self,
+        headers: Optional[Dict[str, str]],
+        content_type: str,
+        cont_yn: str,
+        cont_key: Optional[str],
+    ) -> Dict[str, str]:
+        # get_auth_header는 매번 새 dict를 반환하므로 그대로 사용
+        request_headers = self.auth.get_auth_header()
+        if isinstance(headers, dict) and headers:
+            request_headers = {**headers, **request_headers}
         request_headers["Content-Type"] = content_type
 
         if cont_yn:
@@ -51,78 +191,210 @@ class BaseService:
 
         if cont_key:
             request_headers["cont_key"] = cont_key
+        return request_headers
+
+    @staticmethod
+    def _body_kwargs(content_type: str, data: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+        return {"json": data} if content_type == "application/json" else {"data": data}
+
+    @staticmethod
+    def _parse_response(response: requests.Response) -> dict:
+        if "application/json" in response.headers.get("Content-Type", ""):
+            return response.json()
+        return {"text": response.text}
+
+    @classmethod
+    def _is_token_expired(cls, response) -> bool:
+        return 500 <= response.status_code < 600 and cls._get_rsp_cd(response) == TOKEN_EXPIRED_CODE
+
+    def _begin_trace(
+        self,
+        parent: Optional[RequestContext],
+        method: str,
+        endpoint: str,
+        content_type: str,
+        data: Optional[Dict[str, Any]],
+        continuation: int,
+        replay: bool,
+    ) -> RequestContext:
+        ctx = RequestContext(
+            "request",
+            method_name=parent.method_name if parent is not None else None,
+            region=parent.region if parent is not None else None,
+            endpoint=endpoint,
+            http_method=method,
+            payload_size=payload_size(content_type, data),
+            continuation=continuation,
+            attempt=_current_attempt.get(),
+            replay=replay,
+            parent=parent,
+        )
+        if parent is not None:
+            parent.attempt += 1
+            if parent.endpoint is None:
+                parent.endpoint = endpoint
+                parent.payload_size = ctx.payload_size
+        self.hooks.before(ctx)
+        return ctx
 
+    def _end_trace(self, ctx: RequestContext, response, total: float, error: BaseException = None):
+        ctx.timings["total"] = total
+        if isinstance(response, requests.Response):
+            ctx.timings["server"] = response.elapsed.total_seconds()
+        parent = ctx.parent
+        if parent is not None:
+            # 상위 call에는 HTTP 요청/유량 제한 대기 시간 합계를 누적
+            parent.timings["http"] = parent.timings.get("http", 0.0) + total
+            parent.timings["rate_limit"] = parent.timings.get("rate_limit", 0.0) + ctx.timings.get("rate_limit", 0.0)
+        if error is not None:
+            self.hooks.error(ctx, error)
+        else:
+            ctx.status_code = response.status_code
+            self.hooks.after(ctx, response)
 
+    def _observe_response(self, endpoint: str, response, total: float):
+        if isinstance(response, requests.Response):
+            server = response.elapsed.total_seconds()
+            body = response.request.body if response.request is not None else None
+        else:
+            # httpx의 elapsed는 본문 수신까지 포함하므로 total만 기록
+            server = None
+            body = response.request.content
+        self.metrics.observe_response(
+            endpoint,
+            response.status_code,
+            total,
+            server=server,
+            bytes_sent=len(body) if body else 0,
+            bytes_received=len(response.content),
+            # 정상 응답의 rsp_cd는 페이지 파싱 시 기록 (본문을 두 번 파싱하지 않음)
+            rsp_cd=self._get_rsp_cd(response) if response.status_code >= 400 else None,
+        )
+
+    @staticmethod
+    def _get_rsp_cd(response: requests.Response) -> Optional[str]:
+        if "application/json" not in response.headers.get("Content-Type", ""):
+            return None
         try:
-            self.logger.debug(
-                f"Request to {url}, method={method}, headers={request_headers}"
-            )
-            self.logger.debug(f"Request data: {data}")
-
-            if content_type == "application/json":
-                response = requests.request(
-                    method=method,
-                    url=url,
-                    params=params,
-                    json=data,
-                    headers=request_headers,
-                )
-            else:
-                response = requests.request(
-                    method=method,
-                    url=url,
-                    params=params,
-                    data=data,
-                    headers=request_headers,
-                )
+            body = response.json()
+        except ValueError:
+            return None
+        return body.get("rsp_cd") if isinstance(body, dict) else None
 
-            if 500 <= response.status_code < 600:
-                if "application/json" in response.headers.get("Content-Type", "") and response.json().get("rsp_cd") == "IGW00121":
-                    # token 유효성 만료: 토큰 재발급
-                    time.sleep(1.5)
-                    self.logger.error("token 유효성 만료: 토큰 재발급 진행합니다.")
-                    self.auth.request_token()
-                else:
-                    self.logger.error(response.text)
-                    self.logger.error(f"type: {type(response.text)}")                  
+    def iter_pages(self, method_name: str, *args, **kwargs) -> Iterator[dict]:
+        """
+        연속 조회 결과를 페이지 단위로 순차 반환
 
-            response.raise_for_status()
+        사용 예:
+            for page in service.iter_pages("get_transaction_history", request):
+                ...
+        """
+        return getattr(self, method_name)(*args, stream=True, **kwargs)
 
-            self.logger.debug(f"Response status: {response.status_code}")
-            self.logger.debug(f"Response headers: {response.headers}")
+    def iter_rows(self, method_name: str, out_key: str, *args, **kwargs) -> Iterator[Any]:
+        """연속 조회 결과의 out_key(Out, Out1, Out2 등) 행을 순차 반환"""
+        return iter_rows(self.iter_pages(method_name, *args, **kwargs), out_key)
 
-            cont_yn = response.headers.get("cont_yn", "N")
-            cont_key = response.headers.get("cont_key", "")
-            cont_cnt = kwargs.get("cont_cnt", 0)
-            if cont_yn == "Y" and cont_key != "" and cont_cnt < max_cont_cnt:
-                # 연속 조회 여부 판단"
-                kwargs.update(
-                    outputs = kwargs.get("outputs", []) + [
-                        response.json() if "application/json" in response.headers.get("Content-Type", "") else {"text": response.text}
-                    ],
-                    cont_cnt = kwargs.get("cont_cnt", 0) + 1
-                )
-                time.sleep(1.5) # 연속 조회를 위한 1초 대기
-                return self._request(
-                    method=method,
-                    endpoint=endpoint,
-                    params=params,
-                    data=data,
-                    content_type=content_type,
-                    cont_yn=cont_yn,
-                    cont_key=cont_key,
-                    **kwargs
+    @retry(
+        stop=stop_after_attempt(3),
+        wait=wait_exponential(
+            multiplier=1,    # 기본 승수
+            min=1,          # 최소 대기 시간 (초)
+            max=10          # 최대 대기 시간 (초)
+        ),
+        reraise=True,
+        before=set_attempt,
+        before_sleep=_record_retry,
+    )
+    def _request_page(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        data: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        content_type: str = "application/json",
+        cont_yn: str = "N",
+        cont_key: str = None,
+        rate_limit_key: Optional[str] = None,
+        continuation: int = 0,
+        hook_context: Optional[RequestContext] = None,
+    ) -> requests.Response:
+        url = f"{self.BASE_URL}{endpoint}"
+        metrics = self.metrics
+        traced = self.hooks is not None and self.hooks.active
+        # 비활성 수준의 로그는 헤더 복사/문자열 포맷을 하지 않도록 한 번만 확인
+        debug = self.logger.isEnabledFor(logging.DEBUG)
+
+        try:
+            # 토큰 만료로 거절되면 재발급 후 백오프 없이 한 번 즉시 재요청
+            for replay in (False, True):
+                if traced:
+                    ctx = self._begin_trace(hook_context, method, endpoint, content_type, data, continuation, replay)
+                started = None
+                # 훅 before 이후 예외는 모두 error 훅으로 전달 (토큰 발급, 헤더 생성, 유량 제한 대기 포함)
+                try:
+                    generation = self.auth.token_generation
+                    request_headers = self._build_headers(headers, content_type, cont_yn, cont_key)
+
+                    if self.rate_limiter is not None:
+                        # 유량 제한 초과 전 로컬에서 대기
+                        waited = self.rate_limiter.acquire(rate_limit_key)
+                        if waited > 0 and metrics is not None:
+                            metrics.observe_rate_limit_wait(endpoint, waited)
+                        if traced:
+                            ctx.timings["rate_limit"] = waited
+
+                    if debug:
+                        self.logger.debug(
+                            "Request to %s, method=%s, headers=%s, data=%s",
+                            url, method, redact(request_headers), data,
+                            extra={"endpoint": endpoint, "http_method": method, "continuation": continuation},
+                        )
+
+                    started = time.perf_counter()
+                    response = self.transport.request(
+                        method=method,
+                        url=url,
+                        params=params,
+                        headers=request_headers,
+                        **self._body_kwargs(content_type, data),
+                    )
+                except BaseException as e:
+                    elapsed = time.perf_counter() - started if started is not None else 0.0
+                    if metrics is not None and started is not None and isinstance(e, Exception):
+                        metrics.observe_error(endpoint, e, elapsed)
+                    if traced:
+                        self._end_trace(ctx, None, elapsed, e)
+                    raise
+                if metrics is not None:
+                    self._observe_response(endpoint, response, time.perf_counter() - started)
+                if traced:
+                    self._end_trace(ctx, response, time.perf_counter() - started)
+
+                if replay or not self._is_token_expired(response):
+                    break
+                # 같은 세대의 토큰으로 거절된 요청들은 한 번의 재발급을 공유
+                self.auth.invalidate_token(generation)
+                if metrics is not None:
+                    metrics.observe_retry(endpoint, "token_expired")
+
+            if response.status_code >= 400 and self.pacer is not None:
+                if self.pacer.is_throttled(response.status_code, self._get_rsp_cd(response)):
+                    self.logger.warning("유량 제한 초과: %s", endpoint, extra={"endpoint": endpoint})
+                    self.pacer.on_throttle(endpoint)
+
+            # 오류 응답 본문은 아래 예외 처리에서 한 번만 기록
+            response.raise_for_status()
+
+            if debug:
+                self.logger.debug(
+                    "Response status: %s, headers=%s",
+                    response.status_code, dict(response.headers),
+                    extra={"endpoint": endpoint, "status_code": response.status_code},
                 )
-            
-            if kwargs.get("outputs"):
-                return kwargs.get("outputs", []) + [
-                    response.json() if "application/json" in response.headers.get("Content-Type", "") else {"text": response.text}
-                ]
-            else:
-                if "application/json" in response.headers.get("Content-Type", ""):
-                    return response.json()
 
-                return {"text": response.text}
+            return response
 
         except Exception as e:
             # 모든 예외 처리 (RequestException 포함)
@@ -130,11 +402,28 @@ class BaseService:
             
             # RequestException 계열은 상세 정보 로깅
             if isinstance(e, requests.RequestException):
-                self.logger.error(f"API request failed ({error_type}): {str(e)}")
-                if hasattr(e, "response") and e.response is not None:
-                    self.logger.error(f"Response({e.response.status_code}): {e.response.text}")
+                failed = getattr(e, "response", None)
+                extra = {"endpoint": endpoint, "http_method": method, "error": error_type}
+                if failed is not None:
+                    extra["status_code"] = failed.status_code
+                    self.logger.error(
+                        "API request failed (%s): %s\nResponse(%s): %s",
+                        error_type, e, failed.status_code, failed.text, extra=extra,
+                    )
+                else:
+                    self.logger.error("API request failed (%s): %s", error_type, e, extra=extra)
             else:
                 # 기타 예외 (JSONDecodeError, KeyError 등)
-                self.logger.error(f"Unexpected error ({error_type}): {str(e)}", exc_info=True)
+                self.logger.error("Unexpected error (%s): %s", error_type, e, exc_info=True)
             
-            raise
\ No newline at end of file
+            raise
+
+
+def iter_rows(pages: Iterable[dict], out_key: str) -> Iterator[Any]:
+    """페이지별 응답에서 out_key 블록의 행을 순차 반환 (블록이 dict이면 그대로 반환)"""
+    for page in pages:
+        block = page.get(out_key) if isinstance(page, dict) else None
+        if isinstance(block, list):
+            yield from block
+        elif block is not None:
+            yield block
@@ -13,7 +13,7 @@ class DomesticQuoteService(BaseService, IQuoteService):
         endpoint = "/api/v1/quote/kr-stock/inquiry/stock-ticker"
         data = request.to_request_data()
         return self._request(
-            "POST", endpoint, data=data, cont_yn=cont_yn, cont_key=cont_key, **kwargs
+            "POST", endpoint, data=data, cont_yn=cont_yn, cont_key=cont_key, rate_limit_key="quote", **kwargs
         )
 
     def get_stock_price(
@@ -21,8 +21,8 @@ class DomesticQuoteService(BaseService, IQuoteService):
     ) -> Dict[str, Any]:
         endpoint = "/api/v1/quote/kr-stock/inquiry/price"
         data = request.to_request_data()
-        return self._request(
-            "POST", endpoint, data=data, cont_yn=cont_yn, cont_key=cont_key, **kwargs
+        return self._cached_request(
+            "POST", endpoint, data=data, cont_yn=cont_yn, cont_key=cont_key, rate_limit_key="quote", **kwargs
         )
 
     def get_order_book(
@@ -30,8 +30,8 @@ class DomesticQuoteService(BaseService, IQuoteService):
     ) -> Dict[str, Any]:
         endpoint = "/api/v1/quote/kr-stock/inquiry/orderbook"
         data = request.to_request_data()
-        return self._request(
-            "POST", endpoint, data=data, cont_yn=cont_yn, cont_key=cont_key, **kwargs
+        return self._cached_request(
+            "POST", endpoint, data=data, cont_yn=cont_yn, cont_key=cont_key, rate_limit_key="quote", **kwargs
         )
 
 
@@ -42,7 +42,7 @@ class OverseasQuoteService(BaseService, IQuoteService):
         endpoint = "/api/v1/quote/overseas-stock/inquiry/stock-ticker"
         data = request.to_request_data()
         return self._request(
-            "POST", endpoint, data=data, cont_yn=cont_yn, cont_key=cont_key, **kwargs
+            "POST", endpoint, data=data, cont_yn=cont_yn, cont_key=cont_key, rate_limit_key="quote", **kwargs
         )
 
     def get_stock_price(
@@ -50,8 +50,8 @@ class OverseasQuoteService(BaseService, IQuoteService):
     ) -> Dict[str, Any]:
         endpoint = "/api/v1/quote/overseas-stock/inquiry/price"
         data = request.to_request_data()
-        return self._request(
-            "POST", endpoint, data=data, cont_yn=cont_yn, cont_key=cont_key, **kwargs
+        return self._cached_request(
+            "POST", endpoint, data=data, cont_yn=cont_yn, cont_key=cont_key, rate_limit_key="quote", **kwargs
         )
 
     def get_order_book(
@@ -59,6 +59,6 @@ class OverseasQuoteService(BaseService, IQuoteService):
     ) -> Dict[str, Any]:
         endpoint = "/api/v1/quote/overseas-stock/inquiry/orderbook"
         data = request.to_request_data()
-        return self._request(
-            "POST", endpoint, data=data, cont_yn=cont_yn, cont_key=cont_key, **kwargs
+        return self._cached_request(
+            "POST", endpoint, data=data, cont_yn=cont_yn, cont_key=cont_key, rate_limit_key="quote", **kwargs
         )
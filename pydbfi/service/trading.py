@@ -10,14 +10,14 @@ class DomesticTradingService(BaseService, ITradingService):
     ) -> Dict[str, Any]:
         endpoint = "/api/v1/trading/kr-stock/order-nxt" if use_nxt else "/api/v1/trading/kr-stock/order"
         data = order_request.to_request_data()
-        return self._request("POST", endpoint, data=data, **kwargs)
+        return self._request("POST", endpoint, data=data, rate_limit_key="order", **kwargs)
 
     def cancel_order(
         self, cancel_request: DomesticCancelOrderRequest, use_nxt: bool = False, **kwargs
     ) -> Dict[str, Any]:
         endpoint = "/api/v1/trading/kr-stock/order-cancel-nxt" if use_nxt else "/api/v1/trading/kr-stock/order-cancel"
         data = cancel_request.to_request_data()
-        return self._request("POST", endpoint, data=data, **kwargs)
+        return self._request("POST", endpoint, data=data, rate_limit_key="cancel", **kwargs)
 
     def get_transaction_history(
         self,
@@ -30,7 +30,7 @@ class DomesticTradingService(BaseService, ITradingService):
         endpoint = "/api/v1/trading/kr-stock/inquiry/transaction-history"
         data = request.to_request_data()
         return self._request(
-            "POST", endpoint, data=data, cont_yn=cont_yn, cont_key=cont_key, **kwargs
+            "POST", endpoint, data=data, cont_yn=cont_yn, cont_key=cont_key, rate_limit_key="history", **kwargs
         )
 
     def post_trading_history(
@@ -44,7 +44,7 @@ class DomesticTradingService(BaseService, ITradingService):
         endpoint = "/api/v1/trading/kr-stock/inquiry/trading-history"
         data = request.to_request_data()
         return self._request(
-            "POST", endpoint, data=data, cont_yn=cont_yn, cont_key=cont_key, **kwargs
+            "POST", endpoint, data=data, cont_yn=cont_yn, cont_key=cont_key, rate_limit_key="history", **kwargs
         ) 
 
     def post_daily_trade_report(
@@ -58,7 +58,7 @@ class DomesticTradingService(BaseService, ITradingService):
         endpoint = "/api/v1/trading/kr-stock/inquiry/daliy-trade-report"
         data = request.to_request_data()
         return self._request(
-            "POST", endpoint, data=data, cont_yn=cont_yn, cont_key=cont_key, **kwargs
+            "POST", endpoint, data=data, cont_yn=cont_yn, cont_key=cont_key, rate_limit_key="history", **kwargs
         )
 
     def get_able_order_quantity(
@@ -72,7 +72,7 @@ class DomesticTradingService(BaseService, ITradingService):
         endpoint = "/api/v1/trading/kr-stock/inquiry/able-orderqty"
         data = request.to_request_data()
         return self._request(
-            "POST", endpoint, data=data, cont_yn=cont_yn, cont_key=cont_key, **kwargs
+            "POST", endpoint, data=data, cont_yn=cont_yn, cont_key=cont_key, rate_limit_key="inquiry", **kwargs
         )
 
     def get_balance(
@@ -86,7 +86,7 @@ class DomesticTradingService(BaseService, ITradingService):
         endpoint = "/api/v1/trading/kr-stock/inquiry/balance"
         data = request.to_request_data()
         return self._request(
-            "POST", endpoint, data=data, cont_yn=cont_yn, cont_key=cont_key, **kwargs
+            "POST", endpoint, data=data, cont_yn=cont_yn, cont_key=cont_key, rate_limit_key="inquiry", **kwargs
         )
 
     def get_deposit(
@@ -95,7 +95,7 @@ class DomesticTradingService(BaseService, ITradingService):
         """국내 주식 예수금 조회"""
         endpoint = "/api/v1/trading/kr-stock/inquiry/acnt-deposit"
         return self._request(
-            "POST", endpoint, cont_yn=cont_yn, cont_key=cont_key, **kwargs
+            "POST", endpoint, cont_yn=cont_yn, cont_key=cont_key, rate_limit_key="deposit", **kwargs
         )
 
 
@@ -105,14 +105,14 @@ class OverseasTradingService(BaseService, ITradingService):
     ) -> Dict[str, Any]:
         endpoint = "/api/v1/trading/overseas-stock/order"
         data = order_request.to_request_data()
-        return self._request("POST", endpoint, data=data, **kwargs)
+        return self._request("POST", endpoint, data=data, rate_limit_key="order", **kwargs)
 
     def cancel_order(
         self, cancel_request: OverseasCancelOrderRequest, **kwargs
     ) -> Dict[str, Any]:
         endpoint = "/api/v1/trading/overseas-stock/order"
         data = cancel_request.to_request_data()
-        return self._request("POST", endpoint, data=data, **kwargs)
+        return self._request("POST", endpoint, data=data, rate_limit_key="cancel", **kwargs)
 
     def get_transaction_history(
         self,
@@ -125,7 +125,7 @@ class OverseasTradingService(BaseService, ITradingService):
         endpoint = "/api/v1/trading/overseas-stock/inquiry/transaction-history"
         data = request.to_request_data()
         return self._request(
-            "POST", endpoint, data=data, cont_yn=cont_yn, cont_key=cont_key, **kwargs
+            "POST", endpoint, data=data, cont_yn=cont_yn, cont_key=cont_key, rate_limit_key="history", **kwargs
         )
 
     def get_able_order_quantity(
@@ -139,7 +139,7 @@ class OverseasTradingService(BaseService, ITradingService):
         endpoint = "/api/v1/trading/overseas-stock/inquiry/able-orderqty"
         data = request.to_request_data()
         return self._request(
-            "POST", endpoint, data=data, cont_yn=cont_yn, cont_key=cont_key, **kwargs
+            "POST", endpoint, data=data, cont_yn=cont_yn, cont_key=cont_key, rate_limit_key="inquiry", **kwargs
         )
 
     def get_balance(
@@ -153,7 +153,7 @@ class OverseasTradingService(BaseService, ITradingService):
         endpoint = "/api/v1/trading/overseas-stock/inquiry/balance-margin"
         data = request.to_request_data()
         return self._request(
-            "POST", endpoint, data=data, cont_yn=cont_yn, cont_key=cont_key, **kwargs
+            "POST", endpoint, data=data, cont_yn=cont_yn, cont_key=cont_key, rate_limit_key="inquiry", **kwargs
         )
 
     def get_deposit(
@@ -162,7 +162,7 @@ class OverseasTradingService(BaseService, ITradingService):
         """해외 주식 예수금 조회"""
         endpoint = "/api/v1/trading/overseas-stock/inquiry/deposit-detail"
         return self._request(
-            "POST", endpoint, cont_yn=cont_yn, cont_key=cont_key, **kwargs
+            "POST", endpoint, cont_yn=cont_yn, cont_key=cont_key, rate_limit_key="deposit", **kwargs
         )
 
 
@@ -178,7 +178,7 @@ class DomesticFuturesTradingService(BaseService, ITradingService):
         endpoint = "/api/v1/trading/kr-futureoption/inquiry/balance"
         data = request.to_request_data()
         return self._request(
-            "POST", endpoint, data=data, cont_yn=cont_yn, cont_key=cont_key, **kwargs
+            "POST", endpoint, data=data, cont_yn=cont_yn, cont_key=cont_key, rate_limit_key="futures_balance", **kwargs
         )
 
     def cancel_order(self, *args, **kwargs):
@@ -1,8 +1,39 @@
 from .main import *
-import pandas as pd
+from .api import KST
 from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable
 
-def get_balance_domestic(dbfi: DBFI):
+
+def get_previous_rors_domestic(
+    dbfi: DBFI,
+    stock_codes: Iterable[str],
+    max_workers: int = 8,
+) -> Dict[str, Dict[str, Any]]:
+    """
+    국내 종목별 전일대비등락율 동시 조회
+
+    시세는 dbfi.get_stock_prices로 조회하므로 DBFI에 quote_cache를 지정하면
+    해당 클라이언트의 QuoteCache에서 재사용된다.
+
+    Args:
+        stock_codes: 종목번호 목록 (잔고의 IsuNo 형식)
+
+    Returns:
+        {종목번호: {"전일대비등락율": float | None, "error": str | None}}
+    """
+    prices = dbfi.get_stock_prices(region="domestic", codes=stock_codes, max_workers=max_workers)
+    rors = {}
+    for code, error in prices["errors"].items():
+        rors[code] = {"전일대비등락율": None, "error": str(error)}
+    for code, price in prices["results"].items():
+        try:
+            rors[code] = {"전일대비등락율": float(price["Out"]["PrdyCtrt"]), "error": None}
+        except (KeyError, TypeError, ValueError) as e:
+            rors[code] = {"전일대비등락율": None, "error": f"{type(e).__name__}: {e}"}
+    return rors
+
+
+def get_balance_domestic(dbfi: DBFI, max_workers: int = 8):
     region = "domestic"
     domestic_balance = dbfi.get_stock_balance(region=region)
     
@@ -16,13 +47,17 @@ def get_balance_domestic(dbfi: DBFI):
             if r["rsp_cd"] == "00000":
                 out1_data.extend(r["Out1"])
     
+    # 보유 종목 전일대비등락율을 한 번에 동시 조회
+    rors = get_previous_rors_domestic(
+        dbfi,
+        (r["IsuNo"] for r in out1_data if r["BalQty0"] > 0),
+        max_workers=max_workers,
+    )
+
     stocks = {}
     for i, r in enumerate(out1_data):
         if r["BalQty0"] > 0:
-            try:
-                previous_ror = float(dbfi.get_stock_price(region=region, stock_code=r['IsuNo'])["Out"]["PrdyCtrt"])
-            except:
-                previous_ror = 0
+            ror = rors[r["IsuNo"]]
             stocks[i] = {
                 "종목코드": r['IsuNo'][1:],
                 "종목명": r["IsuNm"],
@@ -33,7 +68,8 @@ def get_balance_domestic(dbfi: DBFI):
                 "평균단가": round(r["PchsAmt"] / r["BalQty0"], 2) if r["BalQty0"] > 0 else 0,
                 "보유수량": r["BalQty0"],
                 "현재가": float(r["NowPrc"]),
-                "전일대비등락율": previous_ror,
+                "전일대비등락율": ror["전일대비등락율"],
+                "시세조회오류": ror["error"],
                 "country": "KR",
             }
 
@@ -79,7 +115,7 @@ def get_balance_overseas(dbfi: DBFI, is_integrated: bool = False):
         price=1
     )
     
-    exec_amts = get_execute_amounts_overseas(dbfi, datetime.now(pytz.timezone('Asia/Seoul')))
+    exec_amts = get_execute_amounts_overseas(dbfi, datetime.now(KST))
     balances = {
         "주문가능현금": float(able_order_quantity["Out"]["AstkOrdAbleAmt0" if is_integrated else "AstkOrdAbleAmt"]),
         "평가손익률": 0,
@@ -0,0 +1,222 @@
+import bisect
+import json
+import logging
+import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+try:
+    from zoneinfo import ZoneInfo
+except ImportError:  # Python 3.8 이하
+    ZoneInfo = None
+
+# 종목 마스터 조회 시장 코드
+DOMESTIC_MARKETS = ("J", "E", "EN")  # J:주식, E:ETF, EN:ETN
+OVERSEAS_MARKETS = ("NY", "NA", "AM")  # NY:뉴욕, NA:나스닥, AM:아멕스
+
+# 종목 마스터 시장 코드 -> 해외 시세/차트 조회 시장 코드
+OVERSEAS_QUOTE_MARKETS = {"NY": "FY", "NA": "FN", "AM": "FA"}
+
+# 응답 행에서 종목코드/종목명으로 사용할 필드 (앞에서부터 처음 존재하는 값 사용)
+CODE_FIELDS = ("Iscd", "IsuNo", "SymCode", "AstkIsuNo", "Symbol")
+NAME_FIELDS = ("KorIsnm", "IsuNm", "HanglIsuNm", "AstkHanglIsuNm", "EngIsnm", "IsuEngNm")
+
+# 지역별 거래소 시간대 (zoneinfo가 없으면 일광절약시간을 반영하지 않은 표준시 사용)
+EXCHANGE_TIMEZONES = {"domestic": "Asia/Seoul", "overseas": "America/New_York"}
+_FIXED_TIMEZONES = {"domestic": timezone(timedelta(hours=9)), "overseas": timezone(timedelta(hours=-5))}
+
+
+def trading_date(region: str, holidays: Iterable[str] = (), now: Optional[datetime] = None) -> str:
+    """
+    거래소 현지 기준 가장 최근 거래일 (YYYYMMDD)
+
+    주말과 holidays(YYYYMMDD)는 직전 거래일로 본다.
+    """
+    if ZoneInfo is not None:
+        tz = ZoneInfo(EXCHANGE_TIMEZONES[region])
+    else:
+        tz = _FIXED_TIMEZONES[region]
+    day: date = (now.astimezone(tz) if now is not None else datetime.now(tz)).date()
+    holidays = set(holidays)
+    while day.weekday() >= 5 or day.strftime("%Y%m%d") in holidays:
+        day -= timedelta(days=1)
+    return day.strftime("%Y%m%d")
+
+
+def _first(row: Dict[str, Any], fields: Iterable[str]) -> Optional[str]:
+    for field in fields:
+        value = row.get(field)
+        if value not in (None, ""):
+            return str(value).strip()
+    return None
+
+
+def _normalize_code(code: str) -> str:
+    # 국내 종목번호 "A005930" -> "005930"
+    if len(code) == 7 and code[0] == "A" and code[1:].isdigit():
+        return code[1:]
+    return code.upper()
+
+
+class TickerMaster:
+    """
+    종목 마스터 로컬 저장소
+
+    get_stock_tickers 결과를 SQLite 파일에 저장하고 거래일마다 한 번만 갱신한다.
+    거래일은 시장별 거래소 현지 날짜 기준이며 주말/휴장일에는 직전 거래일로 보아 다시 받지 않는다. 조회는 메모리 인덱스(종목코드, 종목명 접두어, 시장)로 처리한다.
+
+    사용 예:
+        master = TickerMaster(dbfi)
+        master.resolve_symbol("AAPL")        # "NA"
+        master.resolve_quote_market("AAPL")  # "FN" (해외 시세 조회용)
+        master.get("005930")["name"]
+        master.search("삼성")
+        master.by_market("E")
+
+    Args:
+        dbfi: DBFI 인스턴스
+        path: 저장 파일 경로 (None이면 ~/.cache/pydbfi/tickers.sqlite3)
+        markets: 관리할 시장 코드 (기본: 국내 J/E/EN, 해외 NY/NA/AM)
+        auto_load: 생성 시 load() 실행 여부
+        holidays: 주말 외 휴장일 (YYYYMMDD, 국내/해외 공통)
+    """
+
+    def __init__(
+        self,
+        dbfi,
+        path: Optional[str] = None,
+        markets: Optional[Iterable[str]] = None,
+        auto_load: bool = True,
+        holidays: Iterable[str] = (),
+    ):
+        self.dbfi = dbfi
+        self.path = os.path.expanduser(path or os.path.join("~", ".cache", "pydbfi", "tickers.sqlite3"))
+        self.markets = tuple(markets or DOMESTIC_MARKETS + OVERSEAS_MARKETS)
+        self.holidays = frozenset(holidays)
+        self.logger = logging.getLogger(__name__)
+        self._lock = threading.RLock()
+        self._by_code: Dict[str, Dict[str, Any]] = {}
+        self._by_market: Dict[str, List[Dict[str, Any]]] = {}
+        self._names: List[tuple] = []  # (소문자 종목명, 종목코드) 정렬 목록
+
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        with self._connect() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS tickers ("
+                "market TEXT NOT NULL, code TEXT NOT NULL, name TEXT, data TEXT NOT NULL, "
+                "PRIMARY KEY (market, code))"
+            )
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS refresh_log (market TEXT PRIMARY KEY, trading_date TEXT NOT NULL)"
+            )
+        if auto_load:
+            self.load()
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """트랜잭션 단위 커넥션 (종료 시 commit/rollback 후 닫음)"""
+        conn = sqlite3.connect(self.path, timeout=30)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def _trading_date(self, market: str) -> str:
+        return trading_date(self._region(market), self.holidays)
+
+    @staticmethod
+    def _region(market: str) -> str:
+        return "overseas" if market in OVERSEAS_MARKETS else "domestic"
+
+    def stale_markets(self) -> List[str]:
+        """현재 거래일에 갱신되지 않은 시장 코드 목록"""
+        with self._connect() as conn:
+            refreshed = dict(conn.execute("SELECT market, trading_date FROM refresh_log").fetchall())
+        return [market for market in self.markets if refreshed.get(market) != self._trading_date(market)]
+
+    def load(self, force_refresh: bool = False):
+        """오래된 시장만 API로 갱신한 뒤 저장된 전체 종목으로 메모리 인덱스를 구성"""
+        markets = list(self.markets) if force_refresh else self.stale_markets()
+        if markets:
+            self.refresh(markets)
+        self._build_index()
+
+    def refresh(self, markets: Optional[Iterable[str]] = None):
+        """API에서 종목 마스터를 받아 시장 단위로 교체 저장"""
+        for market in markets or self.markets:
+            api = getattr(self.dbfi, self._region(market))
+            records = []
+            for row in api.iter_rows("get_stock_tickers", out_key="Out", market_code=market):
+                code = _first(row, CODE_FIELDS)
+                if code is None:
+                    continue
+                records.append(
+                    (market, code, _first(row, NAME_FIELDS), json.dumps(row, ensure_ascii=False))
+                )
+            with self._connect() as conn:
+                conn.execute("DELETE FROM tickers WHERE market = ?", (market,))
+                conn.executemany(
+                    "INSERT OR REPLACE INTO tickers (market, code, name, data) VALUES (?, ?, ?, ?)",
+                    records,
+                )
+                conn.execute(
+                    "INSERT OR REPLACE INTO refresh_log (market, trading_date) VALUES (?, ?)",
+                    (market, self._trading_date(market)),
+                )
+            self.logger.info(f"종목 마스터 갱신: {market} ({len(records)}종목)")
+
+    def _build_index(self):
+        by_code, by_market = {}, {}
+        placeholders = ",".join("?" * len(self.markets))
+        with self._connect() as conn:
+            rows = conn.execute(
+                f"SELECT market, code, name, data FROM tickers WHERE market IN ({placeholders})",
+                self.markets,
+            ).fetchall()
+        for market, code, name, data in rows:
+            record = {"market": market, "code": code, "name": name, "data": json.loads(data)}
+            by_code[_normalize_code(code)] = record
+            by_market.setdefault(market, []).append(record)
+        names = sorted(
+            (record["name"].lower(), code) for code, record in by_code.items() if record["name"]
+        )
+        with self._lock:
+            self._by_code, self._by_market, self._names = by_code, by_market, names
+
+    def get(self, code: str) -> Optional[Dict[str, Any]]:
+        """종목코드로 조회 ({"market", "code", "name", "data"})"""
+        return self._by_code.get(_normalize_code(code))
+
+    def resolve_symbol(self, code: str) -> Optional[str]:
+        """종목코드의 종목 마스터 시장 코드 (예: "AAPL" -> "NA", "005930" -> "J")"""
+        record = self.get(code)
+        return record["market"] if record else None
+
+    def resolve_quote_market(self, code: str) -> Optional[str]:
+        """해외 종목의 시세/차트 조회 시장 코드 (예: "AAPL" -> "FN")"""
+        return OVERSEAS_QUOTE_MARKETS.get(self.resolve_symbol(code))
+
+    def search(self, prefix: str, limit: int = 20) -> List[Dict[str, Any]]:
+        """종목명 접두어 검색 (대소문자 무시)"""
+        prefix = prefix.lower()
+        with self._lock:
+            names = self._names
+        results = []
+        i = bisect.bisect_left(names, (prefix, ""))
+        while i < len(names) and names[i][0].startswith(prefix) and len(results) < limit:
+            results.append(self._by_code[names[i][1]])
+            i += 1
+        return results
+
+    def by_market(self, market: str) -> List[Dict[str, Any]]:
+        return list(self._by_market.get(market, []))
+
+    def __contains__(self, code: str) -> bool:
+        return self.get(code) is not None
+
+    def __len__(self) -> int:
+        return len(self._by_code)
@@ -0,0 +1,132 @@
+import logging
+import random
+import threading
+import time
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from .oauth import OAuth
+
+
+class TokenRefresher:
+    """
+    접근 토큰 만료 전 백그라운드 갱신
+
+    만료 refresh_before초 전(여러 프로세스가 동시에 갱신하지 않도록 최대 jitter초 앞당김)에
+    별도 스레드에서 새 토큰을 발급받아 한 번에 교체한다. 기존 토큰은 교체 시점까지 유효하므로
+    요청 스레드는 발급을 기다리지 않는다. 갱신에 실패하면 retry_interval초 후 다시 시도한다.
+
+    사용 예:
+        dbfi = DBFI(app_key="...", app_secret_key="...", auto_refresh_token=True)
+        dbfi.token_refresher.stats()
+
+        # 직접 생성
+        refresher = TokenRefresher(dbfi.auth, refresh_before=3600).start()
+        refresher.stop()
+
+    Args:
+        auth: 갱신할 OAuth 인스턴스
+        refresh_before: 만료 몇 초 전에 갱신할지 (get_token의 10분 여유보다 커야 요청 경로에서 발급하지 않음)
+        jitter: 갱신 시각을 앞당기는 무작위 범위 (초)
+        retry_interval: 갱신 실패 후 재시도 간격 (초)
+    """
+
+    def __init__(
+        self,
+        auth: OAuth,
+        refresh_before: float = 1800.0,
+        jitter: float = 300.0,
+        retry_interval: float = 30.0,
+    ):
+        self.auth = auth
+        self.refresh_before = refresh_before
+        self.jitter = jitter
+        self.retry_interval = retry_interval
+        self.logger = logging.getLogger(__name__)
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._stats: Dict[str, Any] = {
+            "refreshes": 0,
+            "failures": 0,
+            "last_refresh_at": None,
+            "last_duration": None,
+            "total_duration": 0.0,
+            "last_error": None,
+            "next_refresh_at": None,
+        }
+
+    def start(self) -> "TokenRefresher":
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._stop.clear()
+                self._thread = threading.Thread(
+                    target=self._run, name="pydbfi-token-refresher", daemon=True
+                )
+                self._thread.start()
+        return self
+
+    def stop(self, timeout: Optional[float] = 5.0):
+        self._stop.set()
+        thread = self._thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout)
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def next_delay(self) -> float:
+        """다음 갱신까지 남은 시간(초). 만료 시각을 모르면 0"""
+        expire_in = self.auth.expire_in
+        if not self.auth.token or expire_in is None:
+            return 0.0
+        remaining = (expire_in - datetime.now()).total_seconds()
+        return max(0.0, remaining - self.refresh_before - random.uniform(0, self.jitter))
+
+    def refresh_now(self) -> bool:
+        """즉시 갱신하고 성공 여부를 반환"""
+        started = time.monotonic()
+        try:
+            # 요청 경로의 지연 발급과 겹치지 않도록 OAuth 락 안에서 발급
+            with self.auth._lock:
+                self.auth._refresh_token(rejected=self.auth.token)
+        except Exception as e:
+            with self._lock:
+                self._stats["failures"] += 1
+                self._stats["last_error"] = repr(e)
+            self.logger.error(f"Background token refresh failed: {e}")
+            return False
+        duration = time.monotonic() - started
+        with self._lock:
+            self._stats["refreshes"] += 1
+            self._stats["last_refresh_at"] = datetime.now()
+            self._stats["last_duration"] = duration
+            self._stats["total_duration"] += duration
+            self._stats["last_error"] = None
+        return True
+
+    def _run(self):
+        delay = self.next_delay()
+        while True:
+            with self._lock:
+                self._stats["next_refresh_at"] = datetime.fromtimestamp(time.time() + delay)
+            if self._stop.wait(delay):
+                break
+            if self.refresh_now():
+                # 짧은 만료 시간을 받은 경우에도 연속 발급하지 않도록 최소 간격 유지
+                delay = max(self.retry_interval, self.next_delay())
+            else:
+                delay = self.retry_interval
+        with self._lock:
+            self._stats["next_refresh_at"] = None
+
+    def stats(self) -> Dict[str, Any]:
+        """갱신/실패 횟수, 마지막 갱신 시각과 소요 시간, 마지막 오류, 다음 갱신 예정 시각"""
+        with self._lock:
+            stats = dict(self._stats)
+        stats["avg_duration"] = (
+            stats["total_duration"] / stats["refreshes"] if stats["refreshes"] else 0.0
+        )
+        stats["running"] = self.running
+        return stats
@@ -0,0 +1,188 @@
+import json
+import os
+import tempfile
+import threading
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from typing import Any, Dict, Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows: 프로세스 내 잠금만 사용
+    fcntl = None
+
+
+class TokenStore(ABC):
+    """
+    접근 토큰 저장소 인터페이스
+
+    저장 형식: {"access_token": str, "token_type": str, "expire_at": float (epoch 초)}
+    acquire/release는 토큰 발급 구간의 배타 잠금이며 다른 스레드에서 해제할 수 있어야 한다.
+    acquire(blocking=False)는 잠금을 기다리지 않고 획득 여부를 반환한다. (비동기 클라이언트가 사용)
+    """
+
+    @abstractmethod
+    def load(self, key: str) -> Optional[Dict[str, Any]]:
+        pass
+
+    @abstractmethod
+    def save(self, key: str, token: Dict[str, Any]):
+        pass
+
+    @abstractmethod
+    def delete(self, key: str):
+        pass
+
+    @abstractmethod
+    def acquire(self, blocking: bool = True) -> bool:
+        pass
+
+    @abstractmethod
+    def release(self):
+        pass
+
+    @contextmanager
+    def lock(self):
+        self.acquire()
+        try:
+            yield
+        finally:
+            self.release()
+
+    def close(self):
+        pass
+
+
+class MemoryTokenStore(TokenStore):
+    """프로세스 내 여러 OAuth 인스턴스가 공유하는 저장소"""
+
+    def __init__(self):
+        self._tokens: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    def load(self, key: str) -> Optional[Dict[str, Any]]:
+        token = self._tokens.get(key)
+        return dict(token) if token is not None else None
+
+    def save(self, key: str, token: Dict[str, Any]):
+        self._tokens[key] = dict(token)
+
+    def delete(self, key: str):
+        self._tokens.pop(key, None)
+
+    def acquire(self, blocking: bool = True) -> bool:
+        return self._lock.acquire(blocking)
+
+    def release(self):
+        self._lock.release()
+
+
+class FileTokenStore(TokenStore):
+    """
+    동일 호스트의 여러 프로세스와 재시작 간에 토큰을 공유하는 파일 저장소
+
+    토큰 파일은 임시 파일에 쓴 뒤 os.replace로 교체하므로 읽는 쪽이 쓰다 만 내용을 보지 않는다.
+    발급 구간은 "<path>.lock" 파일 잠금(fcntl.flock)으로 보호되어 만료마다 한 프로세스만 발급한다.
+    (fcntl이 없는 환경에서는 프로세스 내 잠금만 적용)
+
+    사용 예:
+        store = FileTokenStore("~/.cache/pydbfi/token.json")
+        dbfi = DBFI(app_key="...", app_secret_key="...", token_store=store)
+
+    Args:
+        path: 토큰 파일 경로 (로컬 파일시스템이어야 함, 권한 0600으로 생성)
+    """
+
+    def __init__(self, path: str):
+        self.path = os.path.expanduser(path)
+        self.lock_path = self.path + ".lock"
+        self._thread_lock = threading.Lock()
+        self._write_thread_lock = threading.Lock()
+        self._lock_fd: Optional[int] = None
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+
+    def _read(self) -> Dict[str, Any]:
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+        except ValueError:
+            # 손상된 파일은 비어 있는 것으로 간주 (다음 발급 시 덮어씀)
+            return {}
+
+    def _write(self, tokens: Dict[str, Any]):
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(self.path) or ".", prefix=".token-")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(tokens, f)
+                f.flush()
+                os.fsync(f.fileno())
+            os.chmod(tmp_path, 0o600)
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+
+    def load(self, key: str) -> Optional[Dict[str, Any]]:
+        return self._read().get(key)
+
+    def save(self, key: str, token: Dict[str, Any]):
+        # 다른 키 항목을 잃지 않도록 잠금 안에서 읽고 교체
+        with self._write_lock():
+            tokens = self._read()
+            tokens[key] = token
+            self._write(tokens)
+
+    def delete(self, key: str):
+        with self._write_lock():
+            tokens = self._read()
+            if tokens.pop(key, None) is not None:
+                self._write(tokens)
+
+    @contextmanager
+    def _write_lock(self):
+        # 읽기-수정-교체 구간 잠금 (발급 잠금과 별도 파일을 사용하여 발급 중에도 저장 가능)
+        with self._write_thread_lock:
+            fd = os.open(self.path + ".wlock", os.O_RDWR | os.O_CREAT, 0o600)
+            try:
+                if fcntl is not None:
+                    fcntl.flock(fd, fcntl.LOCK_EX)
+                yield
+            finally:
+                os.close(fd)
+
+    def acquire(self, blocking: bool = True) -> bool:
+        if not self._thread_lock.acquire(blocking):
+            return False
+        fd = None
+        try:
+            fd = os.open(self.lock_path, os.O_RDWR | os.O_CREAT, 0o600)
+            if fcntl is not None:
+                try:
+                    fcntl.flock(fd, fcntl.LOCK_EX if blocking else fcntl.LOCK_EX | fcntl.LOCK_NB)
+                except BlockingIOError:
+                    # 다른 프로세스가 발급 중
+                    os.close(fd)
+                    self._thread_lock.release()
+                    return False
+            self._lock_fd = fd
+            return True
+        except BaseException:
+            if fd is not None:
+                os.close(fd)
+            self._thread_lock.release()
+            raise
+
+    def release(self):
+        fd, self._lock_fd = self._lock_fd, None
+        try:
+            if fd is not None:
+                if fcntl is not None:
+                    fcntl.flock(fd, fcntl.LOCK_UN)
+                os.close(fd)
+        finally:
+            self._thread_lock.release()
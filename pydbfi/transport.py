@@ -0,0 +1,104 @@
+import logging
+import threading
+import time
+from typing import Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+# 요청 기본 타임아웃 (초). 응답 없는 소켓이 주문 경로를 무한히 막지 않도록 함
+DEFAULT_TIMEOUT = 30.0
+
+
+class HTTPTransport:
+    """
+    keep-alive 커넥션 풀을 공유하는 HTTP 전송 계층
+
+    사용 예:
+        transport = HTTPTransport(pool_connections=4, pool_maxsize=20, idle_timeout=30)
+        dbfi = DBFI(app_key="...", app_secret_key="...", transport=transport)
+
+    Args:
+        pool_connections: 커넥션 풀을 유지할 호스트 수
+        pool_maxsize: 호스트당 최대 커넥션 수
+        idle_timeout: 유휴 커넥션 유지 시간 (초). 마지막 요청이 끝난 뒤 초과하면 풀을 비우고 새로 연결
+        timeout: 요청 기본 타임아웃 (초, None이면 무제한)
+    """
+
+    def __init__(
+        self,
+        pool_connections: int = 4,
+        pool_maxsize: int = 10,
+        idle_timeout: Optional[float] = 60.0,
+        timeout: Optional[float] = DEFAULT_TIMEOUT,
+    ):
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.idle_timeout = idle_timeout
+        self.timeout = timeout
+        self.logger = logging.getLogger(__name__)
+        self._lock = threading.Lock()
+        self._last_used = time.monotonic()  # 마지막 요청 완료 시각
+        self._in_flight = 0  # 진행 중인 요청 수 (0일 때만 풀 재생성)
+        self._closed = False
+        self.session = self._create_session()
+
+    def _create_session(self) -> requests.Session:
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+            pool_block=False,
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+    def _acquire_session(self) -> requests.Session:
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("이미 종료된 transport 입니다.")
+            if (
+                self.idle_timeout is not None
+                and self._in_flight == 0
+                and time.monotonic() - self._last_used > self.idle_timeout
+            ):
+                # 서버가 끊었을 가능성이 높은 유휴 커넥션 정리 (사용 중인 세션은 닫지 않음)
+                self.logger.debug("유휴 시간 초과: 커넥션 풀을 재생성합니다.")
+                self.session.close()
+                self.session = self._create_session()
+            self._in_flight += 1
+            return self.session
+
+    def _release_session(self):
+        with self._lock:
+            self._in_flight -= 1
+            self._last_used = time.monotonic()
+
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        kwargs.setdefault("timeout", self.timeout)
+        session = self._acquire_session()
+        try:
+            return session.request(method=method, url=url, **kwargs)
+        finally:
+            self._release_session()
+
+    def post(self, url: str, **kwargs) -> requests.Response:
+        return self.request("POST", url, **kwargs)
+
+    def close(self):
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self.session.close()
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -15,9 +15,16 @@ setup(
         "License :: OSI Approved :: MIT License",
         "Operating System :: OS Independent",
     ],
-    python_requires=">=3.6",
+    python_requires=">=3.7",
     install_requires=[
         "requests",
         "fake-useragent"
     ],
+    extras_require={
+        "async": ["httpx"],
+        "numpy": ["numpy"],
+        "pandas": ["numpy", "pandas"],
+        "arrow": ["numpy", "pyarrow"],
+        "test": ["pytest", "httpx", "numpy", "pyarrow"],
+    },
 )
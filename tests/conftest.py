@@ -0,0 +1,44 @@
+import logging
+
+import pytest
+
+from pydbfi import DBFI
+from pydbfi.mockserver import MockDBFIServer, MockTransport
+from pydbfi.pacing import ContinuationPacer
+from pydbfi.ratelimit import RateLimiter
+
+# 클라이언트 종료 시 토큰 폐기 경고 등 SDK 로그 생략
+logging.getLogger("pydbfi").setLevel(logging.ERROR)
+
+
+@pytest.fixture
+def server():
+    """소켓 없이 MockTransport로 사용하는 모의 서버 (start() 불필요)"""
+    return MockDBFIServer()
+
+
+@pytest.fixture
+def make_client(server):
+    """
+    모의 서버에 연결된 DBFI 생성 함수
+
+    유량 제한과 연속 조회 대기는 기본으로 끄며, 키워드 인자로 바꿀 수 있다.
+    """
+    clients = []
+
+    def make(**kwargs):
+        kwargs.setdefault("rate_limiter", RateLimiter({}))
+        kwargs.setdefault("pacer", ContinuationPacer(initial_interval=0, min_interval=0))
+        kwargs.setdefault("transport", MockTransport(server))
+        client = DBFI(app_key="test", app_secret_key="test", log_level=logging.WARNING, base_url=server.url, **kwargs)
+        clients.append(client)
+        return client
+
+    yield make
+    for client in clients:
+        client.close()
+
+
+@pytest.fixture
+def dbfi(make_client):
+    return make_client()
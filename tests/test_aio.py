@@ -0,0 +1,122 @@
+import asyncio
+import logging
+import threading
+import time
+
+import pytest
+
+from pydbfi import MemoryTokenStore
+from pydbfi.aio import AsyncDBFI, AsyncOAuth
+from pydbfi.mockserver import MockDBFIServer
+from pydbfi.pacing import ContinuationPacer
+from pydbfi.ratelimit import RateLimiter
+
+DAILY_CHART = "/api/v1/quote/kr-chart/day"
+PRICE_ENDPOINT = "/api/v1/quote/kr-stock/inquiry/price"
+
+
+@pytest.fixture
+def live_server():
+    """httpx 전송을 사용하므로 소켓으로 기동한 모의 서버"""
+    with MockDBFIServer() as server:
+        yield server
+
+
+def _client(server, **kwargs):
+    kwargs.setdefault("rate_limiter", RateLimiter({}))
+    kwargs.setdefault("pacer", ContinuationPacer(initial_interval=0, min_interval=0))
+    return AsyncDBFI(app_key="test", app_secret_key="test", log_level=logging.WARNING, base_url=server.url, **kwargs)
+
+
+def test_async_collects_and_streams_pages(live_server):
+    async def run():
+        async with _client(live_server) as dbfi:
+            pages = await dbfi.domestic.get_daily_chart(stock_code="005930", start_date="20240101", end_date="20240630")
+            streamed = [
+                page
+                async for page in dbfi.domestic.iter_pages(
+                    "get_daily_chart", stock_code="005930", start_date="20240101", end_date="20240630"
+                )
+            ]
+            return pages, streamed
+
+    pages, streamed = asyncio.run(run())
+    assert isinstance(pages, list) and len(pages) == 3
+    assert sum(len(page["Out"]) for page in pages) == 60
+    assert [page["Out"] for page in streamed] == [page["Out"] for page in pages]
+    assert live_server.stats()["requests"][DAILY_CHART] == 6
+
+
+def test_async_replays_once_after_token_expiry(live_server):
+    async def run():
+        async with _client(live_server) as dbfi:
+            await dbfi.domestic.get_stock_price(stock_code="005930")
+            first = dbfi.auth.token
+            live_server.expire_tokens()
+            # 동시에 만료를 감지한 코루틴들은 하나의 재발급을 공유
+            results = await asyncio.gather(
+                *(dbfi.domestic.get_stock_price(stock_code=code) for code in ("005930", "000660", "035420"))
+            )
+            return first, dbfi.auth.token, results
+
+    first, second, results = asyncio.run(run())
+    assert first != second
+    assert all(result["rsp_cd"] == "00000" for result in results)
+    stats = live_server.stats()
+    assert stats["tokens_issued"] == 2
+    assert stats["expired"] == 3
+    assert stats["requests"][PRICE_ENDPOINT] == 7
+
+
+def test_async_rate_limiter_spaces_concurrent_requests(live_server):
+    rate = 10
+    live_server.rate_limits["quote"] = rate + 1
+    limiter = RateLimiter({"quote": rate})
+    codes = [f"{900000 + i:06d}" for i in range(rate + 5)]
+
+    async def run():
+        async with _client(live_server, rate_limiter=limiter) as dbfi:
+            started = time.monotonic()
+            result = await dbfi.domestic.get_stock_prices(codes=codes, max_workers=8)
+            return result, time.monotonic() - started
+
+    result, elapsed = asyncio.run(run())
+    assert result["errors"] == {}
+    assert len(result["results"]) == len(codes)
+    assert live_server.stats()["throttled"] == 0
+    assert limiter.stats()["quote"]["count"] == len(codes)
+    assert elapsed >= (len(codes) - 1) / rate * 0.9
+
+
+def test_cancelled_refresh_does_not_leave_store_locked(live_server):
+    store = MemoryTokenStore()
+    auth = AsyncOAuth(appkey="test", appsecretkey="test", token_store=store, base_url=live_server.url)
+    # 다른 스레드(프로세스)가 발급 중인 상황
+    store.acquire()
+    released = threading.Event()
+
+    async def scenario():
+        task = asyncio.create_task(auth.aget_token())
+        await asyncio.sleep(0.2)
+        # 잠금 대기 중에도 이벤트 루프는 멈추지 않음
+        assert not task.done()
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        store.release()
+        released.set()
+        # 취소된 대기자가 잠금을 잡은 채 남지 않음
+        assert store.acquire(blocking=False)
+        store.release()
+        return await auth.aget_token()
+
+    async def run():
+        try:
+            return await scenario()
+        finally:
+            if not released.is_set():
+                store.release()
+            await auth.async_transport.close()
+
+    token = asyncio.run(run())
+    assert token and live_server.stats()["tokens_issued"] == 1
@@ -0,0 +1,87 @@
+import pytest
+
+pytest.importorskip("numpy")
+
+from pydbfi import BackfillScheduler, ChartStore  # noqa: E402
+
+CODES = ["005930", "000660", "035420"]
+
+
+@pytest.fixture
+def store(dbfi, tmp_path):
+    return ChartStore(dbfi, path=str(tmp_path / "charts.sqlite3"))
+
+
+def test_run_fills_every_symbol(store):
+    scheduler = BackfillScheduler(store, max_workers=3, chunk_days={"daily": 10})
+    progress = scheduler.run(CODES, periods="daily", start_date="20240101", end_date="20240131")
+    assert progress.errors == []
+    assert progress.done_units == progress.total_units == len(CODES) * 4
+    for code in CODES:
+        assert store.coverage("domestic", code, "daily") == [("20240101", "20240131")]
+        assert len(store.load("domestic", code, "daily", "20240101", "20240131")) == 23
+
+
+def test_resume_after_stop(store):
+    scheduler = BackfillScheduler(store, max_workers=1, chunk_days={"daily": 7})
+    done = []
+
+    def on_progress(progress):
+        done.append(progress.done_units)
+        if progress.done_units == 3:
+            scheduler.stop()
+
+    scheduler.on_progress = on_progress
+    first = scheduler.run(CODES, periods="daily", start_date="20240101", end_date="20240131")
+    assert first.done_units == 3 < first.total_units
+
+    # 다시 실행하면 저장된 작업을 건너뛰고 남은 작업만 실행
+    remaining = scheduler.plan(CODES, periods="daily", start_date="20240101", end_date="20240131")
+    assert len(remaining) == first.total_units - 3
+    scheduler.on_progress = None
+    second = scheduler.run(CODES, periods="daily", start_date="20240101", end_date="20240131")
+    assert second.errors == [] and second.done_units == len(remaining)
+    assert scheduler.plan(CODES, periods="daily", start_date="20240101", end_date="20240131") == []
+
+
+def test_default_start_date_resumes_from_coverage(store):
+    scheduler = BackfillScheduler(store, chunk_days={"daily": None})
+    scheduler.run(CODES[:1], periods="daily", start_date="20240101", end_date="20240131")
+
+    units = scheduler.plan(CODES[:1], periods="daily", end_date="20240229")
+    assert [(unit.start_date, unit.end_date) for unit in units] == [("20240201", "20240229")]
+    progress = scheduler.run(CODES[:1], periods="daily", end_date="20240229")
+    assert progress.errors == []
+    assert store.coverage("domestic", CODES[0], "daily") == [("20240101", "20240229")]
+
+
+def test_default_start_date_requires_coverage(store):
+    scheduler = BackfillScheduler(store)
+    with pytest.raises(ValueError, match="start_date"):
+        scheduler.run(["005930"], periods="daily")
+
+
+def test_overseas_minute_units(store):
+    scheduler = BackfillScheduler(store, max_workers=2)
+    progress = scheduler.run(
+        ["AAPL", "MSFT"], periods="minute", start_date="20240104", end_date="20240108", region="overseas", time_interval="60"
+    )
+    # 주말(6, 7일)을 제외한 거래일별 작업
+    assert progress.total_units == 6
+    assert progress.errors == [] and progress.failed_units == 0
+    assert progress.bars > 0
+    for symbol in ("AAPL", "MSFT"):
+        assert store.coverage("overseas", symbol, "minute", "60") == [("20240104", "20240108")]
+
+
+def test_minute_weekends_join_adjacent_units(store):
+    scheduler = BackfillScheduler(store)
+    # 토요일 시작, 일요일 종료
+    assert scheduler._split("minute", "20240106", "20240114") == [
+        ("20240106", "20240108"),
+        ("20240109", "20240109"),
+        ("20240110", "20240110"),
+        ("20240111", "20240111"),
+        ("20240112", "20240114"),
+    ]
+    assert scheduler._split("minute", "20240106", "20240107") == []
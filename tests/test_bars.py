@@ -0,0 +1,119 @@
+import asyncio
+
+import numpy as np
+import pytest
+
+from pydbfi.bars import ChartBars, to_timestamps
+
+
+def _row(date, hour, close, volume=100):
+    price = str(close) if close not in (None, "") else close
+    return {"Date": date, "Hour": hour, "Oprc": price, "Hprc": price, "Lprc": price, "Prpr": price, "Cntg_Vol": str(volume)}
+
+
+def _bars(stamps, closes, volumes=None):
+    closes = np.asarray(closes, dtype=np.float64)
+    volumes = np.ones(len(closes), dtype=np.int64) if volumes is None else volumes
+    return ChartBars(np.asarray(stamps), closes, closes, closes, closes, volumes)
+
+
+def _ts(date, time=None):
+    return int(to_timestamps(np.array([date]), None if time is None else np.array([time]))[0])
+
+
+def test_from_rows_converts_strings():
+    bars = ChartBars.from_rows([_row("20240102", "090100", 71000, 5), _row("20240102", "090000", 70900, 7)], tz="Asia/Seoul")
+    # from_rows는 순서를 유지
+    assert bars.datetime.tolist() == [np.datetime64("2024-01-02T09:01:00"), np.datetime64("2024-01-02T09:00:00")]
+    assert bars.close.tolist() == [71000.0, 70900.0]
+    assert bars.volume.dtype == np.int64 and bars.volume.tolist() == [5, 7]
+    assert bars.tz == "Asia/Seoul"
+
+
+def test_from_rows_drops_rows_without_date_or_time():
+    rows = [
+        _row("20240102", "090000", 100),
+        _row("", "090100", 101),
+        _row(None, "090200", 102),
+        _row("20240102", "", 103),
+        _row("20240102", "090400", ""),
+    ]
+    bars = ChartBars.from_rows(rows)
+    # 0년/자정 봉을 만들지 않음
+    assert bars.datetime.tolist() == [np.datetime64("2024-01-02T09:00:00"), np.datetime64("2024-01-02T09:04:00")]
+    # 빈 가격은 NaN으로 유지
+    assert bars.close[0] == 100.0 and np.isnan(bars.close[1])
+
+
+def test_from_rows_daily_without_time():
+    rows = [{"Date": "20240103", "Prpr": "10"}, {"Date": "20240102", "Prpr": "9"}]
+    bars = ChartBars.from_rows(rows, fields={"open": "Prpr", "high": "Prpr", "low": "Prpr", "volume": "Prpr"})
+    assert bars.timestamp.tolist() == [_ts(20240103), _ts(20240102)]
+    assert bars.open.tolist() == [10.0, 9.0] and bars.volume.tolist() == [10, 9]
+    # 모든 행의 시간이 비어 있으면 일봉으로 간주
+    blank = ChartBars.from_rows([_row("20240102", "", 1), _row("20240103", "", 2)])
+    assert blank.timestamp.tolist() == [_ts(20240102), _ts(20240103)]
+
+
+def test_concat_sorts_and_keeps_last_duplicate():
+    first = _bars([30, 10, 20], [3.0, 1.0, 2.0])
+    second = _bars([20, 40], [20.0, 40.0])
+    bars = ChartBars.concat([first, ChartBars.empty(), second])
+    assert bars.timestamp.tolist() == [10, 20, 30, 40]
+    # 나중 배열의 값이 우선
+    assert bars.close.tolist() == [1.0, 20.0, 3.0, 40.0]
+    assert ChartBars.concat([second, first]).close.tolist() == [1.0, 2.0, 3.0, 40.0]
+    assert len(ChartBars.concat([])) == 0
+
+
+def test_concat_keeps_first_known_timezone():
+    first, second = _bars([1], [1.0]), _bars([2], [2.0])
+    second.tz = "America/New_York"
+    assert ChartBars.concat([first, second]).tz == "America/New_York"
+    assert ChartBars.concat([first, second], tz="Asia/Seoul").tz == "Asia/Seoul"
+
+
+def test_between_is_half_open():
+    bars = _bars([10, 20, 30, 40], [1.0, 2.0, 3.0, 4.0])
+    assert bars.between(20, 40).timestamp.tolist() == [20, 30]
+    assert bars.between(start=25).timestamp.tolist() == [30, 40]
+    assert bars.between(end=10).timestamp.tolist() == []
+    assert bars.between() == bars
+
+
+def test_to_pandas_localizes_index():
+    pytest.importorskip("pandas")
+    bars = ChartBars.from_rows([_row("20240102", "090000", 100, 3), _row("20240102", "090100", 101, 4)], tz="Asia/Seoul")
+    df = bars.to_pandas()
+    assert list(df.columns) == ["open", "high", "low", "close", "volume"]
+    assert str(df.index.tz) == "Asia/Seoul"
+    assert df.index[0].isoformat() == "2024-01-02T09:00:00+09:00"
+    assert df["volume"].tolist() == [3, 4]
+
+
+def test_from_pages_matches_client_rows(dbfi):
+    pages = dbfi.domestic.get_daily_chart(stock_code="005930", start_date="20240101", end_date="20240630")
+    bars = ChartBars.from_pages(pages)
+    rows = [row for page in pages for row in page["Out"]]
+    assert len(bars) == len(rows) == 60
+    # 최신 봉이 먼저 오는 응답을 오름차순으로 정렬
+    assert np.all(np.diff(bars.timestamp) > 0)
+    assert bars.close[-1] == float(rows[0]["Prpr"])
+    assert dbfi.get_chart_bars(region="domestic", period="daily", stock_code="005930", start_date="20240101", end_date="20240630") == bars
+
+
+def test_afrom_pages_matches_from_pages():
+    pages = [
+        {"Out": [_row("20240102", "090200", 3), _row("20240102", "090100", 2)]},
+        {"Out": []},
+        {"Out": [_row("20240102", "090100", 20), _row("20240102", "090000", 1)]},
+    ]
+
+    async def agen():
+        for page in pages:
+            yield page
+
+    bars = asyncio.run(ChartBars.afrom_pages(agen(), tz="Asia/Seoul"))
+    assert bars == ChartBars.from_pages(pages)
+    assert bars.close.tolist() == [1.0, 20.0, 3.0]
+    assert bars.tz == "Asia/Seoul"
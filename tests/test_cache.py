@@ -0,0 +1,107 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from pydbfi import QuoteCache
+
+PRICE_ENDPOINT = "/api/v1/quote/kr-stock/inquiry/price"
+
+
+def test_concurrent_callers_share_one_fetch():
+    cache = QuoteCache(ttl=60)
+    calls = []
+    release = threading.Event()
+
+    def fetch():
+        calls.append(1)
+        release.wait(5)
+        return {"price": 1}
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        futures = [executor.submit(cache.get_or_fetch, "005930", fetch) for _ in range(8)]
+        # 모든 호출자가 진행 중인 조회에 합류할 때까지 대기
+        deadline = time.monotonic() + 5
+        while cache.stats()["coalesced"] < 7 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        release.set()
+        results = [future.result() for future in futures]
+
+    assert len(calls) == 1
+    assert all(result is results[0] for result in results)
+    stats = cache.stats()
+    assert (stats["misses"], stats["coalesced"]) == (1, 7)
+    assert cache.get_or_fetch("005930", fetch) is results[0]
+    assert cache.stats()["hits"] == 1
+
+
+def test_errors_are_shared_but_not_cached():
+    cache = QuoteCache(ttl=60)
+
+    def fail():
+        raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError):
+        cache.get_or_fetch("key", fail)
+    assert cache.get_or_fetch("key", lambda: 1) == 1
+
+
+def test_ttl_and_lru_eviction():
+    cache = QuoteCache(ttl=0.05, max_size=2)
+    for key in ("a", "b", "c"):
+        cache.get_or_fetch(key, lambda: key)
+    assert cache.stats()["evictions"] == 1 and cache.stats()["size"] == 2
+    time.sleep(0.06)
+    assert cache.get_or_fetch("b", lambda: "fresh") == "fresh"
+
+
+def test_async_callers_share_one_fetch():
+    cache = QuoteCache(ttl=60)
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return {"price": 1}
+
+    async def main():
+        return await asyncio.gather(*(cache.aget_or_fetch("005930", fetch) for _ in range(5)))
+
+    results = asyncio.run(main())
+    assert len(calls) == 1
+    assert all(result is results[0] for result in results)
+    assert cache.stats()["coalesced"] == 4
+
+
+def test_async_leader_cancellation_does_not_cancel_waiters():
+    cache = QuoteCache(ttl=60)
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return len(calls)
+
+    async def main():
+        leader = asyncio.ensure_future(cache.aget_or_fetch("005930", fetch))
+        await asyncio.sleep(0)
+        waiters = [asyncio.ensure_future(cache.aget_or_fetch("005930", fetch)) for _ in range(3)]
+        await asyncio.sleep(0.01)
+        leader.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await leader
+        return await asyncio.gather(*waiters)
+
+    # 대기 중이던 코루틴 중 하나가 이어서 조회하고 나머지는 그 결과를 공유
+    assert asyncio.run(main()) == [2, 2, 2]
+    assert len(calls) == 2
+
+
+def test_client_quote_cache_coalesces_requests(make_client, server):
+    dbfi = make_client(quote_cache=QuoteCache(ttl=60))
+    result = dbfi.get_stock_prices(region="domestic", codes=["005930"] * 3 + ["000660"])
+    assert not result["errors"]
+    dbfi.get_stock_price(region="domestic", stock_code="005930")
+    assert server.stats()["requests"][PRICE_ENDPOINT] == 2
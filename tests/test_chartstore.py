@@ -0,0 +1,100 @@
+import sqlite3
+from datetime import date
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+import pydbfi.chartstore as chartstore  # noqa: E402
+from pydbfi import ChartStore  # noqa: E402
+from pydbfi.chartstore import merge_ranges  # noqa: E402
+
+DAILY_CHART = "/api/v1/quote/kr-chart/day"
+OVERSEAS_MINUTE_CHART = "/api/v1/quote/overseas-stock/chart/min"
+
+
+def _requests(server, endpoint):
+    return server.stats()["requests"].get(endpoint, 0)
+
+
+@pytest.fixture
+def store(dbfi, tmp_path):
+    return ChartStore(dbfi, path=str(tmp_path / "charts.sqlite3"))
+
+
+def test_merge_ranges():
+    ranges = [(date(2024, 1, 10), date(2024, 1, 12)), (date(2024, 1, 1), date(2024, 1, 5)), (date(2024, 1, 6), date(2024, 1, 8))]
+    assert merge_ranges(ranges) == [(date(2024, 1, 1), date(2024, 1, 8)), (date(2024, 1, 10), date(2024, 1, 12))]
+
+
+def test_update_fetches_only_missing_ranges(store, server):
+    first = store.update("domestic", "005930", "daily", "20240101", "20240131")
+    assert first["ranges"] == [("20240101", "20240131")]
+    assert first["bars"] == 23  # 2024년 1월 평일
+    assert store.coverage("domestic", "005930", "daily") == [("20240101", "20240131")]
+
+    requests = _requests(server, DAILY_CHART)
+    again = store.update("domestic", "005930", "daily", "20240101", "20240131")
+    assert again == {"ranges": [], "pages": 0, "bars": 0}
+    assert _requests(server, DAILY_CHART) == requests
+
+
+def test_gap_detection_between_covered_ranges(store):
+    store.update("domestic", "005930", "daily", "20240101", "20240110")
+    store.update("domestic", "005930", "daily", "20240120", "20240131")
+    assert store.missing_ranges("domestic", "005930", "daily", "20231225", "20240205") == [
+        ("20231225", "20231231"),
+        ("20240111", "20240119"),
+        ("20240201", "20240205"),
+    ]
+
+    result = store.update("domestic", "005930", "daily", "20240101", "20240131")
+    assert result["ranges"] == [("20240111", "20240119")]
+    assert store.coverage("domestic", "005930", "daily") == [("20240101", "20240131")]
+    bars = store.load("domestic", "005930", "daily", "20240101", "20240131")
+    assert len(bars) == 23
+    assert np.all(np.diff(bars.timestamp) > 0)
+
+
+def test_start_date_defaults_to_first_coverage(store):
+    with pytest.raises(ValueError):
+        store.update("domestic", "005930", "daily")
+    store.update("domestic", "005930", "daily", "20240101", "20240131")
+    assert store.update("domestic", "005930", "daily", end_date="20240131")["ranges"] == []
+
+
+def test_domestic_minute_update(store):
+    result = store.update("domestic", "005930", "minute", "20240105", "20240107", time_interval="60")
+    assert result["ranges"] == [("20240105", "20240107")]
+    bars = store.load("domestic", "005930", "minute", "20240105", "20240107", time_interval="60")
+    assert len(bars) == result["bars"] > 0
+    assert set(bars.datetime.astype("datetime64[D]").astype(str)) == {"2024-01-05"}
+
+
+def test_overseas_minute_update(store, server):
+    result = store.update("overseas", "AAPL", "minute", "20240104", "20240105", time_interval="60")
+    assert result["ranges"] == [("20240104", "20240105")]
+    # 거래일마다 시작일/종료일을 지정해 조회
+    assert _requests(server, OVERSEAS_MINUTE_CHART) == result["pages"] >= 2
+    bars = store.load("overseas", "AAPL", "minute", "20240104", "20240105", time_interval="60")
+    assert len(bars) == result["bars"] > 0
+    assert bars.tz == "America/New_York"
+    assert set(bars.datetime.astype("datetime64[D]").astype(str)) == {"2024-01-04", "2024-01-05"}
+
+
+def test_closes_every_connection(store, monkeypatch):
+    opened = []
+    connect = sqlite3.connect
+
+    def tracking_connect(*args, **kwargs):
+        conn = connect(*args, **kwargs)
+        opened.append(conn)
+        return conn
+
+    monkeypatch.setattr(chartstore.sqlite3, "connect", tracking_connect)
+    store.get_bars("domestic", "005930", "daily", "20240101", "20240131")
+    store.delete("domestic", "005930")
+    assert opened
+    for conn in opened:
+        with pytest.raises(sqlite3.ProgrammingError):
+            conn.execute("SELECT 1")
@@ -0,0 +1,151 @@
+from datetime import datetime, timezone
+
+import pytest
+
+pa = pytest.importorskip("pyarrow")
+pq = pytest.importorskip("pyarrow.parquet")
+
+from pydbfi.export import (  # noqa: E402
+    DAILY_TRADE_REPORT_COLUMNS,
+    DOMESTIC_BALANCE_COLUMNS,
+    DOMESTIC_TRANSACTION_COLUMNS,
+    OVERSEAS_TRANSACTION_COLUMNS,
+    chart_schema,
+    export_balance,
+    export_chart,
+    export_daily_trade_report,
+    export_transaction_history,
+    iter_row_batches,
+    rows_schema,
+)
+
+KR_TRANSACTIONS = "/api/v1/trading/kr-stock/inquiry/transaction-history"
+KR_DAILY_REPORT = "/api/v1/trading/kr-stock/inquiry/daliy-trade-report"
+US_TRANSACTIONS = "/api/v1/trading/overseas-stock/inquiry/transaction-history"
+
+
+def _table(pages, columns=DOMESTIC_TRANSACTION_COLUMNS, out_key="Out1", **kwargs):
+    return pa.Table.from_batches(list(iter_row_batches(pages, columns, out_key, **kwargs)))
+
+
+def test_schema_is_stable_with_missing_and_empty_fields():
+    pages = [
+        {"Out1": [{"OrdNo": 1, "IsuNo": "A005930", "OrdQty": 10, "ExecPrc": 70000.0}]},
+        # 필드 누락, 빈 문자열, 문자열 숫자가 섞인 페이지
+        {"Out1": [{"OrdNo": "2", "OrdQty": "", "ExecPrc": "70100.5"}, {"OrdNo": None, "OrdQty": "12.0"}]},
+        {"Out1": []},
+        {"Out1": {"OrdNo": "4", "OrdQty": 3}},  # 단일 행 dict
+    ]
+    batches = list(iter_row_batches(pages, DOMESTIC_TRANSACTION_COLUMNS, "Out1"))
+    expected = rows_schema(DOMESTIC_TRANSACTION_COLUMNS)
+    assert len(batches) == 3
+    assert all(batch.schema == expected for batch in batches)
+
+    table = pa.Table.from_batches(batches)
+    assert table.column("order_no").to_pylist() == [1, 2, None, 4]
+    # "12.0" 같은 정수 문자열은 float을 거쳐 int로 변환
+    assert table.column("order_qty").to_pylist() == [10, None, 12, 3]
+    assert table.column("exec_price").to_pylist() == [70000.0, 70100.5, None, None]
+    assert table.column("symbol").to_pylist() == ["A005930", None, None, None]
+    assert table.column("name").null_count == 4
+
+
+def test_invalid_numbers_raise():
+    with pytest.raises(pa.ArrowInvalid):
+        _table([{"Out1": [{"OrdQty": "abc"}]}])
+
+
+def test_timestamp_column_uses_format_prefix():
+    pages = [{"Out": [{"AstkExecDttm": "20240102220500123"}, {"AstkExecDttm": ""}, {}]}]
+    table = _table(pages, OVERSEAS_TRANSACTION_COLUMNS, "Out", select=["executed_at"])
+    assert table.schema.field("executed_at").type == pa.timestamp("ms")
+    assert table.column("executed_at").to_pylist() == [datetime(2024, 1, 2, 22, 5), None, None]
+
+
+def test_column_projection_and_unknown_column():
+    table = _table([{"Out1": [{"OrdNo": 1, "ExecAmt": 5.0}]}], select=["exec_amount", "order_no"])
+    assert table.schema.names == ["exec_amount", "order_no"]
+    with pytest.raises(ValueError):
+        _table([{"Out1": [{"OrdNo": 1}]}], select=["missing"])
+
+
+def test_chart_round_trip_with_compression(dbfi, tmp_path):
+    kwargs = dict(period="daily", start_date="20240101", end_date="20240630")
+    for compression in ("zstd", "snappy", None):
+        path = str(tmp_path / f"chart-{compression}.parquet")
+        written = export_chart(dbfi, path, "domestic", "005930", compression=compression, **kwargs)
+        metadata = pq.ParquetFile(path).metadata
+        # 연속 조회 페이지마다 row group 하나
+        assert written == 60 and metadata.num_rows == 60 and metadata.num_row_groups == 3
+        codec = metadata.row_group(0).column(0).compression
+        assert codec == (compression or "uncompressed").upper()
+        table = pq.read_table(path)
+        assert table.schema == chart_schema("Asia/Seoul")
+        assert set(table.column("symbol").to_pylist()) == {"005930"}
+
+    expected = export_chart(dbfi, None, "domestic", "005930", **kwargs)
+    assert pq.read_table(path).equals(expected)
+    bars = dbfi.get_chart_bars(region="domestic", stock_code="005930", **kwargs)
+    assert sorted(expected.column("close").to_pylist()) == sorted(bars.close.tolist())
+
+
+def test_chart_projection(dbfi):
+    table = export_chart(
+        dbfi, None, "overseas", "AAPL", columns=["timestamp", "close"], start_date="20240101", end_date="20240630"
+    )
+    assert table.schema == chart_schema("America/New_York", ["timestamp", "close"])
+    assert table.num_rows == 60
+
+
+def test_domestic_transaction_history(dbfi, server, tmp_path):
+    path = str(tmp_path / "trades.parquet")
+    rows = export_transaction_history(dbfi, path, "domestic")
+    assert rows == 60
+    assert pq.ParquetFile(path).metadata.num_row_groups == server.stats()["requests"][KR_TRANSACTIONS] == 3
+    table = pq.read_table(path)
+    assert table.schema == rows_schema(DOMESTIC_TRANSACTION_COLUMNS)
+    assert table.column("order_no").to_pylist() == list(range(1, 61))
+    assert table.column("exec_qty").null_count == 0
+
+
+def test_overseas_transaction_history_projection(dbfi, server):
+    columns = ["executed_at", "symbol", "won_amount"]
+    table = export_transaction_history(dbfi, None, "overseas", columns=columns, start_date="20240102", end_date="20240102")
+    assert table.schema.names == columns
+    assert table.num_rows == 60
+    assert table.column("executed_at").to_pylist()[0] == datetime(2024, 1, 2, 22, 0)
+    assert table.column("won_amount").type == pa.float64()
+    assert server.stats()["requests"][US_TRANSACTIONS] == 3
+
+
+def test_daily_trade_report(dbfi, server):
+    table = export_daily_trade_report(dbfi, None, "20240102", columns=["order_no", "symbol", "exec_amount"])
+    schema = rows_schema(DAILY_TRADE_REPORT_COLUMNS)
+    assert table.schema == pa.schema([schema.field(name) for name in ("order_no", "symbol", "exec_amount")])
+    assert table.num_rows == 60
+    assert server.stats()["requests"][KR_DAILY_REPORT] == 3
+
+
+def test_balance_snapshot_column(dbfi, tmp_path):
+    snapshot = datetime(2024, 1, 2, 15, 40, 30, 123456, tzinfo=timezone.utc)
+    table = export_balance(dbfi, None, "domestic", snapshot_at=snapshot)
+    assert table.schema.names == [column.name for column in DOMESTIC_BALANCE_COLUMNS] + ["snapshot_at"]
+    assert table.schema.field("snapshot_at").type == pa.timestamp("ms", tz="UTC")
+    assert set(table.column("snapshot_at").to_pylist()) == {snapshot.replace(microsecond=0)}
+
+    # snapshot_at만 선택해도 상수 열 유지
+    projected = export_balance(dbfi, None, "overseas", columns=["symbol", "snapshot_at"], snapshot_at=snapshot)
+    assert projected.schema.names == ["symbol", "snapshot_at"]
+    assert projected.num_rows == 60
+    assert projected.column("snapshot_at").null_count == 0
+
+    path = str(tmp_path / "balance.parquet")
+    assert export_balance(dbfi, path, "domestic", snapshot_at=snapshot, compression="gzip") == table.num_rows
+    assert pq.read_table(path).equals(table)
+
+
+def test_empty_result_keeps_schema(make_client, server):
+    server.rows_per_endpoint[KR_TRANSACTIONS] = 0
+    table = export_transaction_history(make_client(), None, "domestic")
+    assert table.num_rows == 0
+    assert table.schema == rows_schema(DOMESTIC_TRANSACTION_COLUMNS)
@@ -0,0 +1,34 @@
+import time
+
+from pydbfi.mockserver import DOMESTIC_STOCKS
+from pydbfi.ratelimit import DEFAULT_RATE_LIMITS, RateLimiter
+
+PRICE_ENDPOINT = "/api/v1/quote/kr-stock/inquiry/price"
+
+
+def test_fan_out_returns_results_per_code(dbfi):
+    codes = [code for code, _ in DOMESTIC_STOCKS]
+    result = dbfi.get_stock_prices(region="domestic", codes=codes + codes[:3])
+    assert sorted(result["results"]) == sorted(codes)
+    assert result["errors"] == {}
+
+
+def test_fan_out_stays_within_default_quote_limit(make_client, server):
+    rate = DEFAULT_RATE_LIMITS["quote"]
+    # 모의 서버는 1초 구간 내 요청 수로 거절 (버킷 burst 1개만큼 여유)
+    server.rate_limits["quote"] = rate + 1
+    limiter = RateLimiter()
+    dbfi = make_client(rate_limiter=limiter)
+    codes = [f"{900000 + i:06d}" for i in range(rate + 5)]
+
+    started = time.monotonic()
+    result = dbfi.get_stock_prices(region="domestic", codes=codes, max_workers=8)
+    elapsed = time.monotonic() - started
+
+    assert result["errors"] == {}
+    assert len(result["results"]) == len(codes)
+    stats = server.stats()
+    assert stats["throttled"] == 0
+    assert stats["requests"][PRICE_ENDPOINT] == len(codes)
+    assert limiter.stats()["quote"]["count"] == len(codes)
+    assert elapsed >= (len(codes) - 1) / rate * 0.9
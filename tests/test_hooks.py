@@ -0,0 +1,105 @@
+import asyncio
+import logging
+
+import pytest
+
+from pydbfi import Hooks
+from pydbfi.mockserver import MockDBFIServer
+from pydbfi.pacing import ContinuationPacer
+from pydbfi.ratelimit import RateLimiter
+
+
+class FailingOnceLimiter(RateLimiter):
+    """첫 요청의 유량 제한 대기에서 예외 발생"""
+
+    def __init__(self):
+        super().__init__({})
+        self.failed = False
+
+    def reserve(self, key):
+        if not self.failed:
+            self.failed = True
+            raise RuntimeError("limiter unavailable")
+        return super().reserve(key)
+
+
+def _recording_hooks():
+    events = []
+    hooks = Hooks().register(
+        before=lambda ctx: events.append(("before", ctx)),
+        after=lambda ctx, result: events.append(("after", ctx)),
+        error=lambda ctx, exc: events.append(("error", ctx)),
+    )
+    return hooks, events
+
+
+def _assert_balanced(events):
+    started = [ctx for kind, ctx in events if kind == "before"]
+    finished = [ctx for kind, ctx in events if kind != "before"]
+    assert sorted(map(id, started)) == sorted(map(id, finished))
+
+
+def test_call_and_request_hooks(make_client):
+    hooks, events = _recording_hooks()
+    client = make_client(hooks=hooks)
+    client.get_daily_chart(region="domestic", stock_code="005930", start_date="20240101", end_date="20240630")
+    kinds = [(kind, ctx.kind) for kind, ctx in events]
+    assert kinds[0] == ("before", "call") and kinds[-1] == ("after", "call")
+    assert kinds.count(("after", "request")) == 3
+    _assert_balanced(events)
+
+
+def test_error_before_transport_ends_request_span(make_client, monkeypatch):
+    hooks, events = _recording_hooks()
+    client = make_client(hooks=hooks, rate_limiter=FailingOnceLimiter())
+    # tenacity 재시도 대기 생략
+    monkeypatch.setattr(client.domestic._get_quote_service()._request_page.retry, "sleep", lambda seconds: None)
+
+    client.get_stock_price(region="domestic", stock_code="005930")
+
+    requests = [(kind, ctx) for kind, ctx in events if ctx.kind == "request"]
+    assert [kind for kind, _ in requests] == ["before", "error", "before", "after"]
+    assert requests[0][1].timings["total"] == 0.0
+    _assert_balanced(events)
+
+
+def test_token_failure_ends_request_span(make_client, monkeypatch):
+    hooks, events = _recording_hooks()
+    client = make_client(hooks=hooks)
+    service = client.domestic._get_quote_service()
+    monkeypatch.setattr(service._request_page.retry, "sleep", lambda seconds: None)
+    monkeypatch.setattr(client.auth, "get_auth_header", lambda: (_ for _ in ()).throw(RuntimeError("token endpoint down")))
+
+    with pytest.raises(RuntimeError):
+        client.get_stock_price(region="domestic", stock_code="005930")
+
+    assert [kind for kind, ctx in events if ctx.kind == "request"] == ["before", "error"] * 3
+    assert events[-1][0] == "error" and events[-1][1].kind == "call"
+    _assert_balanced(events)
+
+
+def test_async_error_before_transport_ends_request_span():
+    pytest.importorskip("httpx")
+    from pydbfi.aio import AsyncDBFI
+
+    async def main(url):
+        hooks, events = _recording_hooks()
+        client = AsyncDBFI(
+            app_key="test",
+            app_secret_key="test",
+            log_level=logging.WARNING,
+            base_url=url,
+            rate_limiter=FailingOnceLimiter(),
+            pacer=ContinuationPacer(initial_interval=0, min_interval=0),
+            hooks=hooks,
+        )
+        try:
+            await client.get_stock_price(region="domestic", stock_code="005930")
+        finally:
+            await client.close()
+        return events
+
+    with MockDBFIServer() as server:
+        events = asyncio.run(main(server.url))
+    assert [kind for kind, ctx in events if ctx.kind == "request"] == ["before", "error", "before", "after"]
+    _assert_balanced(events)
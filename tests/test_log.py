@@ -0,0 +1,108 @@
+import logging
+
+import pytest
+
+from pydbfi import Hooks, RequestLog
+from pydbfi.hooks import RequestContext
+from pydbfi.log import RedactingFilter, redact, redact_text
+
+
+def _request_ctx(duration: float, status_code: int = 200) -> RequestContext:
+    ctx = RequestContext("request", method_name="get_stock_price", region="domestic", endpoint="/x", http_method="POST")
+    ctx.duration = duration
+    ctx.status_code = status_code
+    return ctx
+
+
+def _dump(record: logging.LogRecord) -> str:
+    return f"{record.getMessage()} {record.__dict__}"
+
+
+def test_debug_logging_never_contains_bearer_token(make_client, server, caplog):
+    dbfi = make_client()
+    tokens = [dbfi.auth.token]
+    with caplog.at_level(logging.DEBUG, logger="pydbfi"):
+        dbfi.domestic.get_stock_price(stock_code="005930")
+        # 토큰 만료 후 재발급된 토큰도 기록되지 않아야 함
+        server.expire_tokens()
+        dbfi.domestic.get_daily_chart(stock_code="005930", start_date="20240101", end_date="20240630")
+    tokens.append(dbfi.auth.token)
+
+    assert tokens[0] != tokens[1]
+    debug = [record for record in caplog.records if record.levelno == logging.DEBUG]
+    assert any("Bearer ***" in record.getMessage() for record in debug)
+    for record in caplog.records:
+        for token in tokens:
+            assert token not in _dump(record)
+
+
+def test_redact_helpers():
+    headers = {"Authorization": "Bearer abc.def", "appkey": "k", "appsecretkey": "s", "cont_yn": "N"}
+    assert redact(headers) == {"Authorization": "Bearer ***", "appkey": "***", "appsecretkey": "***", "cont_yn": "N"}
+    assert redact({"authorization": "raw"}) == {"authorization": "***"}
+    assert redact(None) == {}
+    assert redact_text("headers={'Authorization': 'Bearer abc.def-1'}") == "headers={'Authorization': 'Bearer ***'}"
+
+    record = logging.LogRecord("pydbfi", logging.INFO, __file__, 1, "token %s", ("bearer xyz",), None)
+    assert RedactingFilter().filter(record)
+    assert record.getMessage() == "token bearer ***"
+
+
+@pytest.mark.parametrize(
+    "sample_rate, slow_threshold, duration, expected",
+    [
+        (1.0, None, 0.01, logging.INFO),  # 샘플링된 요청
+        (0.0, None, 5.0, None),  # 샘플링되지 않고 느린 요청 기준도 없음
+        (0.0, 0.5, 0.1, None),  # 기준보다 빠른 요청
+        (0.0, 0.5, 0.6, logging.WARNING),  # 느린 요청은 샘플링과 무관하게 WARNING
+        (1.0, 0.5, 0.6, logging.WARNING),
+    ],
+)
+def test_request_log_sampling_and_slow_threshold(caplog, sample_rate, slow_threshold, duration, expected):
+    request_log = RequestLog(sample_rate=sample_rate, slow_threshold=slow_threshold)
+    with caplog.at_level(logging.DEBUG, logger="pydbfi.requests"):
+        request_log.after(_request_ctx(duration), None)
+    levels = [record.levelno for record in caplog.records]
+    assert levels == ([] if expected is None else [expected])
+    if expected is not None:
+        record = caplog.records[0]
+        assert record.endpoint == "/x" and record.status_code == 200
+        assert record.duration_ms == round(duration * 1000, 3)
+
+
+def test_request_log_sample_rate_is_a_ratio(caplog, monkeypatch):
+    draws = iter([0.05, 0.5, 0.09, 0.95])
+    monkeypatch.setattr("pydbfi.log.random.random", lambda: next(draws))
+    request_log = RequestLog(sample_rate=0.1)
+    with caplog.at_level(logging.INFO, logger="pydbfi.requests"):
+        for _ in range(4):
+            request_log.after(_request_ctx(0.01), None)
+    assert len(caplog.records) == 2
+
+
+def test_request_log_ignores_calls_and_logs_errors(caplog):
+    request_log = RequestLog(sample_rate=1.0)
+    call = RequestContext("call", method_name="get_stock_price")
+    call.duration = 0.01
+    with caplog.at_level(logging.INFO, logger="pydbfi.requests"):
+        request_log.after(call, None)
+        request_log.error(_request_ctx(0.2, status_code=None), TimeoutError())
+    assert len(caplog.records) == 1
+    record = caplog.records[0]
+    assert record.levelno == logging.WARNING and record.error == "TimeoutError"
+
+
+def test_request_log_attached_to_client(make_client, caplog):
+    hooks = Hooks()
+    request_log = RequestLog(sample_rate=1.0)
+    request_log.attach(hooks)
+    dbfi = make_client(hooks=hooks)
+    with caplog.at_level(logging.INFO, logger="pydbfi.requests"):
+        dbfi.domestic.get_daily_chart(stock_code="005930", start_date="20240101", end_date="20240630")
+    assert [record.continuation for record in caplog.records] == [0, 1, 2]
+
+    request_log.detach(hooks)
+    caplog.clear()
+    with caplog.at_level(logging.INFO, logger="pydbfi.requests"):
+        dbfi.domestic.get_stock_price(stock_code="005930")
+    assert caplog.records == []
@@ -0,0 +1,86 @@
+import urllib.error
+import urllib.request
+
+import pytest
+
+from pydbfi import MetricsRegistry, serve_prometheus
+from pydbfi.mockserver import OK_CODE, TOKEN_EXPIRED_CODE
+
+PRICE_ENDPOINT = "/api/v1/quote/kr-stock/inquiry/price"
+DAILY_CHART = "/api/v1/quote/kr-chart/day"
+
+
+def _samples(text: str, name: str):
+    return [line for line in text.splitlines() if line.startswith(name + "{")]
+
+
+def test_histogram_buckets_are_cumulative():
+    metrics = MetricsRegistry(buckets=(0.1, 0.5, 1.0))
+    for seconds in (0.05, 0.1, 0.3, 0.7, 2.0):
+        metrics.observe_response("/x", 200, seconds)
+    latency = metrics.snapshot()["endpoints"]["/x"]["latency"]["total"]
+    # 상한과 같은 값은 해당 구간에 포함 (le)
+    assert latency["buckets"] == {0.1: 2, 0.5: 3, 1.0: 4}
+    assert latency["count"] == 5 and latency["max"] == 2.0
+    assert latency["sum"] == pytest.approx(3.15)
+    assert 0.1 < latency["p50"] <= 0.5
+    assert latency["p99"] == pytest.approx(2.0, rel=0.1)
+
+    text = metrics.to_prometheus()
+    assert _samples(text, "pydbfi_request_duration_seconds_bucket") == [
+        'pydbfi_request_duration_seconds_bucket{endpoint="/x",phase="total",le="0.1"} 2',
+        'pydbfi_request_duration_seconds_bucket{endpoint="/x",phase="total",le="0.5"} 3',
+        'pydbfi_request_duration_seconds_bucket{endpoint="/x",phase="total",le="1.0"} 4',
+        'pydbfi_request_duration_seconds_bucket{endpoint="/x",phase="total",le="+Inf"} 5',
+    ]
+    assert 'pydbfi_request_duration_seconds_count{endpoint="/x",phase="total"} 5' in text
+
+
+def test_prometheus_label_values_are_escaped():
+    metrics = MetricsRegistry()
+    metrics.observe_error('/a"b\\c\nd', TimeoutError(), 0.1)
+    text = metrics.to_prometheus(prefix="app")
+    assert 'app_requests_total{endpoint="/a\\"b\\\\c\\nd",status="error",error="TimeoutError"} 1' in text
+    # 이스케이프 후 한 표본은 한 줄
+    assert len(_samples(text, "app_requests_total")) == 1
+    assert "# TYPE app_requests_total counter" in text
+
+
+def test_rsp_cd_counts_from_client_requests(make_client, server):
+    metrics = MetricsRegistry()
+    dbfi = make_client(metrics=metrics)
+    dbfi.domestic.get_stock_price(stock_code="005930")
+    server.expire_tokens()
+    dbfi.domestic.get_stock_price(stock_code="005930")
+    dbfi.domestic.get_daily_chart(stock_code="005930", start_date="20240101", end_date="20240630")
+
+    endpoints = metrics.snapshot()["endpoints"]
+    price = endpoints[PRICE_ENDPOINT]
+    # 토큰 만료 거절은 오류 응답에서, 정상 응답은 페이지 파싱 시 한 번씩 기록
+    assert price["rsp_cd"] == {OK_CODE: 2, TOKEN_EXPIRED_CODE: 1}
+    assert price["requests"] == 3
+    assert price["retries"] == {"token_expired": 1}
+    chart = endpoints[DAILY_CHART]
+    assert chart["rsp_cd"] == {OK_CODE: 3}
+    assert chart["pages"] == 3 and chart["continuation_pages"] == 2
+
+    text = metrics.to_prometheus()
+    assert f'pydbfi_responses_total{{endpoint="{PRICE_ENDPOINT}",rsp_cd="{TOKEN_EXPIRED_CODE}"}} 1' in text
+    assert f'pydbfi_responses_total{{endpoint="{PRICE_ENDPOINT}",rsp_cd="{OK_CODE}"}} 2' in text
+    assert f'pydbfi_retries_total{{endpoint="{PRICE_ENDPOINT}",reason="token_expired"}} 1' in text
+
+
+def test_serve_prometheus_exposes_metrics():
+    metrics = MetricsRegistry()
+    metrics.observe_page("/x", OK_CODE, continuation=False)
+    server = serve_prometheus(metrics, port=0)
+    try:
+        base = f"http://127.0.0.1:{server.server_address[1]}"
+        with urllib.request.urlopen(f"{base}/metrics", timeout=5) as response:
+            assert response.headers["Content-Type"].startswith("text/plain; version=0.0.4")
+            assert 'pydbfi_pages_total{endpoint="/x"} 1' in response.read().decode("utf-8")
+        with pytest.raises(urllib.error.HTTPError):
+            urllib.request.urlopen(f"{base}/other", timeout=5)
+    finally:
+        server.shutdown()
+        server.server_close()
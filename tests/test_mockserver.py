@@ -0,0 +1,25 @@
+from datetime import datetime
+
+import pytest
+
+from pydbfi.mockserver import MockDBFIServer
+
+
+@pytest.mark.parametrize("end_date", ["20240105", "20240106", "20240107", "20240108", "20240110"])
+def test_daily_rows_are_unique_weekdays(end_date):
+    server = MockDBFIServer(total_rows=200)
+    _, row = server._chart("day", False)({"InputIscd1": "005930", "InputDate2": end_date})
+    dates = [row(i)["Date"] for i in range(200)]
+    assert len(set(dates)) == 200
+    assert dates == sorted(dates, reverse=True)
+    assert all(datetime.strptime(date, "%Y%m%d").weekday() < 5 for date in dates)
+    # 인접 행은 다음 평일 (주말 외 건너뛴 날짜 없음)
+    gaps = {(datetime.strptime(a, "%Y%m%d") - datetime.strptime(b, "%Y%m%d")).days for a, b in zip(dates, dates[1:])}
+    assert gaps <= {1, 3}
+    assert dates[0] <= end_date
+
+
+def test_daily_chart_has_no_duplicate_bars(dbfi, server):
+    server.total_rows = 200
+    bars = dbfi.get_chart_bars(region="domestic", period="daily", stock_code="005930", start_date="20230101", end_date="20240107")
+    assert len(bars) == 200
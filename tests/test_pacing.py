@@ -0,0 +1,74 @@
+import pytest
+
+from pydbfi.pacing import ContinuationPacer
+from pydbfi.ratelimit import RateLimiter
+
+ENDPOINT = "/api/v1/quote/kr-chart/min"
+
+
+def test_speedup_down_to_min_interval():
+    pacer = ContinuationPacer(initial_interval=1.0, min_interval=0.2, speedup=0.5)
+    pacer.on_success(ENDPOINT)
+    assert pacer.interval(ENDPOINT) == pytest.approx(0.5)
+    for _ in range(10):
+        pacer.on_success(ENDPOINT)
+    assert pacer.interval(ENDPOINT) == pytest.approx(0.2)
+
+
+def test_backoff_sets_floor():
+    pacer = ContinuationPacer(initial_interval=0.4, min_interval=0.1, speedup=0.5, backoff=2.0, floor_decay_pages=None)
+    pacer.on_throttle(ENDPOINT)
+    assert pacer.interval(ENDPOINT) == pytest.approx(0.8)
+    floor = pacer.stats()[ENDPOINT]["floor"]
+    assert floor == pytest.approx(0.44)
+    for _ in range(50):
+        pacer.on_success(ENDPOINT)
+    # 하한 감소를 끄면 거절된 간격 아래로 내려가지 않음
+    assert pacer.interval(ENDPOINT) == pytest.approx(floor)
+
+
+def test_floor_decays_after_clean_pages():
+    pacer = ContinuationPacer(initial_interval=0.4, min_interval=0.1, speedup=0.5, floor_decay_pages=5)
+    pacer.on_throttle(ENDPOINT)
+    for _ in range(4):
+        pacer.on_success(ENDPOINT)
+    assert pacer.stats()[ENDPOINT]["floor"] == pytest.approx(0.44)
+    pacer.on_success(ENDPOINT)
+    assert pacer.stats()[ENDPOINT]["floor"] == pytest.approx(0.22)
+    for _ in range(20):
+        pacer.on_success(ENDPOINT)
+    assert pacer.stats()[ENDPOINT]["floor"] == 0.0
+    assert pacer.interval(ENDPOINT) == pytest.approx(0.1)
+
+
+def test_throttle_resets_clean_page_count():
+    pacer = ContinuationPacer(initial_interval=0.4, min_interval=0.1, floor_decay_pages=5)
+    pacer.on_throttle(ENDPOINT)
+    for _ in range(4):
+        pacer.on_success(ENDPOINT)
+    pacer.on_throttle(ENDPOINT)
+    floor = pacer.stats()[ENDPOINT]["floor"]
+    for _ in range(4):
+        pacer.on_success(ENDPOINT)
+    assert pacer.stats()[ENDPOINT]["floor"] == floor
+
+
+def test_zero_interval_when_key_is_rate_limited():
+    pacer = ContinuationPacer(initial_interval=1.0, min_interval=0.5, speedup=0.1, rate_limiter=RateLimiter({"chart": 5}))
+    for _ in range(5):
+        pacer.on_success(ENDPOINT, "chart")
+    # RateLimiter가 간격을 보장하는 분류는 최소 간격 없이 0까지 줄어듦
+    assert pacer.interval(ENDPOINT) < 0.5
+    assert pacer.delay(ENDPOINT) == pytest.approx(pacer.interval(ENDPOINT))
+    other = "/api/v1/quote/kr-chart/day"
+    for _ in range(5):
+        pacer.on_success(other, "history")
+    assert pacer.interval(other) == pytest.approx(0.5)
+
+
+def test_non_adaptive_keeps_interval():
+    pacer = ContinuationPacer(initial_interval=0.3, adaptive=False)
+    pacer.on_success(ENDPOINT)
+    pacer.on_throttle(ENDPOINT)
+    assert pacer.interval(ENDPOINT) == 0.3
+    assert pacer.stats()[ENDPOINT]["throttles"] == 1
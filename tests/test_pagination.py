@@ -0,0 +1,41 @@
+import types
+
+from pydbfi import iter_rows
+
+DAILY_CHART = "/api/v1/quote/kr-chart/day"
+
+
+def test_collects_all_pages_by_default(dbfi):
+    pages = dbfi.domestic.get_daily_chart(stock_code="005930", start_date="20240101", end_date="20240630")
+    assert isinstance(pages, list) and len(pages) == 3
+    assert sum(len(page["Out"]) for page in pages) == 60
+
+
+def test_stream_returns_generator(dbfi, server):
+    pages = dbfi.domestic.get_daily_chart(
+        stock_code="005930", start_date="20240101", end_date="20240630", stream=True
+    )
+    assert isinstance(pages, types.GeneratorType)
+    # 소비 전에는 요청하지 않음
+    assert DAILY_CHART not in server.stats()["requests"]
+    first = next(pages)
+    assert len(first["Out"]) == 20
+    assert server.stats()["requests"][DAILY_CHART] == 1
+    pages.close()
+
+
+def test_nested_streams_are_independent(dbfi):
+    outer = dbfi.iter_pages("domestic", "get_daily_chart", stock_code="005930", start_date="20240101", end_date="20240630")
+    seen = []
+    for page in outer:
+        # 스트리밍 도중의 일반 호출은 페이지를 모두 모은 list를 반환
+        inner = dbfi.overseas.get_daily_chart(stock_code="AAPL", start_date="20240101", end_date="20240630")
+        assert isinstance(inner, list) and len(inner) == 3
+        seen.append(page)
+    assert len(seen) == 3
+    assert len(list(iter_rows(seen, "Out"))) == 60
+
+
+def test_iter_pages_single_response(dbfi):
+    pages = list(dbfi.iter_pages("domestic", "get_stock_price", stock_code="005930"))
+    assert len(pages) == 1 and isinstance(pages[0], dict)
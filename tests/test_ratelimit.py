@@ -0,0 +1,101 @@
+import multiprocessing
+import os
+import time
+
+import pytest
+
+from pydbfi.ratelimit import RateLimiter, SQLiteRateLimitBackend
+
+RATE = 20
+
+
+def _acquire_many(path, count, start_at, queue):
+    limiter = RateLimiter({"order": RATE}, backend=SQLiteRateLimitBackend(path))
+    time.sleep(max(0.0, start_at - time.time()))
+    stamps = []
+    for _ in range(count):
+        limiter.acquire("order")
+        stamps.append(time.time())
+    limiter.close()
+    queue.put(stamps)
+
+
+def test_memory_backend_spaces_requests():
+    limiter = RateLimiter({"order": RATE})
+    started = time.monotonic()
+    for _ in range(6):
+        limiter.acquire("order")
+    assert time.monotonic() - started >= 5 / RATE * 0.9
+    assert limiter.stats()["order"]["count"] == 6
+
+
+def test_unlimited_key_does_not_wait():
+    limiter = RateLimiter({"order": RATE})
+    assert all(limiter.reserve("quote") == 0.0 for _ in range(100))
+    assert limiter.reserve(None) == 0.0
+
+
+def test_sqlite_backend_shared_between_instances(tmp_path):
+    path = str(tmp_path / "ratelimit.db")
+    first, second = SQLiteRateLimitBackend(path), SQLiteRateLimitBackend(path)
+    try:
+        assert first.reserve("order", RATE, 1) == 0.0
+        # 다른 커넥션에서 예약한 토큰이 반영되어 대기 시간이 생김
+        assert second.reserve("order", RATE, 1) > 0.0
+        # namespace가 다르면 별도 버킷
+        assert SQLiteRateLimitBackend(path, namespace="other").reserve("order", RATE, 1) == 0.0
+    finally:
+        first.close()
+        second.close()
+
+
+def test_sqlite_backend_limits_across_processes(tmp_path):
+    path = str(tmp_path / "ratelimit.db")
+    SQLiteRateLimitBackend(path).close()  # 테이블 생성
+    context = multiprocessing.get_context("spawn")
+    queue = context.Queue()
+    processes, per_process = 4, 6
+    # 프로세스 기동 시간과 무관하게 동시에 요청을 시작
+    start_at = time.time() + 1.5
+    workers = [
+        context.Process(target=_acquire_many, args=(path, per_process, start_at, queue)) for _ in range(processes)
+    ]
+    for worker in workers:
+        worker.start()
+    stamps = sorted(stamp for _ in workers for stamp in queue.get(timeout=30))
+    for worker in workers:
+        worker.join(timeout=10)
+        assert worker.exitcode == 0
+
+    total = processes * per_process
+    assert len(stamps) == total
+    # 프로세스 합계 기준으로 1/RATE 간격 (burst 1)
+    assert stamps[-1] - stamps[0] >= (total - 1) / RATE * 0.9
+    # 어느 1초 구간에도 RATE + burst개를 넘지 않음
+    for i in range(total - RATE - 1):
+        assert stamps[i + RATE + 1] - stamps[i] >= 1.0 * 0.9
+
+
+def _open_files(path):
+    fds = []
+    for fd in os.listdir("/proc/self/fd"):
+        try:
+            if os.readlink(f"/proc/self/fd/{fd}").startswith(path):
+                fds.append(fd)
+        except OSError:
+            pass
+    return fds
+
+
+@pytest.mark.skipif(not os.path.isdir("/proc/self/fd"), reason="/proc 필요")
+def test_sqlite_backend_close_releases_fan_out_connections(make_client, tmp_path):
+    path = str(tmp_path / "ratelimit.db")
+    limiter = RateLimiter({"quote": 1000}, backend=SQLiteRateLimitBackend(path))
+    dbfi = make_client(rate_limiter=limiter)
+    for _ in range(20):
+        result = dbfi.get_stock_prices(region="domestic", codes=["005930", "000660", "035420", "005380"])
+        assert result["errors"] == {}
+    # 워커 스레드 수와 무관하게 커넥션 하나만 유지
+    assert 0 < len(_open_files(path)) <= 3  # db, -wal, -shm
+    limiter.close()
+    assert _open_files(path) == []
@@ -0,0 +1,107 @@
+import numpy as np
+import pytest
+
+from pydbfi.bars import ChartBars, to_timestamps
+from pydbfi.resample import resample
+
+MINUTE_CHART = "/api/v1/quote/kr-chart/min"
+# 2024-01-03(수) 15:30부터 과거로 2024-01-02(화) 09:00까지의 1분봉
+TWO_DAYS = 391 + 1440
+
+
+def _ts(date, time=None):
+    return int(to_timestamps(np.array([date]), None if time is None else np.array([time]))[0])
+
+
+@pytest.fixture
+def minute(dbfi, server):
+    server.rows_per_endpoint[MINUTE_CHART] = TWO_DAYS
+    server.page_size = 500
+    return dbfi.get_chart_bars(region="domestic", period="minute", stock_code="005930", start_date="20240103")
+
+
+def _session_day(minute, date):
+    return minute.between(_ts(date, 90000), _ts(date, 153000) + 1)
+
+
+def test_minute_to_daily_includes_open_and_close_bars(dbfi, minute):
+    daily = minute.resample("daily")
+    server_daily = dbfi.get_chart_bars(
+        region="domestic", period="daily", stock_code="005930", start_date="20240102", end_date="20240103"
+    )
+    # 서버 일봉과 같은 거래일 (모의 서버는 기준일부터 과거 방향으로 고정 행 수를 반환)
+    server_days = server_daily.between(daily.timestamp[0], daily.timestamp[-1] + 1)
+    assert daily.timestamp.tolist() == server_days.timestamp.tolist() == [_ts(20240102), _ts(20240103)]
+    for i, date in enumerate((20240102, 20240103)):
+        day = _session_day(minute, date)
+        assert len(day) == 391  # 09:00~15:30
+        # 09:00 시가와 15:30 종가가 포함되어야 함
+        assert daily.open[i] == day.open[0]
+        assert daily.close[i] == day.close[-1]
+        assert daily.high[i] == day.high.max() and daily.low[i] == day.low.min()
+        assert daily.volume[i] == day.volume.sum()
+    # label과 무관하게 같은 일봉
+    assert resample(minute, "daily", label="left") == daily
+
+
+def test_daily_to_weekly_and_monthly_match_server_periods(dbfi):
+    kwargs = dict(region="domestic", stock_code="005930", start_date="20240101", end_date="20240628")
+    daily = dbfi.get_chart_bars(period="daily", **kwargs)
+    for rule, period in (("weekly", "weekly"), ("monthly", "monthly")):
+        resampled = daily.resample(rule)
+        server = dbfi.get_chart_bars(period=period, **kwargs)
+        # 서버 주/월봉 중 일봉 구간에 해당하는 기간과 같은 시각(월요일, 1일)
+        expected = server.between(resampled.timestamp[0], resampled.timestamp[-1] + 1)
+        assert resampled.timestamp.tolist() == expected.timestamp.tolist()
+        assert resampled.volume.sum() == daily.volume.sum()
+        first = daily.between(end=int(resampled.timestamp[1]))
+        assert resampled.open[0] == first.open[0] and resampled.close[0] == first.close[-1]
+
+
+def test_60min_right_label_ends_at_close(minute):
+    day = _session_day(minute, 20240103)
+    hourly = day.resample("60min")
+    stamps = [_ts(20240103, t) for t in (100000, 110000, 120000, 130000, 140000, 150000, 153000)]
+    assert hourly.timestamp.tolist() == stamps
+    # 09:00 봉은 첫 구간(09:00~10:00), 15:30 봉은 마지막 구간(15:00~15:30)에 포함
+    assert hourly.open[0] == day.open[0]
+    assert hourly.close[-1] == day.close[-1]
+    assert hourly.volume[0] == day.volume[:61].sum()
+    assert hourly.volume[-1] == day.volume[-30:].sum()
+    assert hourly.volume.sum() == day.volume.sum()
+
+
+def test_60min_left_label_keeps_close_bar(minute):
+    day = _session_day(minute, 20240103)
+    hourly = day.resample("60min", label="left")
+    stamps = [_ts(20240103, t) for t in (90000, 100000, 110000, 120000, 130000, 140000, 150000)]
+    assert hourly.timestamp.tolist() == stamps
+    assert hourly.open[0] == day.open[0]
+    # 15:00~15:30 (31개) 구간에 15:30 봉 포함
+    assert hourly.close[-1] == day.close[-1]
+    assert hourly.volume[-1] == day.volume[-31:].sum()
+    assert hourly.volume.sum() == day.volume.sum()
+
+
+def test_30min_left_label_folds_close_bar_into_last_bucket(minute):
+    day = _session_day(minute, 20240103)
+    bars = day.resample("30min", label="left")
+    assert bars.timestamp[-1] == _ts(20240103, 150000)
+    assert len(bars) == 13 and bars.volume.sum() == day.volume.sum()
+
+
+def test_out_of_session_bars_are_excluded(minute):
+    full = minute.resample("daily", session=None)
+    session = minute.resample("daily")
+    # 장외 봉은 정규장 일봉에서 제외
+    assert full.volume[0] > session.volume[0]
+    assert session.volume.sum() == sum(_session_day(minute, d).volume.sum() for d in (20240102, 20240103))
+
+
+def test_invalid_arguments():
+    bars = ChartBars.empty()
+    with pytest.raises(ValueError):
+        resample(bars, "2weeks")
+    with pytest.raises(ValueError):
+        resample(bars, "daily", label="center")
+    assert len(resample(bars, "5min")) == 0
@@ -0,0 +1,28 @@
+from pydbfi import QuoteCache, get_balance_domestic
+
+PRICE_ENDPOINT = "/api/v1/quote/kr-stock/inquiry/price"
+
+
+def _price_requests(server):
+    return server.stats()["requests"].get(PRICE_ENDPOINT, 0)
+
+
+def test_balance_domestic_fetches_each_holding_once(dbfi, server):
+    result = get_balance_domestic(dbfi)
+    stocks = list(result["stocks"].values())
+    assert stocks
+    assert all(stock["시세조회오류"] is None for stock in stocks)
+    assert all(isinstance(stock["전일대비등락율"], float) for stock in stocks)
+    assert _price_requests(server) == len({stock["종목코드"] for stock in stocks})
+
+
+def test_balance_domestic_reuses_client_quote_cache(make_client, server):
+    cached = make_client(quote_cache=QuoteCache(ttl=60))
+    get_balance_domestic(cached)
+    first = _price_requests(server)
+    get_balance_domestic(cached)
+    assert _price_requests(server) == first
+
+    # 캐시는 클라이언트별이므로 다른 DBFI는 다시 조회
+    get_balance_domestic(make_client())
+    assert _price_requests(server) == first * 2
@@ -0,0 +1,71 @@
+import sqlite3
+from datetime import datetime, timezone
+
+import pytest
+
+from pydbfi import TickerMaster
+from pydbfi import tickers
+from pydbfi.tickers import trading_date
+
+TICKER_ENDPOINTS = (
+    "/api/v1/quote/kr-stock/inquiry/stock-ticker",
+    "/api/v1/quote/overseas-stock/inquiry/stock-ticker",
+)
+
+
+def _ticker_requests(server):
+    requests = server.stats()["requests"]
+    return sum(requests.get(endpoint, 0) for endpoint in TICKER_ENDPOINTS)
+
+
+@pytest.mark.parametrize(
+    "region, now, expected",
+    [
+        ("domestic", datetime(2024, 1, 5, 1, tzinfo=timezone.utc), "20240105"),  # 금 10:00 KST
+        ("domestic", datetime(2024, 1, 6, 1, tzinfo=timezone.utc), "20240105"),  # 토
+        ("domestic", datetime(2024, 1, 7, 16, tzinfo=timezone.utc), "20240108"),  # 월 01:00 KST
+        ("overseas", datetime(2024, 1, 8, 1, tzinfo=timezone.utc), "20240105"),  # 일 20:00 뉴욕
+    ],
+)
+def test_trading_date_skips_weekends(region, now, expected):
+    assert trading_date(region, now=now) == expected
+
+
+def test_trading_date_skips_holidays():
+    now = datetime(2024, 1, 2, 1, tzinfo=timezone.utc)
+    assert trading_date("domestic", holidays=["20240101", "20240102"], now=now) == "20231229"
+
+
+def test_loads_once_per_trading_day(dbfi, server, tmp_path):
+    path = str(tmp_path / "tickers.sqlite3")
+    master = TickerMaster(dbfi, path=path)
+    downloaded = _ticker_requests(server)
+    assert downloaded > 0 and len(master) > 0
+    # 모의 서버는 시장 구분 없이 같은 종목을 반환
+    assert master.resolve_symbol("005930") in tickers.DOMESTIC_MARKETS
+    assert master.resolve_quote_market("AAPL") in ("FY", "FN", "FA")
+    assert "005930" in [record["code"] for record in master.search("삼성")]
+
+    # 같은 거래일에는 다시 받지 않고 저장된 종목으로 인덱스 구성
+    again = TickerMaster(dbfi, path=path)
+    assert _ticker_requests(server) == downloaded
+    assert len(again) == len(master)
+    assert again.stale_markets() == []
+
+
+def test_closes_every_connection(dbfi, tmp_path, monkeypatch):
+    opened = []
+    connect = sqlite3.connect
+
+    def tracking_connect(*args, **kwargs):
+        conn = connect(*args, **kwargs)
+        opened.append(conn)
+        return conn
+
+    monkeypatch.setattr(tickers.sqlite3, "connect", tracking_connect)
+    master = TickerMaster(dbfi, path=str(tmp_path / "tickers.sqlite3"))
+    master.stale_markets()
+    assert opened
+    for conn in opened:
+        with pytest.raises(sqlite3.ProgrammingError):
+            conn.execute("SELECT 1")
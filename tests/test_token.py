@@ -0,0 +1,78 @@
+import multiprocessing
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from pydbfi import FileTokenStore, MemoryTokenStore, TokenStore
+from pydbfi.mockserver import MockDBFIServer
+from pydbfi.oauth import OAuth
+
+
+def _issue_token(base_url, path, queue):
+    auth = OAuth(appkey="test", appsecretkey="test", token_store=FileTokenStore(path), base_url=base_url)
+    queue.put(auth.token)
+    auth.transport.close()
+
+
+def test_file_token_store_shares_one_token_across_processes(tmp_path):
+    path = str(tmp_path / "token.json")
+    with MockDBFIServer() as server:
+        context = multiprocessing.get_context("spawn")
+        queue = context.Queue()
+        workers = [context.Process(target=_issue_token, args=(server.url, path, queue)) for _ in range(4)]
+        for worker in workers:
+            worker.start()
+        tokens = {queue.get(timeout=30) for _ in workers}
+        for worker in workers:
+            worker.join(timeout=10)
+            assert worker.exitcode == 0
+        # 잠금을 먼저 얻은 프로세스만 발급하고 나머지는 저장된 토큰을 재사용
+        assert server.stats()["tokens_issued"] == 1
+    assert len(tokens) == 1
+    stored = FileTokenStore(path)._read()
+    assert [token["access_token"] for token in stored.values()] == list(tokens)
+
+
+def test_memory_token_store_shared_between_clients(make_client, server):
+    store = MemoryTokenStore()
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        clients = list(executor.map(lambda _: make_client(token_store=store), range(4)))
+    assert server.stats()["tokens_issued"] == 1
+    assert len({client.auth.token for client in clients}) == 1
+
+
+def test_expired_token_refreshed_once_for_concurrent_requests(make_client, server):
+    dbfi = make_client()
+    issued = server.stats()["tokens_issued"]
+    before = dbfi.auth.token
+    server.expire_tokens()
+
+    result = dbfi.get_stock_prices(region="domestic", codes=[f"{900000 + i:06d}" for i in range(16)], max_workers=8)
+
+    assert result["errors"] == {}
+    stats = server.stats()
+    # IGW00121로 거절된 요청들이 한 번의 재발급을 공유하고 즉시 재시도
+    assert stats["tokens_issued"] == issued + 1
+    assert stats["expired"] >= 1
+    assert dbfi.auth.token != before
+
+
+def test_rejected_token_in_store_is_not_reused(make_client, server):
+    store = MemoryTokenStore()
+    first, second = make_client(token_store=store), make_client(token_store=store)
+    server.expire_tokens()
+    first.get_stock_price(region="domestic", stock_code="005930")
+    # 다른 클라이언트는 저장소에 새로 저장된 토큰을 재사용
+    second.get_stock_price(region="domestic", stock_code="005930")
+    assert server.stats()["tokens_issued"] == 2
+    assert first.auth.token == second.auth.token
+
+
+def test_partial_token_store_subclass_fails_at_instantiation():
+    class LoadOnlyStore(TokenStore):
+        def load(self, key):
+            return None
+
+    # 잠금 없는 저장소가 발급 시점에야 실패하지 않도록 생성 시 거절
+    with pytest.raises(TypeError):
+        LoadOnlyStore()
@@ -0,0 +1,92 @@
+import time
+
+from pydbfi import MemoryTokenStore, TokenRefresher
+
+
+class FlakyTokenStore(MemoryTokenStore):
+    """fail이 True이면 발급 잠금 획득이 실패하는 저장소"""
+
+    fail = False
+
+    def acquire(self, blocking: bool = True) -> bool:
+        if self.fail:
+            raise RuntimeError("store unavailable")
+        return super().acquire(blocking)
+
+
+def _wait_until(predicate, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.02)
+    return False
+
+
+def test_refreshes_before_expiry(make_client, server):
+    server.token_ttl = 3
+    dbfi = make_client()
+    first, expire_in = dbfi.auth.token, dbfi.auth.expire_in
+    issued = server.stats()["tokens_issued"]
+    refresher = TokenRefresher(dbfi.auth, refresh_before=1.5, jitter=0, retry_interval=0.2).start()
+    try:
+        assert _wait_until(lambda: refresher.stats()["next_refresh_at"] is not None)
+        assert _wait_until(lambda: refresher.stats()["refreshes"] >= 1)
+    finally:
+        refresher.stop()
+    stats = refresher.stats()
+    # 만료 전에 새 토큰으로 교체
+    assert stats["last_refresh_at"] < expire_in
+    assert dbfi.auth.token != first and dbfi.auth.expire_in > expire_in
+    assert stats["failures"] == 0 and stats["last_error"] is None
+    assert stats["avg_duration"] > 0
+    assert server.stats()["tokens_issued"] == issued + stats["refreshes"]
+
+
+def test_failure_is_recorded_and_retried(make_client, server):
+    server.token_ttl = 3
+    store = FlakyTokenStore()
+    dbfi = make_client(token_store=store)
+    first = dbfi.auth.token
+    store.fail = True
+
+    refresher = TokenRefresher(dbfi.auth, refresh_before=3, jitter=0, retry_interval=0.1)
+    assert refresher.refresh_now() is False
+    stats = refresher.stats()
+    assert stats["failures"] == 1 and stats["refreshes"] == 0
+    assert "store unavailable" in stats["last_error"]
+    # 실패해도 기존 토큰은 유지
+    assert dbfi.auth.token == first
+
+    refresher.start()
+    try:
+        assert _wait_until(lambda: refresher.stats()["failures"] >= 3)
+        store.fail = False
+        assert _wait_until(lambda: refresher.stats()["refreshes"] >= 1)
+    finally:
+        refresher.stop()
+    stats = refresher.stats()
+    assert stats["last_error"] is None
+    assert dbfi.auth.token != first
+
+
+def test_stop_joins_thread(make_client):
+    dbfi = make_client()
+    refresher = TokenRefresher(dbfi.auth).start()
+    thread = refresher._thread
+    assert refresher.running and thread.is_alive()
+
+    started = time.monotonic()
+    refresher.stop()
+    # 다음 갱신까지 대기 중이어도 바로 종료
+    assert time.monotonic() - started < 1.0
+    assert not thread.is_alive() and not refresher.running
+    assert refresher.stats()["next_refresh_at"] is None
+
+
+def test_client_close_stops_refresher(make_client):
+    dbfi = make_client(auto_refresh_token=True)
+    thread = dbfi.token_refresher._thread
+    assert thread.is_alive()
+    dbfi.close()
+    assert not thread.is_alive()
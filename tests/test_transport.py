@@ -0,0 +1,39 @@
+import threading
+import time
+
+from pydbfi.mockserver import MockDBFIServer
+from pydbfi.transport import DEFAULT_TIMEOUT, HTTPTransport
+
+
+def test_default_timeout_is_finite():
+    transport = HTTPTransport()
+    assert transport.timeout == DEFAULT_TIMEOUT
+    transport.close()
+
+
+def test_idle_rebuild_waits_for_in_flight_requests():
+    with MockDBFIServer(latency=0.4) as server:
+        transport = HTTPTransport(idle_timeout=0.1)
+        url = server.url + "/oauth2/token"
+        results = {}
+
+        def slow_request():
+            results["slow"] = transport.post(url, data={"grant_type": "client_credentials"})
+
+        time.sleep(0.15)  # 유휴 시간 초과 상태에서 시작
+        slow = threading.Thread(target=slow_request)
+        slow.start()
+        time.sleep(0.05)
+        session = transport.session
+        time.sleep(0.15)
+        # 진행 중인 요청이 유휴 시간보다 오래 걸려도 세션을 교체하지 않음
+        results["second"] = transport.post(url, data={"grant_type": "client_credentials"})
+        slow.join()
+        assert transport.session is session
+        assert results["slow"].status_code == results["second"].status_code == 200
+
+        # 모든 요청이 끝난 뒤 유휴 시간이 지나면 풀 재생성
+        time.sleep(0.15)
+        transport.post(url, data={"grant_type": "client_credentials"})
+        assert transport.session is not session
+        transport.close()